@@ -107,10 +107,12 @@ class BaseAgent(ABC):
         self._shutdown_event = asyncio.Event()
         self._health_check_task: asyncio.Task | None = None
         self._run_task: asyncio.Task | None = None
+        self._signal_stop_task: asyncio.Task | None = None
 
-        # Event callbacks
-        self._on_state_change: list[Callable[[AgentState, AgentState], None]] = []
-        self._on_health_change: list[Callable[[HealthStatus], None]] = []
+        # Event callbacks; tuples are replaced on registration, so a callback
+        # that registers another one does not change the sequence being run
+        self._on_state_change: tuple[Callable[[AgentState, AgentState], None], ...] = ()
+        self._on_health_change: tuple[Callable[[HealthStatus], None], ...] = ()
 
         self.logger.info(
             "Agent initialized",
@@ -138,11 +140,11 @@ class BaseAgent(ABC):
 
     def on_state_change(self, callback: Callable[[AgentState, AgentState], None]) -> None:
         """Register a state change callback."""
-        self._on_state_change.append(callback)
+        self._on_state_change = (*self._on_state_change, callback)
 
     def on_health_change(self, callback: Callable[[HealthStatus], None]) -> None:
         """Register a health change callback."""
-        self._on_health_change.append(callback)
+        self._on_health_change = (*self._on_health_change, callback)
 
     async def start(self) -> None:
         """Start the agent."""
@@ -373,6 +375,11 @@ class BaseAgent(ABC):
 
     def _register_signal_handlers(self) -> None:
         """Register signal handlers for graceful shutdown."""
+        loop = asyncio.get_running_loop()
+
+        def schedule_stop() -> None:
+            # Keep a reference so the stop task is not garbage collected
+            self._signal_stop_task = asyncio.create_task(self.stop())
 
         def signal_handler(signum: int, frame: Any) -> None:
             self.logger.info(
@@ -380,7 +387,9 @@ class BaseAgent(ABC):
                 signal=signal.Signals(signum).name,
                 agent_name=self.config.name,
             )
-            asyncio.create_task(self.stop())
+            # Wakes the event loop immediately, even while it is blocked
+            # waiting for I/O or a timer
+            loop.call_soon_threadsafe(schedule_stop)
 
         # Register handlers for common shutdown signals
         for sig in (signal.SIGTERM, signal.SIGINT):
@@ -9,9 +9,79 @@ from pydantic import BaseModel, Field, ValidationError
 
 from entropy_playground.logging.logger import get_logger
 
+try:
+    import h2  # noqa: F401
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 logger = get_logger(__name__)
 
 
+class _SharedTransport:
+    """Connection pools shared by every ClaudeClient.
+
+    Connections are bound to the event loop that opened them, so one pool is
+    kept per loop. Clients take a reference on their loop's pool and release
+    it on close; the pool is closed once its last client has closed.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[asyncio.AbstractEventLoop, tuple[httpx.AsyncHTTPTransport, int]] = {}
+
+    def acquire(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncHTTPTransport:
+        """Return the pool for ``loop``, creating it on first use."""
+        pool, refs = self._pools.get(loop, (None, 0))
+        if pool is None:
+            # Retries are handled by ClaudeClient; HTTP/2 needs the h2 package
+            pool = httpx.AsyncHTTPTransport(http2=HAS_H2, retries=0)
+        self._pools[loop] = (pool, refs + 1)
+        return pool
+
+    async def release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Drop a reference to the pool for ``loop``, closing it after the last."""
+        pool, refs = self._pools[loop]
+        if refs > 1:
+            self._pools[loop] = (pool, refs - 1)
+            return
+        del self._pools[loop]
+        # Connections of a loop that has already finished cannot be closed
+        # from another one; they are discarded along with it
+        if loop is asyncio.get_running_loop():
+            await pool.aclose()
+
+
+class _ClientTransport(httpx.AsyncBaseTransport):
+    """A single client's handle on the shared per-loop connection pools."""
+
+    def __init__(self, shared: _SharedTransport) -> None:
+        self._shared = shared
+        self._pools: dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = self._shared.acquire(loop)
+        return await pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Release this client's pools, closing any no other client uses."""
+        pools, self._pools = self._pools, {}
+        for loop in pools:
+            await self._shared.release(loop)
+
+
+_SHARED_TRANSPORT = _SharedTransport()
+
+# Constant request headers, pre-encoded as httpx stores them
+_BASE_HEADERS = {
+    b"anthropic-version": b"2023-06-01",
+    b"content-type": b"application/json",
+}
+
+
 class ClaudeMessage(BaseModel):
     """Represents a message in a Claude conversation."""
 
@@ -91,21 +161,13 @@ class ClaudeClient:
         self.max_retries = max_retries or self.MAX_RETRIES
 
         # Track usage for rate limiting
-        self._usage_tracker = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "requests": 0,
-        }
+        self.reset_usage()
 
-        # HTTP client
+        # HTTP client; connections are pooled across all clients
         self._client = httpx.AsyncClient(
+            transport=_ClientTransport(_SHARED_TRANSPORT),
             base_url=self.base_url,
-            headers={
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
+            headers={**_BASE_HEADERS, b"x-api-key": self.api_key.encode()},
             timeout=self.timeout,
         )
 
@@ -146,22 +208,17 @@ class ClaudeClient:
         Raises:
             ClaudeError: If API request fails
         """
-        # Convert dict messages to ClaudeMessage objects
-        formatted_messages = []
-        for msg in messages:
-            if isinstance(msg, dict):
-                formatted_messages.append(ClaudeMessage(**msg))
-            else:
-                formatted_messages.append(msg)
-
-        # Create request
-        request = ClaudeRequest(
-            model=model,
-            messages=formatted_messages,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=system,
-            **kwargs,
+        # Create request; dict messages are validated into ClaudeMessage
+        # objects in the same pass as the request itself
+        request = ClaudeRequest.model_validate(
+            {
+                "model": model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "system": system,
+                **kwargs,
+            }
         )
 
         # Make request with retries
@@ -180,6 +237,10 @@ class ClaudeClient:
             ClaudeError: If all retry attempts fail
         """
         last_error = None
+        # Serialize once with pydantic's native JSON encoder; the payload is
+        # identical for every attempt and the content-type header is set on
+        # the HTTP client
+        payload = request.model_dump_json(exclude_none=True).encode()
 
         for attempt in range(self.max_retries):
             try:
@@ -187,10 +248,7 @@ class ClaudeClient:
                     f"Making Claude API request (attempt {attempt + 1}/{self.max_retries})"
                 )
 
-                response = await self._client.post(
-                    "/messages",
-                    json=request.model_dump(exclude_none=True),
-                )
+                response = await self._client.post("/messages", content=payload)
 
                 # Check response status
                 if response.status_code != 200:
@@ -261,13 +319,9 @@ class ClaudeClient:
         Args:
             usage: Usage data from API response
         """
-        input_tokens = usage.get("input_tokens", 0)
-        output_tokens = usage.get("output_tokens", 0)
-
-        self._usage_tracker["total_tokens"] += input_tokens + output_tokens
-        self._usage_tracker["prompt_tokens"] += input_tokens
-        self._usage_tracker["completion_tokens"] += output_tokens
-        self._usage_tracker["requests"] += 1
+        self._prompt_tokens += usage.get("input_tokens", 0)
+        self._completion_tokens += usage.get("output_tokens", 0)
+        self._requests += 1
 
     def get_usage(self) -> dict[str, int]:
         """Get current usage statistics.
@@ -275,16 +329,18 @@ class ClaudeClient:
         Returns:
             Dictionary with usage statistics
         """
-        return self._usage_tracker.copy()
+        return {
+            "total_tokens": self._prompt_tokens + self._completion_tokens,
+            "prompt_tokens": self._prompt_tokens,
+            "completion_tokens": self._completion_tokens,
+            "requests": self._requests,
+        }
 
     def reset_usage(self) -> None:
         """Reset usage tracking."""
-        self._usage_tracker = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "requests": 0,
-        }
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+        self._requests = 0
 
 
 class MockClaudeClient(ClaudeClient):
@@ -298,12 +354,7 @@ class MockClaudeClient(ClaudeClient):
         self.max_retries = kwargs.get("max_retries", self.MAX_RETRIES)
         self.api_key = "mock-api-key"
 
-        self._usage_tracker = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "requests": 0,
-        }
+        self.reset_usage()
 
         # Mock responses
         self._mock_responses: list[dict[str, Any]] = []
@@ -387,7 +438,8 @@ class MockClaudeClient(ClaudeClient):
                 },
             }
 
-        response = ClaudeResponse(**response_data)
+        # Mock payloads are built locally, so skip validation
+        response = ClaudeResponse.model_construct(**response_data)
         self._update_usage(response.usage)
 
         return response
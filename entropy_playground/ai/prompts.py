@@ -1,5 +1,6 @@
 """Prompt engineering framework for Claude interactions."""
 
+import functools
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any
@@ -40,29 +41,29 @@ class PromptTemplate(BaseModel):
             Formatted prompts
         """
         formatted_system = self.system_prompt.format(**kwargs)
-        formatted_task = self.task_prompt.format(**kwargs)
+        # Collect the task sections and join them once at the end
+        parts = [self.task_prompt.format(**kwargs)]
 
         # Add output format if specified
         if self.output_format:
-            formatted_task += f"\n\nOutput Format:\n{self.output_format}"
+            parts.append(f"\n\nOutput Format:\n{self.output_format}")
 
         # Add examples if provided
         if self.examples:
-            examples_text = "\n\nExamples:"
+            parts.append("\n\nExamples:")
             for i, example in enumerate(self.examples, 1):
-                examples_text += f"\n\nExample {i}:"
+                parts.append(f"\n\nExample {i}:")
                 if "input" in example:
-                    examples_text += f"\nInput: {example['input']}"
+                    parts.append(f"\nInput: {example['input']}")
                 if "output" in example:
-                    examples_text += f"\nOutput: {example['output']}"
-            formatted_task += examples_text
+                    parts.append(f"\nOutput: {example['output']}")
 
         # Add constraints if specified
         if self.constraints:
-            constraints_text = "\n\nConstraints:"
-            for constraint in self.constraints:
-                constraints_text += f"\n- {constraint}"
-            formatted_task += constraints_text
+            parts.append("\n\nConstraints:")
+            parts.extend(f"\n- {constraint}" for constraint in self.constraints)
+
+        formatted_task = "".join(parts)
 
         return {
             "system": formatted_system,
@@ -91,6 +92,12 @@ class IssueReaderPromptStrategy(BasePromptStrategy):
 
     def generate_prompt(self, context: dict[str, Any]) -> PromptTemplate:
         """Generate prompt for reading and analyzing GitHub issues."""
+        return self._template().model_copy(deep=True)
+
+    @staticmethod
+    @functools.cache
+    def _template() -> PromptTemplate:
+        """Build the template once; callers get copies of it."""
         return PromptTemplate(
             role=AgentRole.ISSUE_READER,
             system_prompt=(
@@ -145,6 +152,12 @@ class CoderPromptStrategy(BasePromptStrategy):
 
     def generate_prompt(self, context: dict[str, Any]) -> PromptTemplate:
         """Generate prompt for code implementation tasks."""
+        return self._template().model_copy(deep=True)
+
+    @staticmethod
+    @functools.cache
+    def _template() -> PromptTemplate:
+        """Build the template once; callers get copies of it."""
         return PromptTemplate(
             role=AgentRole.CODER,
             system_prompt=(
@@ -204,6 +217,12 @@ class ReviewerPromptStrategy(BasePromptStrategy):
 
     def generate_prompt(self, context: dict[str, Any]) -> PromptTemplate:
         """Generate prompt for code review tasks."""
+        return self._template().model_copy(deep=True)
+
+    @staticmethod
+    @functools.cache
+    def _template() -> PromptTemplate:
+        """Build the template once; callers get copies of it."""
         return PromptTemplate(
             role=AgentRole.REVIEWER,
             system_prompt=(
@@ -256,7 +275,7 @@ class PromptEngineer:
 
     def __init__(self) -> None:
         """Initialize prompt engineer with strategies."""
-        self._strategies = {
+        self._strategies: dict[AgentRole, BasePromptStrategy] = {
             AgentRole.ISSUE_READER: IssueReaderPromptStrategy(),
             AgentRole.CODER: CoderPromptStrategy(),
             AgentRole.REVIEWER: ReviewerPromptStrategy(),
@@ -275,10 +294,10 @@ class PromptEngineer:
         Raises:
             ValueError: If role is not supported
         """
-        if role not in self._strategies:
+        strategy = self._strategies.get(role)
+        if strategy is None:
             raise ValueError(f"Unsupported role: {role}")
 
-        strategy = self._strategies[role]
         template = strategy.generate_prompt(context)
 
         logger.debug(f"Generated prompt template for role: {role}")
@@ -312,24 +331,12 @@ def create_conversation(
         List of messages in Claude format
     """
     # Claude expects alternating user/assistant messages
-    conversation = []
-
-    # Add conversation history
-    for msg in messages:
-        conversation.append(
-            {
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", ""),
-            }
-        )
+    conversation = [
+        {"role": msg.get("role", "user"), "content": msg.get("content", "")} for msg in messages
+    ]
 
     # Add task prompt if provided
     if task_prompt:
-        conversation.append(
-            {
-                "role": "user",
-                "content": task_prompt,
-            }
-        )
+        conversation.append({"role": "user", "content": task_prompt})
 
     return conversation
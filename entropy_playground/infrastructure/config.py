@@ -1,11 +1,31 @@
 """Configuration management for Entropy-Playground."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, reusing the result while the file is unchanged.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is parsed again. Callers must not mutate the returned data.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 class GitHubConfig(BaseModel):
@@ -55,6 +75,11 @@ class Config(BaseModel):
         "use_enum_values": True,
     }
 
+    @field_serializer("workspace", when_used="json")
+    def _serialize_workspace(self, workspace: Path) -> str:
+        # Use as_posix() to ensure consistent forward slashes across platforms
+        return workspace.as_posix()
+
     @classmethod
     def from_file(cls, config_path: Path) -> "Config":
         """Load configuration from YAML file.
@@ -69,13 +94,29 @@ class Config(BaseModel):
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+        data = _load_yaml_file(str(config_path), stat.st_mtime_ns, stat.st_size)
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_stream(cls, stream: IO[str]) -> "Config":
+        """Load configuration from a YAML text stream.
+
+        Args:
+            stream: Readable text stream, e.g. an open file or io.StringIO
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        Returns:
+            Config instance
 
-        return cls(**data)
+        Raises:
+            yaml.YAMLError: If the YAML is invalid
+        """
+        data = yaml.load(stream, Loader=_YamlLoader)
+        return cls.model_validate(data)
 
     @classmethod
     def from_env(cls) -> "Config":
@@ -105,13 +146,19 @@ class Config(BaseModel):
         """
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict and handle Path objects
-        data = self.model_dump()
-        # Use as_posix() to ensure consistent forward slashes across platforms
-        data["workspace"] = self.workspace.as_posix()
-
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            self.save_to_stream(f)
+
+    def save_to_stream(self, stream: IO[str]) -> None:
+        """Write configuration as YAML to a text stream.
+
+        Args:
+            stream: Writable text stream, e.g. an open file or io.StringIO
+        """
+        # JSON mode yields plain str/int/bool values, including the workspace
+        data = self.model_dump(mode="json")
+
+        yaml.dump(data, stream, Dumper=_YamlDumper, default_flow_style=False)
 
     def validate_github_token(self) -> bool:
         """Validate GitHub token is set.
@@ -1,14 +1,54 @@
 """Log aggregation and search capabilities."""
 
 import json
-from collections import defaultdict
+import logging
+import os
+import re
+from collections import Counter, defaultdict
 from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
-from entropy_playground.logging.logger import get_logger
+from entropy_playground.logging.logger import get_logger, setup_logging
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+
+    def _dumps(value: Any) -> str:
+        """Serialize a value to compact JSON with orjson."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _loads: Callable[[str | bytes], Any] = orjson.loads
+else:
+
+    def _dumps(value: Any) -> str:
+        """Serialize a value to JSON with the standard library."""
+        return json.dumps(value)
+
+    _loads = json.loads
+
+# Entry counts keyed by (level, component, agent_id)
+_SummaryCounts = Counter[tuple[str, str, str | None]]
+
+# posix_fadvise is unavailable on macOS and Windows
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# "level" values as written by json.dumps or orjson, at any nesting depth
+_LEVEL_PATTERN = re.compile(rb'"level":\s*"([^"\\]*)"')
+
+# Bytes read per call when scanning files for _LEVEL_PATTERN
+_SCAN_CHUNK_SIZE = 1 << 20
 
 
 @dataclass
@@ -25,6 +65,44 @@ class LogQuery:
     limit: int = 1000
     offset: int = 0
 
+    def prefilter(self) -> re.Pattern[bytes] | None:
+        """Build a pattern that rejects raw log lines which cannot match.
+
+        Each filter contributes a literal the line must contain, checked in a
+        single regex match before the line is parsed. Values that JSON may
+        escape, or that match the defaults used for missing fields, are left
+        to the exact check after parsing.
+
+        Returns:
+            Compiled pattern for ``match()``, or None if no filter applies
+        """
+        # (value, case-insensitive); text logs may use lowercase levels
+        terms: list[tuple[str, bool]] = []
+        if self.level and self.level.upper() != "INFO":
+            terms.append((self.level, True))
+        if self.component and self.component not in "unknown":
+            terms.append((self.component, False))
+        if self.agent_id:
+            terms.append((self.agent_id, False))
+        if self.message_contains:
+            terms.append((self.message_contains, True))
+
+        lookaheads = [
+            (
+                b"(?=.*?(?i:%s))" % re.escape(value.encode())
+                if ignore_case
+                else b"(?=.*?%s)" % re.escape(value.encode())
+            )
+            for value, ignore_case in terms
+            if _is_plain_json(value)
+        ]
+        return re.compile(b"".join(lookaheads), re.DOTALL) if lookaheads else None
+
+
+def _is_plain_json(value: str) -> bool:
+    """Check whether a string appears verbatim inside a JSON string literal."""
+    return value.isascii() and value.isprintable() and '"' not in value and "\\" not in value
+
 
 @dataclass
 class LogEntry:
@@ -41,14 +119,15 @@ class LogEntry:
     raw: str | None = None
 
     @classmethod
-    def from_json(cls, data: dict[str, Any]) -> "LogEntry":
-        """Create LogEntry from JSON data."""
-        # Parse timestamp
-        timestamp_str = data.get("timestamp", "")
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            timestamp = datetime.utcnow()
+    def from_json(cls, data: dict[str, Any], timestamp: datetime | None = None) -> "LogEntry":
+        """Create LogEntry from JSON data.
+
+        Args:
+            data: Parsed JSON log record
+            timestamp: The record's timestamp if it has already been parsed
+        """
+        if timestamp is None:
+            timestamp = _parse_timestamp(data.get("timestamp", ""))
 
         # Extract agent info
         agent_info = data.get("agent", {})
@@ -66,21 +145,32 @@ class LogEntry:
                 for k, v in data.items()
                 if k not in ["timestamp", "level", "logger_name", "event", "message", "agent"]
             },
-            raw=json.dumps(data),
+            raw=_dumps(data),
         )
 
 
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp, using the current time if it is invalid."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return datetime.utcnow()
+
+
 class LogAggregator:
     """Aggregates and searches logs from multiple sources."""
 
-    def __init__(self, log_dirs: list[Path] | None = None) -> None:
+    def __init__(self, log_dirs: list[Path] | None = None, max_workers: int = 1) -> None:
         """Initialize log aggregator.
 
         Args:
             log_dirs: List of directories to search for logs
+            max_workers: Processes used to scan files for the ``aggregate_by_*``
+                methods; 1 scans them in this process
         """
         self.logger = get_logger(__name__)
         self.log_dirs = log_dirs or [Path("./logs")]
+        self.max_workers = max_workers
 
         # Ensure all directories exist
         for log_dir in self.log_dirs:
@@ -104,7 +194,8 @@ class LogAggregator:
             query.end_time = datetime.utcnow()
 
         # Search through all log files
-        for log_entry in self._iterate_logs(query.start_time, query.end_time):
+        prefilter = query.prefilter()
+        for log_entry in self._iterate_logs(query.start_time, query.end_time, prefilter):
             # Apply filters
             if not self._matches_query(log_entry, query):
                 continue
@@ -126,57 +217,151 @@ class LogAggregator:
         self,
         start_time: datetime,
         end_time: datetime,
+        prefilter: re.Pattern[bytes] | None = None,
     ) -> Iterator[LogEntry]:
         """Iterate through log entries in time range.
 
         Args:
             start_time: Start of time range
             end_time: End of time range
+            prefilter: Skip raw lines this pattern does not match before
+                parsing them
 
         Yields:
             Log entries
         """
-        # Find all log files in the time range
+        for record in self._iterate_records(start_time, end_time, prefilter):
+            if isinstance(record, LogEntry):
+                yield record
+                continue
+            timestamp, data = record
+            try:
+                yield LogEntry.from_json(data, timestamp)
+            except (AttributeError, TypeError) as e:
+                self.logger.warning(f"Skipping malformed log record: {e}")
+
+    def _summarize(self, start_time: datetime, end_time: datetime) -> _SummaryCounts:
+        """Count entries in time range by (level, component, agent_id).
+
+        With ``max_workers`` above 1, files are scanned in parallel worker
+        processes and their counts merged.
+        """
+        log_files = list(self._log_files(start_time))
+        counts: _SummaryCounts = Counter()
+        if self.max_workers > 1 and len(log_files) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(log_files)), initializer=_init_worker
+            ) as executor:
+                for file_counts in executor.map(
+                    _summarize_in_worker, log_files, repeat(start_time), repeat(end_time)
+                ):
+                    counts.update(file_counts)
+        else:
+            for log_file in log_files:
+                counts.update(self._summarize_file(log_file, start_time, end_time))
+        return counts
+
+    def _summarize_file(
+        self,
+        log_file: Path,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> _SummaryCounts:
+        """Count one file's entries in time range by (level, component, agent_id).
+
+        Aggregations only need these fields, so JSON records are read
+        directly instead of being turned into ``LogEntry`` objects.
+        """
+        return Counter(
+            map(_summary_key, self._iterate_file_records(log_file, start_time, end_time))
+        )
+
+    def _iterate_records(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        prefilter: re.Pattern[bytes] | None = None,
+    ) -> Iterator[LogEntry | tuple[datetime, dict[str, Any]]]:
+        """Iterate through raw log records in time range.
+
+        Yields:
+            ``(timestamp, data)`` for JSON lines and parsed entries for
+            text lines
+        """
+        for log_file in self._log_files(start_time):
+            yield from self._iterate_file_records(log_file, start_time, end_time, prefilter)
+
+    def _iterate_file_records(
+        self,
+        log_file: Path,
+        start_time: datetime,
+        end_time: datetime,
+        prefilter: re.Pattern[bytes] | None = None,
+    ) -> Iterator[LogEntry | tuple[datetime, dict[str, Any]]]:
+        """Iterate through the raw records of one log file in time range."""
+        # Read and parse log file
+        try:
+            with open(log_file, "rb") as f:
+                if HAS_FADVISE:
+                    # Files are read front to back; let the kernel read ahead
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if prefilter is not None and not prefilter.match(line):
+                        continue
+
+                    try:
+                        # Try to parse as JSON
+                        data = _loads(line)
+                        timestamp = _parse_timestamp(data.get("timestamp", ""))
+
+                        # Check time range
+                        if timestamp < start_time:
+                            continue
+                        if timestamp > end_time:
+                            break
+
+                        yield timestamp, data
+
+                    except json.JSONDecodeError:
+                        # Handle non-JSON log lines
+                        # Try to extract basic info
+                        parsed_entry = self._parse_text_log(line.decode("utf-8"))
+                        if parsed_entry and start_time <= parsed_entry.timestamp <= end_time:
+                            yield parsed_entry
+
+        except Exception as e:
+            self.logger.warning(f"Error reading log file {log_file}: {e}")
+
+    def _log_files(self, start_time: datetime) -> Iterator[Path]:
+        """Yield log files that may hold entries newer than start_time.
+
+        Files are skipped based on their modification time.
+        """
         for log_dir in self.log_dirs:
-            for log_file in sorted(log_dir.glob("*.log*")):
-                # Skip files outside the time range based on modification time
-                file_mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                if file_mtime < start_time:
-                    continue
+            # scandir gives names and file types without a Path per entry;
+            # matches the "*.log*" glob, which skips hidden files
+            try:
+                with os.scandir(log_dir) as dir_entries:
+                    log_files = sorted(
+                        (
+                            entry
+                            for entry in dir_entries
+                            if ".log" in entry.name
+                            and not entry.name.startswith(".")
+                            and entry.is_file()
+                        ),
+                        key=lambda entry: entry.name,
+                    )
+            except FileNotFoundError:
+                continue
 
-                # Read and parse log file
-                try:
-                    with open(log_file, encoding="utf-8") as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-
-                            try:
-                                # Try to parse as JSON
-                                data = json.loads(line)
-                                entry = LogEntry.from_json(data)
-
-                                # Check time range
-                                if entry.timestamp < start_time:
-                                    continue
-                                if entry.timestamp > end_time:
-                                    break
-
-                                yield entry
-
-                            except json.JSONDecodeError:
-                                # Handle non-JSON log lines
-                                # Try to extract basic info
-                                parsed_entry = self._parse_text_log(line)
-                                if (
-                                    parsed_entry
-                                    and start_time <= parsed_entry.timestamp <= end_time
-                                ):
-                                    yield parsed_entry
-
-                except Exception as e:
-                    self.logger.warning(f"Error reading log file {log_file}: {e}")
+            for entry in log_files:
+                file_mtime = datetime.fromtimestamp(entry.stat().st_mtime)
+                if file_mtime >= start_time:
+                    yield Path(entry.path)
 
     def _parse_text_log(self, line: str) -> LogEntry | None:
         """Parse a text log line.
@@ -267,14 +452,53 @@ class LogAggregator:
         counts: dict[str, int] = defaultdict(int)
 
         query = LogQuery(start_time=start_time, end_time=end_time)
-        for entry in self._iterate_logs(
+        summary = self._summarize(
             query.start_time or datetime.utcnow() - timedelta(hours=24),
             query.end_time or datetime.utcnow(),
-        ):
-            counts[entry.level] += 1
+        )
+        for (level, _, _), count in summary.items():
+            counts[level] += count
 
         return dict(counts)
 
+    def aggregate_by_level_fast(self, start_time: datetime | None = None) -> dict[str, int]:
+        """Approximate log counts by level without parsing each entry.
+
+        The counts are approximate: they come from a regex match on the raw
+        bytes, which counts every ``"level": "..."`` in the files, including
+        ones nested inside a record. The result only matches
+        ``aggregate_by_level()`` for JSON-per-line logs with one ``level`` key
+        per record. Files are selected by modification time alone: entries are
+        not filtered by their own timestamps, and text log lines are not
+        counted. Files are read in fixed-size chunks, so memory use does not
+        grow with file size.
+
+        Args:
+            start_time: Skip files last modified before this time
+
+        Returns:
+            Dictionary of level -> count
+        """
+        counts: Counter[bytes] = Counter()
+        for log_file in self._log_files(start_time or datetime.utcnow() - timedelta(hours=24)):
+            try:
+                with open(log_file, "rb") as f:
+                    if HAS_FADVISE:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    partial = b""
+                    while chunk := f.read(_SCAN_CHUNK_SIZE):
+                        # Scan complete lines only; the partial last line is
+                        # carried over so no match is split between chunks
+                        data = partial + chunk
+                        end = data.rfind(b"\n") + 1
+                        counts.update(_LEVEL_PATTERN.findall(data, 0, end))
+                        partial = data[end:]
+                    counts.update(_LEVEL_PATTERN.findall(partial))
+            except OSError as e:
+                self.logger.warning(f"Error reading log file {log_file}: {e}")
+
+        return {level.decode(): count for level, count in counts.items()}
+
     def aggregate_by_component(
         self,
         start_time: datetime | None = None,
@@ -292,11 +516,12 @@ class LogAggregator:
         counts: dict[str, int] = defaultdict(int)
 
         query = LogQuery(start_time=start_time, end_time=end_time)
-        for entry in self._iterate_logs(
+        summary = self._summarize(
             query.start_time or datetime.utcnow() - timedelta(hours=24),
             query.end_time or datetime.utcnow(),
-        ):
-            counts[entry.component] += 1
+        )
+        for (_, component, _), count in summary.items():
+            counts[component] += count
 
         return dict(counts)
 
@@ -317,12 +542,13 @@ class LogAggregator:
         agent_stats: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
 
         query = LogQuery(start_time=start_time, end_time=end_time)
-        for entry in self._iterate_logs(
+        summary = self._summarize(
             query.start_time or datetime.utcnow() - timedelta(hours=24),
             query.end_time or datetime.utcnow(),
-        ):
-            if entry.agent_id:
-                agent_stats[entry.agent_id][entry.level] += 1
+        )
+        for (level, _, agent_id), count in summary.items():
+            if agent_id:
+                agent_stats[agent_id][level] += count
 
         return {k: dict(v) for k, v in agent_stats.items()}
 
@@ -400,6 +626,43 @@ class LogAggregator:
             last_check = current_time
 
 
+def _summary_key(record: LogEntry | tuple[datetime, dict[str, Any]]) -> tuple[str, str, str | None]:
+    """Return (level, component, agent_id) for a raw log record."""
+    if isinstance(record, LogEntry):
+        return record.level, record.component, record.agent_id
+    data = record[1]
+    agent_info = data.get("agent")
+    return (
+        data.get("level", "INFO"),
+        data.get("logger_name", "unknown"),
+        agent_info.get("id") if isinstance(agent_info, dict) else None,
+    )
+
+
+def _init_worker() -> None:
+    """Reset logging in a ``ProcessPoolExecutor`` worker to console output.
+
+    Forked workers inherit the parent's handlers but not the thread that
+    writes the background file handler's queue, so records sent there would
+    be lost. The handlers are dropped without closing them, since closing
+    would flush the parent's buffered output a second time. Spawned workers
+    would otherwise run the full logging setup, file handler included.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    setup_logging(logging.getLevelName(root.level), enable_file_logging=False)
+
+
+def _summarize_in_worker(
+    log_file: Path,
+    start_time: datetime,
+    end_time: datetime,
+) -> _SummaryCounts:
+    """Summarize one log file; runs in a ``ProcessPoolExecutor`` worker."""
+    return LogAggregator([log_file.parent])._summarize_file(log_file, start_time, end_time)
+
+
 # Convenience functions
 def search_logs(
     message_contains: str | None = None,
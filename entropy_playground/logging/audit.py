@@ -1,16 +1,35 @@
 """Audit trail functionality for tracking agent actions and system events."""
 
+import atexit
+import errno
 import json
-from datetime import datetime, timedelta
+import mmap
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from entropy_playground.logging.logger import get_logger
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_loads: Callable[[str | bytes], Any] = orjson.loads if HAS_ORJSON else json.loads
+
 
 class AuditEventType(str, Enum):
     """Types of audit events."""
@@ -62,6 +81,187 @@ class AuditEvent(BaseModel):
     model_config = ConfigDict()
 
 
+# O_DIRECT requires block-aligned buffers, offsets and sizes
+DIRECT_IO_BLOCK_SIZE = 4096
+DIRECT_IO_BUFFER_SIZE = 1 << 20
+
+# Buffered (non-O_DIRECT) writes are batched until either limit is reached
+AUDIT_BUFFER_SIZE = 128 * 1024
+AUDIT_FLUSH_INTERVAL = 1.0
+
+_pydantic_to_json = AuditEvent.__pydantic_serializer__.to_json
+
+if HAS_ORJSON:
+
+    def _serialize_event(event: AuditEvent) -> bytes:
+        """Serialize an audit event to JSON bytes.
+
+        orjson encodes the field values, including the event type enum,
+        about twice as fast as pydantic's serializer. Metadata values that
+        orjson does not support fall back to pydantic.
+        """
+        try:
+            return orjson.dumps(event.__dict__)
+        except TypeError:
+            return _pydantic_to_json(event)
+
+else:
+
+    def _serialize_event(event: AuditEvent) -> bytes:
+        """Serialize an audit event to JSON bytes."""
+        return _pydantic_to_json(event)
+
+
+# Number of audit files whose parsed events are kept for search_events()
+AUDIT_INDEX_CACHE_FILES = 7
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class _DirectIOWriter:
+    """Append-only audit file writer that bypasses the page cache.
+
+    Serialized events are accumulated in a page-aligned anonymous mmap and
+    written with ``O_DIRECT`` in whole blocks. On flush the tail is padded
+    with spaces (valid JSONL whitespace) up to the next block boundary.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fd = os.open(
+            path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_DIRECT,
+            0o644,
+        )
+        self._buffer = mmap.mmap(-1, DIRECT_IO_BUFFER_SIZE)
+        self._length = 0
+        # Part of a write that did not fit in the buffer when O_DIRECT failed
+        self._unbuffered = b""
+
+    def write(self, data: bytes) -> None:
+        """Buffer data, writing out any complete blocks.
+
+        Raises:
+            OSError: If a block write fails. Data not yet written, including
+                the part of ``data`` that did not fit in the buffer, is kept
+                for ``detach()``.
+        """
+        view = memoryview(data)
+        while view:
+            chunk = view[: DIRECT_IO_BUFFER_SIZE - self._length]
+            self._buffer[self._length : self._length + len(chunk)] = chunk
+            self._length += len(chunk)
+            view = view[len(chunk) :]
+            try:
+                self._write_blocks(self._length - self._length % DIRECT_IO_BLOCK_SIZE)
+            except OSError:
+                self._unbuffered = bytes(view)
+                raise
+
+    def flush(self) -> None:
+        """Pad the buffered tail to a block boundary and write it out."""
+        if not self._length:
+            return
+        padding = -self._length % DIRECT_IO_BLOCK_SIZE
+        self._buffer[self._length : self._length + padding] = b" " * padding
+        self._length += padding
+        self._write_blocks(self._length)
+
+    def detach(self) -> bytes:
+        """Close the file and return any data that was not written."""
+        pending = self._buffer[: self._length] + self._unbuffered
+        self._length = 0
+        self._unbuffered = b""
+        self.close()
+        return pending
+
+    def close(self) -> None:
+        """Flush buffered data and release the file and buffer."""
+        if self._fd < 0:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = -1
+            self._buffer.close()
+
+    def _write_blocks(self, size: int) -> None:
+        if not size:
+            return
+        # Release the exported view even if the write fails, so the mmap can close
+        with memoryview(self._buffer)[:size] as block:
+            os.write(self._fd, block)
+        remainder = self._length - size
+        if remainder:
+            self._buffer.move(0, size, remainder)
+        self._length = remainder
+
+
+class _AuditFileIndex:
+    """Parsed events of one audit file with posting lists for common filters.
+
+    Posting lists hold row numbers into ``events`` in file order. ``offset``
+    is how far the file has been read, so later searches only parse the
+    lines appended since.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0
+        self.events: list[AuditEvent] = []
+        self.by_event_type: defaultdict[str, list[int]] = defaultdict(list)
+        self.by_actor_id: defaultdict[str, list[int]] = defaultdict(list)
+        self.by_outcome: defaultdict[str, list[int]] = defaultdict(list)
+
+    def add(self, event: AuditEvent) -> None:
+        row = len(self.events)
+        self.events.append(event)
+        self.by_event_type[event.event_type].append(row)
+        self.by_actor_id[event.actor_id].append(row)
+        self.by_outcome[event.outcome].append(row)
+
+    def search(
+        self,
+        event_type: str | None,
+        actor_id: str | None,
+        resource_id: str | None,
+        outcome: str | None,
+    ) -> list[AuditEvent]:
+        """Return matching events, starting from the shortest posting list.
+
+        The indexed events are shared by every search, so callers get deep
+        copies they are free to modify.
+        """
+        postings = [
+            index.get(key, [])
+            for index, key in (
+                (self.by_event_type, event_type),
+                (self.by_actor_id, actor_id),
+                (self.by_outcome, outcome),
+            )
+            if key
+        ]
+        rows: Sequence[int] = range(len(self.events))
+        for posting in postings:
+            if len(posting) < len(rows):
+                rows = posting
+
+        matches = []
+        for row in rows:
+            event = self.events[row]
+            if event_type and event.event_type != event_type:
+                continue
+            if actor_id and event.actor_id != actor_id:
+                continue
+            if resource_id and event.resource_id != resource_id:
+                continue
+            if outcome and event.outcome != outcome:
+                continue
+            matches.append(event.model_copy(deep=True))
+        return matches
+
+
 class AuditLogger:
     """Handles audit logging for the system."""
 
@@ -69,25 +269,58 @@ class AuditLogger:
         self,
         log_dir: Path | None = None,
         enable_file_logging: bool = True,
+        direct_io: bool = False,
+        buffer_size: int = AUDIT_BUFFER_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
     ) -> None:
         """Initialize audit logger.
 
         Args:
             log_dir: Directory for audit logs
             enable_file_logging: Whether to write audit logs to files
+            direct_io: Write audit files with O_DIRECT where supported. Events
+                are buffered until a full block is available or ``flush()``
+                is called. Each flush, including the one done by
+                ``search_events()``, pads the file with up to 4095 spaces to
+                the next block boundary.
+            buffer_size: Bytes of events to batch before writing them out;
+                0 writes every event immediately
+            flush_interval: Maximum seconds an event may wait in the buffer
+                before a background timer writes it out
         """
         self.logger = get_logger(__name__)
         self.enable_file_logging = enable_file_logging
+        self.direct_io = direct_io and hasattr(os, "O_DIRECT")
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._direct_writer: _DirectIOWriter | None = None
+        self._buffer = bytearray()
+        self._file: BinaryIO | None = None
+        # Guards the buffer and open files against the flush timer thread
+        self._lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._indexes: dict[Path, _AuditFileIndex] = {}
+        self._cached_epoch_day = -1
+        self._cached_log_file: Path | None = None
 
         if self.enable_file_logging:
             self.log_dir = log_dir or Path("./logs/audit")
             self.log_dir.mkdir(parents=True, exist_ok=True)
             self.current_log_file = self._get_log_file_path()
+            _open_loggers.add(self)
 
     def _get_log_file_path(self) -> Path:
-        """Get the current audit log file path."""
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
-        return self.log_dir / f"audit-{date_str}.jsonl"
+        """Get the current audit log file path.
+
+        The path is cached for the current UTC day so the per-event cost is a
+        single integer comparison.
+        """
+        epoch_day = int(time.time() // _SECONDS_PER_DAY)
+        if epoch_day != self._cached_epoch_day or self._cached_log_file is None:
+            date_str = (_EPOCH_DATE + timedelta(days=epoch_day)).strftime("%Y-%m-%d")
+            self._cached_log_file = self.log_dir / f"audit-{date_str}.jsonl"
+            self._cached_epoch_day = epoch_day
+        return self._cached_log_file
 
     def log_event(self, event: AuditEvent) -> None:
         """Log an audit event.
@@ -116,14 +349,103 @@ class AuditLogger:
 
     def _write_to_file(self, event: AuditEvent) -> None:
         """Write event to audit log file."""
-        # Check if we need to rotate to a new file
-        current_file = self._get_log_file_path()
-        if current_file != self.current_log_file:
-            self.current_log_file = current_file
+        line = _serialize_event(event) + b"\n"
+
+        with self._lock:
+            # Check if we need to rotate to a new file
+            current_file = self._get_log_file_path()
+            if current_file != self.current_log_file:
+                self._close_files()
+                self.current_log_file = current_file
+
+            if self.direct_io and self._write_direct(line):
+                return
+
+            # Append event as JSON line, reusing the buffer between batches
+            self._buffer += line
+            if len(self._buffer) >= self.buffer_size:
+                self._flush_buffer()
+            elif self._flush_timer is None:
+                # Bound how long this batch can wait if no more events arrive
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self) -> None:
+        """Write batched events once flush_interval has passed."""
+        with self._lock:
+            self._flush_timer = None
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        """Write batched events to the current audit file."""
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = open(self.current_log_file, "ab")
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
+
+    def _write_direct(self, data: bytes) -> bool:
+        """Write data through the O_DIRECT writer.
 
-        # Append event as JSON line
-        with open(self.current_log_file, "a", encoding="utf-8") as f:
-            f.write(event.model_dump_json() + "\n")
+        Returns:
+            False if the filesystem rejected O_DIRECT and the caller should
+            fall back to a regular buffered write
+        """
+        try:
+            if self._direct_writer is None:
+                self._direct_writer = _DirectIOWriter(self.current_log_file)
+            self._direct_writer.write(data)
+            return True
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+            self.logger.warning(
+                "O_DIRECT not supported for audit log, falling back to buffered writes",
+                path=str(self.current_log_file),
+                error=str(e),
+            )
+            self.direct_io = False
+            # The writer hands back this event along with anything else
+            # that has not reached the disk yet
+            if self._direct_writer is not None:
+                data = self._direct_writer.detach()
+                self._direct_writer = None
+            with open(self.current_log_file, "ab") as f:
+                f.write(data)
+            return True
+
+    def _close_files(self) -> None:
+        """Flush buffered events and close the writers for the current file."""
+        self._flush_buffer()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._direct_writer is not None:
+            self._direct_writer.close()
+            self._direct_writer = None
+
+    def flush(self) -> None:
+        """Write any buffered events to disk."""
+        with self._lock:
+            self._flush_buffer()
+            if self._direct_writer is not None:
+                self._direct_writer.flush()
+
+    def close(self) -> None:
+        """Flush buffered events and close open audit files."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._close_files()
+
+    def __del__(self) -> None:
+        # Buffered events would otherwise be lost when the logger is dropped
+        if hasattr(self, "_lock"):
+            self.close()
 
     def log_agent_start(
         self,
@@ -132,6 +454,8 @@ class AuditLogger:
         metadata: dict[str, Any] | None = None,
     ) -> None:
         """Log agent startup."""
+        # Validated construction is cheaper than model_construct here, which
+        # inspects each default factory's signature on every call
         event = AuditEvent(
             event_type=AuditEventType.AGENT_STARTED,
             actor_id=agent_id,
@@ -230,6 +554,9 @@ class AuditLogger:
         """
         events: list[AuditEvent] = []
 
+        # Make sure buffered writes are visible to the reader
+        self.flush()
+
         # Default date range if not specified
         if not start_date:
             start_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -241,29 +568,8 @@ class AuditLogger:
         while current_date <= end_date:
             file_path = self.log_dir / f"audit-{current_date.strftime('%Y-%m-%d')}.jsonl"
             if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    for line in f:
-                        try:
-                            event_data = json.loads(line.strip())
-                            event = AuditEvent(**event_data)
-
-                            # Apply filters
-                            if event_type and event.event_type != event_type:
-                                continue
-                            if actor_id and event.actor_id != actor_id:
-                                continue
-                            if resource_id and event.resource_id != resource_id:
-                                continue
-                            if outcome and event.outcome != outcome:
-                                continue
-
-                            events.append(event)
-                        except (json.JSONDecodeError, ValueError) as e:
-                            self.logger.warning(
-                                "Failed to parse audit event",
-                                error=str(e),
-                                line=line,
-                            )
+                index = self._update_index(file_path)
+                events.extend(index.search(event_type, actor_id, resource_id, outcome))
 
             # Move to next day
             current_date = current_date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -271,6 +577,50 @@ class AuditLogger:
 
         return events
 
+    def _update_index(self, file_path: Path) -> _AuditFileIndex:
+        """Parse events appended to an audit file since it was last indexed."""
+        index = self._indexes.get(file_path)
+        size = file_path.stat().st_size
+        if index is None or size < index.offset:
+            index = self._indexes[file_path] = _AuditFileIndex()
+            while len(self._indexes) > AUDIT_INDEX_CACHE_FILES:
+                del self._indexes[next(iter(self._indexes))]
+        if size == index.offset:
+            return index
+
+        with open(file_path, "rb") as f:
+            f.seek(index.offset)
+            data = f.read(size - index.offset)
+        # Leave a partially written last line for the next search
+        end = data.rfind(b"\n") + 1
+        index.offset += end
+
+        for line in data[:end].splitlines():
+            # Skip block padding written by the O_DIRECT writer
+            if not line.strip():
+                continue
+            try:
+                index.add(AuditEvent.model_validate(_loads(line)))
+            except (json.JSONDecodeError, ValueError) as e:
+                self.logger.warning(
+                    "Failed to parse audit event",
+                    error=str(e),
+                    line=line.decode(errors="replace"),
+                )
+        return index
+
+
+# File-logging audit loggers, flushed at interpreter exit; the flush timer
+# runs on a daemon thread and would not get the chance
+_open_loggers: weakref.WeakSet[AuditLogger] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_loggers() -> None:
+    """Write events still buffered by any audit logger."""
+    for audit_logger in list(_open_loggers):
+        audit_logger.flush()
+
 
 # Global audit logger instance
 _audit_logger: AuditLogger | None = None
@@ -287,12 +637,16 @@ def get_audit_logger() -> AuditLogger:
 def configure_audit_logger(
     log_dir: Path | None = None,
     enable_file_logging: bool = True,
+    direct_io: bool = False,
 ) -> None:
     """Configure the global audit logger.
 
     Args:
         log_dir: Directory for audit logs
         enable_file_logging: Whether to write audit logs to files
+        direct_io: Write audit files with O_DIRECT where supported
     """
     global _audit_logger
-    _audit_logger = AuditLogger(log_dir, enable_file_logging)
+    if _audit_logger is not None:
+        _audit_logger.close()
+    _audit_logger = AuditLogger(log_dir, enable_file_logging, direct_io)
@@ -3,6 +3,7 @@
 import json
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from queue import Empty, Queue
 from threading import Event, Thread
@@ -21,6 +22,13 @@ except ImportError:
 from entropy_playground.logging.logger import get_logger
 
 
+class _FlushMarker:
+    """Queued by flush(); set once every record queued before it is sent."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+
+
 class CloudWatchHandler:
     """Handler for sending logs to AWS CloudWatch."""
 
@@ -62,7 +70,7 @@ class CloudWatchHandler:
         self._ensure_log_stream_exists()
 
         # Initialize buffer and worker thread
-        self.buffer: Queue[dict[str, Any]] = Queue()
+        self.buffer: Queue[dict[str, Any] | _FlushMarker] = Queue()
         self.sequence_token: str | None = None
         self.stop_event = Event()
         self.worker_thread = Thread(target=self._worker, daemon=True)
@@ -116,54 +124,98 @@ class CloudWatchHandler:
         self.buffer.put(record)
 
     def _worker(self) -> None:
-        """Worker thread that sends buffered logs to CloudWatch."""
+        """Worker thread that sends buffered logs to CloudWatch.
+
+        Serialization runs on a small thread pool so that batch N can be
+        serialized while batch N-1 is being sent.
+        """
         logs_to_send: list[dict[str, Any]] = []
         last_flush = time.time()
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cloudwatch-serializer")
+        in_flight: tuple[list[dict[str, Any]], Future[list[dict[str, Any]]]] | None = None
 
         while not self.stop_event.is_set():
+            flush_now = False
+            markers: list[_FlushMarker] = []
             try:
                 # Collect logs from buffer
                 timeout = max(0.1, self.flush_interval - (time.time() - last_flush))
 
                 try:
                     log = self.buffer.get(timeout=timeout)
-                    logs_to_send.append(log)
 
-                    # Collect more logs if available
-                    while len(logs_to_send) < self.buffer_size and not self.buffer.empty():
-                        logs_to_send.append(self.buffer.get_nowait())
+                    # Collect more logs if available, stopping at a flush marker
+                    while True:
+                        if isinstance(log, _FlushMarker):
+                            markers.append(log)
+                            flush_now = True
+                            break
+                        logs_to_send.append(log)
+                        if len(logs_to_send) >= self.buffer_size or self.buffer.empty():
+                            break
+                        log = self.buffer.get_nowait()
                 except Empty:
                     pass
 
-                # Send logs if buffer is full or flush interval reached
+                # Send logs if buffer is full, flush interval reached or flush requested
                 should_flush = (
-                    len(logs_to_send) >= self.buffer_size
+                    flush_now
+                    or len(logs_to_send) >= self.buffer_size
                     or (time.time() - last_flush) >= self.flush_interval
                 )
 
                 if should_flush and logs_to_send:
-                    self._send_logs(logs_to_send)
-                    logs_to_send.clear()
+                    # Start serializing this batch, then send the previous one
+                    batch = logs_to_send
+                    logs_to_send = []
+                    future = executor.submit(self._serialize_batch, batch)
+                    if in_flight is not None:
+                        self._put_log_events(in_flight[0], in_flight[1].result())
+                    in_flight = (batch, future)
                     last_flush = time.time()
 
+                # Nothing to overlap with, so don't hold the batch back
+                if in_flight is not None and (flush_now or self.buffer.empty()):
+                    pending, in_flight = in_flight, None
+                    self._put_log_events(pending[0], pending[1].result())
+
+                # Everything queued before these markers has now been sent
+                for marker in markers:
+                    marker.done.set()
+
             except Exception as e:
                 self.logger.error(f"Error in CloudWatch worker: {e}")
                 time.sleep(1)  # Back off on error
 
-        # Flush remaining logs on shutdown
-        if logs_to_send:
-            self._send_logs(logs_to_send)
+        # Flush remaining logs on shutdown, including any still queued
+        markers = []
+        while True:
+            try:
+                log = self.buffer.get_nowait()
+            except Empty:
+                break
+            if isinstance(log, _FlushMarker):
+                markers.append(log)
+            else:
+                logs_to_send.append(log)
 
-    def _send_logs(self, logs: list[dict[str, Any]]) -> None:
-        """Send logs to CloudWatch.
+        if in_flight is not None:
+            self._put_log_events(in_flight[0], in_flight[1].result())
+        for start in range(0, len(logs_to_send), self.buffer_size):
+            self._send_logs(logs_to_send[start : start + self.buffer_size])
+        executor.shutdown(wait=False)
+        for marker in markers:
+            marker.done.set()
+
+    def _serialize_batch(self, logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Convert log records to CloudWatch log events.
 
         Args:
-            logs: List of log records to send
-        """
-        if not logs:
-            return
+            logs: List of log records
 
-        # Convert logs to CloudWatch format
+        Returns:
+            Log events sorted by timestamp
+        """
         log_events: list[dict[str, Any]] = []
         for log in logs:
             # Extract timestamp
@@ -188,7 +240,26 @@ class CloudWatchHandler:
 
         # Sort by timestamp (CloudWatch requirement)
         log_events.sort(key=lambda x: x["timestamp"])
+        return log_events
+
+    def _send_logs(self, logs: list[dict[str, Any]]) -> None:
+        """Send logs to CloudWatch.
+
+        Args:
+            logs: List of log records to send
+        """
+        if not logs:
+            return
+
+        self._put_log_events(logs, self._serialize_batch(logs))
+
+    def _put_log_events(self, logs: list[dict[str, Any]], log_events: list[dict[str, Any]]) -> None:
+        """Send already serialized log events to CloudWatch.
 
+        Args:
+            logs: Original log records, re-queued if sending fails
+            log_events: Serialized CloudWatch log events
+        """
         # Send to CloudWatch
         try:
             kwargs = {
@@ -212,7 +283,7 @@ class CloudWatchHandler:
                 # Extract the correct sequence token from the error message
                 self.sequence_token = e.response["Error"]["Message"].split(" ")[-1]
                 # Retry with correct token
-                self._send_logs(logs)
+                self._put_log_events(logs, log_events)
             elif error_code == "DataAlreadyAcceptedException":
                 # Logs already sent, update sequence token
                 self.sequence_token = e.response["Error"]["Message"].split(" ")[-1]
@@ -222,18 +293,32 @@ class CloudWatchHandler:
                 for log in logs:
                     self.buffer.put(log)
 
-    def flush(self) -> None:
-        """Force flush all buffered logs."""
-        # Send a flush signal by temporarily setting flush interval to 0
-        original_interval = self.flush_interval
-        self.flush_interval = 0
-        time.sleep(0.1)  # Give worker time to process
-        self.flush_interval = original_interval
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Force flush all buffered logs.
+
+        Blocks until every record emitted before the call has been sent.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if not self.worker_thread.is_alive():
+            return False
+
+        # Each call waits on its own marker, which the worker only reaches
+        # after every record queued before it
+        marker = _FlushMarker()
+        self.buffer.put(marker)
+        return marker.done.wait(timeout=timeout)
 
     def close(self) -> None:
         """Close the handler and flush remaining logs."""
         self.logger.info("Closing CloudWatch handler")
         self.stop_event.set()
+        # Wake the worker rather than waiting out its queue timeout
+        self.buffer.put(_FlushMarker())
         self.worker_thread.join(timeout=5.0)
 
     def __enter__(self) -> "CloudWatchHandler":
@@ -3,21 +3,56 @@
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 from typing import Any
 
 import structlog
 from structlog.types import EventDict, Processor
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Set once setup_logging() has run; get_logger() configures lazily otherwise
+_configured = False
+
+# (whole UTC second, its "YYYY-MM-DDTHH:MM:SS" rendering); swapped as one
+# tuple so concurrent threads always read a matching pair
+_timestamp_cache: tuple[int, str] = (-1, "")
+
 
 def add_timestamp(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add timestamp to log events."""
-    event_dict["timestamp"] = datetime.utcnow().isoformat()
+    """Add timestamp to log events.
+
+    The date and time up to the second are formatted once per second; only
+    the microseconds are rendered for each event.
+    """
+    global _timestamp_cache
+
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _timestamp_cache = (second, prefix)
+    event_dict["timestamp"] = f"{prefix}.{int((now - second) * 1_000_000):06d}"
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for ``JSONRenderer``.
+
+    The stdlib logging handlers expect ``str``, so the bytes are decoded.
+    """
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def add_request_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add request context to log events."""
     # Add context from bound logger if available
@@ -72,6 +107,46 @@ def setup_file_handler(
     return handler
 
 
+class _BackgroundFileHandler(logging.handlers.QueueHandler):
+    """Queue records for a file handler that writes on a background thread.
+
+    Logging threads only enqueue records instead of contending for the file
+    handler's lock and waiting on disk writes.
+    """
+
+    def __init__(self, handler: logging.Handler) -> None:
+        # The listener marks each record done, so flush() can join the queue
+        records: queue.Queue[logging.LogRecord] = queue.Queue()
+        super().__init__(records)
+        self._records = records
+        self.handler = handler
+        self.listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+
+    def flush(self) -> None:
+        """Wait for queued records to be written, then flush the file."""
+        self.acquire()
+        try:
+            if self._running:
+                self._records.join()
+            self.handler.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write queued records and close the file handler."""
+        self.acquire()
+        try:
+            if self._running:
+                self.listener.stop()
+                self._running = False
+            self.handler.close()
+        finally:
+            self.release()
+        super().close()
+
+
 def setup_logging(
     level: str = "INFO",
     log_dir: str | None = None,
@@ -84,9 +159,12 @@ def setup_logging(
         log_dir: Directory for log files (defaults to ./logs)
         enable_file_logging: Whether to enable file logging
     """
+    global _configured
+
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    log_level = getattr(logging, level.upper(), logging.INFO)
+    root_logger.setLevel(log_level)
 
     # Close and clear existing handlers to prevent file locking issues
     for handler in root_logger.handlers[:]:  # Create a copy to iterate safely
@@ -103,7 +181,7 @@ def setup_logging(
         if log_dir is None:
             log_dir = os.environ.get("ENTROPY_LOG_DIR", "./logs")
         file_handler = setup_file_handler(Path(log_dir))
-        root_logger.addHandler(file_handler)
+        root_logger.addHandler(_BackgroundFileHandler(file_handler))
 
     # Configure structlog
     processors: list[Processor] = [
@@ -128,19 +206,25 @@ def setup_logging(
 
     # Use JSON renderer in production, console renderer for development
     if os.environ.get("ENTROPY_ENV") == "production":
-        processors.append(structlog.processors.JSONRenderer())
+        if HAS_ORJSON:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below the configured level are no-ops, so disabled calls
+        # never build an event dict or run the processor chain
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+    _configured = True
 
 
-def get_logger(name: str, **context: Any) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str, **context: Any) -> structlog.typing.FilteringBoundLogger:
     """Get a structured logger instance.
 
     Args:
@@ -150,6 +234,11 @@ def get_logger(name: str, **context: Any) -> structlog.stdlib.BoundLogger:
     Returns:
         Configured logger instance
     """
+    # Configure on first use rather than at import, and leave an existing
+    # structlog configuration made by the embedding application alone
+    if not _configured and not structlog.is_configured():
+        setup_logging(os.environ.get("LOG_LEVEL", "INFO"))
+
     logger = structlog.get_logger(name)
     if context:
         logger = logger.bind(**context)
@@ -188,8 +277,3 @@ def cleanup_logging_handlers() -> None:
     for handler in root_logger.handlers[:]:
         handler.close()
         root_logger.removeHandler(handler)
-
-
-# Initialize logging on module import
-log_level = os.environ.get("LOG_LEVEL", "INFO")
-setup_logging(log_level)
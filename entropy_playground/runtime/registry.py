@@ -8,14 +8,29 @@ This module provides:
 - Discovery and listing of available agents
 """
 
+import functools
 import inspect
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
-from entropy_playground.agents.base import AgentConfig, BaseAgent
+from entropy_playground.agents.base import AgentConfig, AgentState, BaseAgent
 from entropy_playground.logging.logger import get_logger
 
 
+@functools.lru_cache(maxsize=256)
+def _public_methods(agent_class: type[BaseAgent]) -> tuple[str, ...]:
+    """List the public methods of an agent class, cached per class."""
+    return tuple(
+        name
+        for name, _ in inspect.getmembers(
+            agent_class, predicate=lambda x: inspect.ismethod(x) or inspect.isfunction(x)
+        )
+        if not name.startswith("_")
+    )
+
+
 class AgentRegistryError(Exception):
     """Agent registry specific errors."""
 
@@ -28,14 +43,39 @@ class AgentRegistry:
 
     This registry maintains a mapping of agent roles to their implementations,
     allowing for dynamic agent creation and discovery.
+
+    In multi-process deployments, populate the registry in the supervisor and
+    call freeze() before forking workers (start method "fork"). Children then
+    inherit the registrations without re-importing or re-registering agents,
+    and any accidental registration in a child fails loudly.
     """
 
     def __init__(self) -> None:
         """Initialize the agent registry."""
         self._agents: dict[str, type[BaseAgent]] = {}
         self._validators: dict[str, Callable[[AgentConfig], None]] = {}
+        self._frozen = False
         self.logger = get_logger("agent.registry")
 
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry rejects further changes."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Make the registry read-only.
+
+        Registering, unregistering or clearing afterwards raises
+        AgentRegistryError.
+        """
+        self._frozen = True
+        self.logger.info("Registry frozen", agents=len(self._agents))
+
+    def _check_not_frozen(self) -> None:
+        """Raise if the registry has been frozen."""
+        if self._frozen:
+            raise AgentRegistryError("Agent registry is frozen and cannot be modified")
+
     def register(
         self,
         role: str,
@@ -53,13 +93,8 @@ class AgentRegistry:
         Raises:
             AgentRegistryError: If registration fails
         """
-        if not role:
-            raise AgentRegistryError("Agent role cannot be empty")
-
-        if not inspect.isclass(agent_class) or not issubclass(agent_class, BaseAgent):
-            raise AgentRegistryError(
-                f"Agent class must be a subclass of BaseAgent, got {agent_class}"
-            )
+        self._check_not_frozen()
+        self._validate_registration(role, agent_class)
 
         if role in self._agents:
             self.logger.warning(
@@ -75,6 +110,49 @@ class AgentRegistry:
 
         self.logger.info("Agent registered", role=role, agent_class=agent_class.__name__)
 
+    def register_many(
+        self,
+        items: list[tuple[str, type[BaseAgent], Callable[[AgentConfig], None] | None]],
+    ) -> None:
+        """
+        Register several agent classes at once.
+
+        All entries are validated before any is registered, and a single
+        summary entry is logged instead of one per agent.
+
+        Args:
+            items: (role, agent_class, validator) tuples; validator may be None
+
+        Raises:
+            AgentRegistryError: If any entry is invalid or the registry is frozen
+        """
+        self._check_not_frozen()
+        for role, agent_class, _ in items:
+            self._validate_registration(role, agent_class)
+
+        overwritten = [role for role, _, _ in items if role in self._agents]
+        if overwritten:
+            self.logger.warning("Overwriting existing agent registrations", roles=overwritten)
+
+        self._agents.update((role, agent_class) for role, agent_class, _ in items)
+        self._validators.update(
+            (role, validator) for role, _, validator in items if validator is not None
+        )
+
+        self.logger.info(
+            "Agents registered", count=len(items), roles=[role for role, _, _ in items]
+        )
+
+    def _validate_registration(self, role: str, agent_class: type[BaseAgent]) -> None:
+        """Check that a role and agent class can be registered."""
+        if not role:
+            raise AgentRegistryError("Agent role cannot be empty")
+
+        if not inspect.isclass(agent_class) or not issubclass(agent_class, BaseAgent):
+            raise AgentRegistryError(
+                f"Agent class must be a subclass of BaseAgent, got {agent_class}"
+            )
+
     def unregister(self, role: str) -> None:
         """
         Unregister an agent from the registry.
@@ -83,8 +161,9 @@ class AgentRegistry:
             role: The role identifier to unregister
 
         Raises:
-            AgentRegistryError: If the role is not registered
+            AgentRegistryError: If the role is not registered or the registry is frozen
         """
+        self._check_not_frozen()
         if role not in self._agents:
             raise AgentRegistryError(f"Agent role '{role}' is not registered")
 
@@ -118,6 +197,10 @@ class AgentRegistry:
         """Get a list of all registered agent roles."""
         return list(self._agents.keys())
 
+    def __contains__(self, role: object) -> bool:
+        """Check whether a role is registered without building the role list."""
+        return role in self._agents
+
     def get_info(self, role: str) -> dict[str, Any]:
         """
         Get information about a registered agent.
@@ -139,13 +222,7 @@ class AgentRegistry:
             "module": agent_class.__module__,
             "docstring": inspect.getdoc(agent_class),
             "has_validator": role in self._validators,
-            "methods": [
-                name
-                for name, _ in inspect.getmembers(
-                    agent_class, predicate=lambda x: inspect.ismethod(x) or inspect.isfunction(x)
-                )
-                if not name.startswith("_")
-            ],
+            "methods": list(_public_methods(agent_class)),
         }
 
     def validate_config(self, role: str, config: AgentConfig) -> None:
@@ -177,6 +254,7 @@ class AgentRegistry:
 
     def clear(self) -> None:
         """Clear all registrations."""
+        self._check_not_frozen()
         count = len(self._agents)
         self._agents.clear()
         self._validators.clear()
@@ -188,19 +266,37 @@ class AgentFactory:
     Factory for creating agent instances.
 
     This factory uses the agent registry to create properly configured
-    agent instances based on their role.
+    agent instances based on their role. Singleton instances can be kept in
+    a bounded pool with least-recently-used eviction; agents that have been
+    started and not yet stopped are never evicted.
     """
 
-    def __init__(self, registry: AgentRegistry):
+    # States in which a singleton instance may be evicted or pruned
+    EVICTABLE_STATES = frozenset({AgentState.INITIALIZING, AgentState.STOPPED, AgentState.ERROR})
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        max_instances: int | None = None,
+        max_idle_seconds: float | None = None,
+    ):
         """
         Initialize the agent factory.
 
         Args:
             registry: The agent registry to use
+            max_instances: Maximum number of singleton instances to keep,
+                or None for no limit
+            max_idle_seconds: Drop singleton instances not used for this
+                many seconds, or None to keep them until evicted
         """
         self.registry = registry
         self.logger = get_logger("agent.factory")
-        self._instances: dict[str, BaseAgent] = {}
+        self.max_instances = max_instances
+        self.max_idle_seconds = max_idle_seconds
+        # Ordered from least to most recently used
+        self._instances: OrderedDict[str, BaseAgent] = OrderedDict()
+        self._last_used: dict[str, float] = {}
 
     def create(self, config: AgentConfig, singleton: bool = False, **kwargs: Any) -> BaseAgent:
         """
@@ -221,11 +317,15 @@ class AgentFactory:
         self.registry.validate_config(config.role, config)
 
         # Check for singleton instance
-        if singleton and config.name in self._instances:
-            self.logger.debug(
-                "Returning singleton agent instance", agent_name=config.name, agent_role=config.role
-            )
-            return self._instances[config.name]
+        if singleton:
+            existing = self.get_instance(config.name)
+            if existing is not None:
+                self.logger.debug(
+                    "Returning singleton agent instance",
+                    agent_name=config.name,
+                    agent_role=config.role,
+                )
+                return existing
 
         # Get agent class
         agent_class = self.registry.get(config.role)
@@ -236,7 +336,7 @@ class AgentFactory:
 
             # Store singleton if requested
             if singleton:
-                self._instances[config.name] = agent
+                self._store_instance(config.name, agent)
 
             self.logger.info(
                 "Agent created",
@@ -263,11 +363,76 @@ class AgentFactory:
         Returns:
             The agent instance or None if not found
         """
-        return self._instances.get(name)
+        self.prune_idle()
+        agent = self._instances.get(name)
+        if agent is not None:
+            self._touch(name)
+        return agent
 
     def list_instances(self) -> dict[str, BaseAgent]:
         """Get all singleton agent instances."""
-        return self._instances.copy()
+        self.prune_idle()
+        return dict(self._instances)
+
+    def prune_idle(self) -> int:
+        """
+        Remove singleton instances idle for longer than max_idle_seconds.
+
+        Instances that are still running are kept.
+
+        Returns:
+            Number of instances removed
+        """
+        if self.max_idle_seconds is None:
+            return 0
+
+        cutoff = time.monotonic() - self.max_idle_seconds
+        removed = 0
+        # Least recently used instances come first, so stop at the first fresh one
+        for name, agent in list(self._instances.items()):
+            if self._last_used[name] > cutoff:
+                break
+            if agent.state not in self.EVICTABLE_STATES:
+                continue
+            self._drop_instance(name)
+            removed += 1
+
+        if removed:
+            self.logger.info("Idle agent instances pruned", instances_removed=removed)
+        return removed
+
+    def _touch(self, name: str) -> None:
+        """Mark a singleton instance as most recently used."""
+        self._instances.move_to_end(name)
+        self._last_used[name] = time.monotonic()
+
+    def _store_instance(self, name: str, agent: BaseAgent) -> None:
+        """Add a singleton instance, evicting the least recently used idle ones.
+
+        Running instances are skipped, so the pool may exceed max_instances
+        until they stop.
+        """
+        self._instances[name] = agent
+        self._touch(name)
+        if self.max_instances is None:
+            return
+        excess = len(self._instances) - self.max_instances
+        if excess <= 0:
+            return
+        # The instance just stored is the most recently used and is kept
+        evictable = [
+            other
+            for other, instance in self._instances.items()
+            if other != name and instance.state in self.EVICTABLE_STATES
+        ]
+        for evicted in evictable[:excess]:
+            self._drop_instance(evicted)
+            self.logger.info("Agent instance evicted", agent_name=evicted)
+
+    def _drop_instance(self, name: str) -> None:
+        """Forget a singleton instance."""
+        del self._instances[name]
+        del self._last_used[name]
 
     def remove_instance(self, name: str) -> bool:
         """
@@ -280,7 +445,7 @@ class AgentFactory:
             True if instance was removed, False if not found
         """
         if name in self._instances:
-            del self._instances[name]
+            self._drop_instance(name)
             self.logger.info("Agent instance removed", agent_name=name)
             return True
         return False
@@ -289,6 +454,7 @@ class AgentFactory:
         """Clear all singleton instances."""
         count = len(self._instances)
         self._instances.clear()
+        self._last_used.clear()
         self.logger.info("Factory instances cleared", instances_removed=count)
 
 
@@ -6,23 +6,138 @@ across the distributed system.
 """
 
 import json
+import random
+import re
+import socket
+import time
 from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
-from datetime import datetime
 from typing import Any, cast
 
 import redis
 from redis import ConnectionPool, Redis
-from redis.exceptions import LockError, RedisError
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import LockError, RedisError, ResponseError
+from redis.lock import Lock
+from redis.retry import Retry
+from redis.typing import EncodableT, FieldT
 from structlog import get_logger
 
 from entropy_playground.infrastructure.config import Config
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger()
 
+# Probe idle connections so load balancers and NAT tables do not silently drop
+# them; the options are platform-specific, so only those available are set
+_KEEPALIVE_OPTIONS: dict[int, int] = {
+    option: value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (option := getattr(socket, name, None)) is not None
+}
+
+
+# Leading ISO 8601 timestamp of a backup key with the prefix removed; the
+# timestamp itself contains colons, so it cannot be split off at the first one
+_BACKUP_TIMESTAMP = re.compile(rb"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?):")
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last timestamp
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _iso_from_ns(ns: int) -> str:
+    """Format epoch nanoseconds as a naive UTC ISO 8601 string.
+
+    Matches ``datetime.utcnow().isoformat()`` output, always including
+    microseconds. The date/time prefix is reused while the second is the same.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(ns, 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if seconds != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def _utcnow_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string."""
+    return _iso_from_ns(time.time_ns())
+
+
+if HAS_ORJSON:
+
+    def _dumps(value: Any) -> str | bytes:
+        """Serialize a value to compact JSON bytes with orjson.
+
+        redis-py sends ``bytes`` as-is, so the result is not decoded.
+        """
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _loads: Callable[[str | bytes], Any] = orjson.loads
+else:
+
+    def _dumps(value: Any) -> str | bytes:
+        """Serialize a value to JSON with the standard library."""
+        return json.dumps(value)
+
+    _loads = json.loads
+
+
+def _to_str(value: str | bytes) -> str:
+    """Convert a Redis reply to ``str``."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _decode(raw: str | bytes) -> Any:
+    """Decode a stored JSON value, returning non-JSON values as strings."""
+    try:
+        return _loads(raw)
+    except json.JSONDecodeError:
+        return _to_str(raw)
+
+
+def _is_wrong_type(error: ResponseError) -> bool:
+    """Check whether Redis rejected a command for the key's data type.
+
+    Pipelines prefix the server message with the failing command, so the
+    WRONGTYPE code is searched for rather than matched at the start.
+    """
+    return "WRONGTYPE" in str(error)
+
 
 class StateManager:
-    """Manages distributed state using Redis."""
+    """Manages distributed state using Redis.
+
+    The underlying client returns raw ``bytes`` replies; JSON values are
+    parsed straight from bytes, and keys are only decoded to ``str`` where
+    they are handed back to callers.
+    """
+
+    # Keys read or written per round trip in bulk operations
+    SCAN_BATCH_SIZE = 500
+
+    # COUNT hint passed to SCAN; larger values mean fewer round trips
+    SCAN_COUNT = 1000
+
+    # Maximum number of Lock objects kept for reuse
+    LOCK_CACHE_SIZE = 256
+
+    # First delay in seconds between lock attempts; doubles on each failure
+    LOCK_BACKOFF_INITIAL = 0.005
+
+    # Default cap in seconds on the delay between lock attempts
+    LOCK_BACKOFF_MAX = 1.0
+
+    # Seconds a successful health check PING is trusted before sending another
+    HEALTH_CHECK_TTL = 10.0
 
     def __init__(self, config: Config):
         """Initialize the state manager.
@@ -33,6 +148,8 @@ class StateManager:
         self.config = config
         self._pool: ConnectionPool | None = None
         self._client: Redis | None = None
+        self._locks: dict[tuple[str, float, float, float], Lock] = {}
+        self._last_ping_at = float("-inf")
 
     @property
     def pool(self) -> ConnectionPool:
@@ -42,17 +159,23 @@ class StateManager:
                 self.config.redis_url,
                 max_connections=50,
                 socket_keepalive=True,
-                socket_keepalive_options={},
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
                 health_check_interval=30,
+                # Reconnect after dropped connections with growing delays
+                retry=Retry(ExponentialBackoff(cap=5, base=1), 3),
             )
             logger.info("redis_pool_created", url=self.config.redis_url)
         return self._pool
 
     @property
     def client(self) -> Redis:
-        """Get or create the Redis client."""
+        """Get or create the Redis client.
+
+        Replies are not decoded, so direct users of this client receive
+        ``bytes`` values and keys.
+        """
         if self._client is None:
-            self._client = Redis(connection_pool=self.pool, decode_responses=True)
+            self._client = Redis(connection_pool=self.pool)
             logger.info("redis_client_created")
         return self._client
 
@@ -63,6 +186,19 @@ class StateManager:
             logger.info("redis_pool_closed")
             self._pool = None
             self._client = None
+            self._locks.clear()
+            self._last_ping_at = float("-inf")
+
+    def _scan_batches(self, pattern: str) -> Iterator[list[bytes]]:
+        """Yield keys matching a pattern in batches of SCAN_BATCH_SIZE."""
+        batch: list[bytes] = []
+        for key in self.client.scan_iter(match=pattern, count=self.SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
     # State Persistence Layer
 
@@ -77,15 +213,16 @@ class StateManager:
         """
         try:
             value = self.client.get(key)
-            if value is not None:
-                return json.loads(value)
-            return None
-        except json.JSONDecodeError:
-            logger.warning("state_get_decode_error", key=key, value=value)
-            return value
         except RedisError as e:
             logger.error("state_get_error", key=key, error=str(e))
             raise
+        if value is None:
+            return None
+        try:
+            return _loads(value)
+        except json.JSONDecodeError:
+            logger.warning("state_get_decode_error", key=key, value=value)
+            return _to_str(value)
 
     def set(
         self,
@@ -104,13 +241,27 @@ class StateManager:
             True if successful
         """
         try:
-            serialized = json.dumps(value)
-            if ttl:
-                return bool(self.client.setex(key, ttl, serialized))
-            return bool(self.client.set(key, serialized))
+            serialized = _dumps(value)
         except (TypeError, ValueError) as e:
             logger.error("state_set_serialize_error", key=key, error=str(e))
             raise
+        return self.set_raw(key, serialized, ttl=ttl)
+
+    def set_raw(self, key: str, raw: str | bytes, ttl: int | None = None) -> bool:
+        """Store an already serialized value.
+
+        Args:
+            key: The key to set
+            raw: The serialized value
+            ttl: Optional TTL in seconds
+
+        Returns:
+            True if successful
+        """
+        try:
+            if ttl:
+                return bool(self.client.setex(key, ttl, raw))
+            return bool(self.client.set(key, raw))
         except RedisError as e:
             logger.error("state_set_error", key=key, error=str(e))
             raise
@@ -154,42 +305,98 @@ class StateManager:
         Returns:
             Dictionary mapping keys to values
         """
-        try:
-            values = self.client.mget(keys)
-            result = {}
-            for key, value in zip(keys, values, strict=False):
-                if value is not None:
-                    try:
-                        result[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        result[key] = value
-            return result
-        except RedisError as e:
-            logger.error("state_get_many_error", keys=keys, error=str(e))
-            raise
+        return {key: _decode(raw) for key, raw in self.get_many_raw(keys).items()}
 
-    def set_many(self, mapping: dict[str, Any]) -> bool:
+    def set_many(self, mapping: dict[str, Any], ttl: int | None = None) -> bool:
         """Set multiple values at once.
 
         Args:
             mapping: Dictionary of key-value pairs
+            ttl: Optional TTL in seconds applied to every key
 
         Returns:
             True if successful
         """
         try:
-            serialized = {k: json.dumps(v) for k, v in mapping.items()}
-            # Type cast for redis compatibility
-            return bool(
-                self.client.mset(cast(Mapping[str | bytes, bytes | float | int | str], serialized))
-            )
+            serialized = {k: _dumps(v) for k, v in mapping.items()}
         except (TypeError, ValueError) as e:
             logger.error("state_set_many_serialize_error", error=str(e))
             raise
+        return self.set_many_raw(serialized, ttl=ttl)
+
+    def get_many_raw(self, keys: list[str]) -> dict[str, bytes]:
+        """Get multiple stored values without JSON decoding them.
+
+        Args:
+            keys: List of keys to retrieve
+
+        Returns:
+            Dictionary mapping existing keys to their stored bytes
+        """
+        try:
+            # The client does not decode responses, so values are bytes
+            values = cast(list[bytes | None], self.client.mget(keys))
+            return {
+                key: value for key, value in zip(keys, values, strict=False) if value is not None
+            }
+        except RedisError as e:
+            logger.error("state_get_many_error", keys=keys, error=str(e))
+            raise
+
+    def set_many_raw(self, mapping: Mapping[str, str | bytes], ttl: int | None = None) -> bool:
+        """Store multiple already serialized values.
+
+        Writes are sent in pipelined chunks of SCAN_BATCH_SIZE keys so large
+        mappings do not become a single blocking command on the server.
+
+        Args:
+            mapping: Dictionary of keys to serialized values
+            ttl: Optional TTL in seconds applied to every key
+
+        Returns:
+            True if every write succeeded
+        """
+        items = list(mapping.items())
+        ok = True
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(items), self.SCAN_BATCH_SIZE):
+                chunk = items[start : start + self.SCAN_BATCH_SIZE]
+                if ttl:
+                    for key, raw in chunk:
+                        pipe.set(key, raw, ex=ttl)
+                else:
+                    pipe.mset(dict(chunk))
+                ok = all(pipe.execute()) and ok
+            return ok
         except RedisError as e:
             logger.error("state_set_many_error", error=str(e))
             raise
 
+    def _dump_many(self, keys: list[bytes]) -> list[bytes | None]:
+        """Serialize keys of any type with DUMP in one round trip.
+
+        Used for keys MGET cannot read, such as lists; missing keys give None.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.dump(key)
+        return cast(list[bytes | None], pipe.execute())
+
+    def _restore_many(self, payloads: Mapping[bytes, bytes], replace: bool) -> None:
+        """Recreate keys from DUMP payloads in one round trip."""
+        pipe = self.client.pipeline(transaction=False)
+        for key, payload in payloads.items():
+            pipe.restore(key, 0, payload, replace=replace)
+        pipe.execute()
+
+    @staticmethod
+    def _write_list(pipe: Any, key: str, items: list[str | bytes]) -> None:
+        """Queue commands replacing ``key`` with a list of serialized items."""
+        pipe.delete(key)
+        if items:
+            pipe.rpush(key, *items)
+
     # Distributed Locking
 
     @contextmanager
@@ -199,14 +406,20 @@ class StateManager:
         timeout: float = 10.0,
         blocking_timeout: float = 5.0,
         sleep: float = 0.1,
+        max_delay: float = LOCK_BACKOFF_MAX,
     ) -> Iterator[Any]:
         """Acquire a distributed lock.
 
+        Waiting callers retry with jittered exponential backoff, starting at
+        LOCK_BACKOFF_INITIAL, so contended locks are not polled at a fixed rate.
+
         Args:
             name: Name of the lock
             timeout: Lock timeout in seconds
             blocking_timeout: How long to wait for the lock
-            sleep: Sleep interval between lock attempts
+            sleep: Sleep interval between attempts when the yielded lock's
+                ``acquire()`` is called directly
+            max_delay: Maximum delay between lock attempts made here
 
         Yields:
             The lock object
@@ -216,18 +429,14 @@ class StateManager:
                 # Critical section
                 pass
         """
-        lock = self.client.lock(
-            name,
-            timeout=timeout,
-            blocking_timeout=blocking_timeout,
-            sleep=sleep,
-        )
+        lock = self._get_lock(name, timeout, blocking_timeout, sleep)
+        # The Lock object is shared, so a call that failed to acquire must not
+        # release it: that would drop a hold taken by an enclosing call
+        if not self._acquire_with_backoff(lock, blocking_timeout, max_delay):
+            raise LockError(f"Failed to acquire lock: {name}")
+        logger.info("lock_acquired", name=name)
         try:
-            if lock.acquire():
-                logger.info("lock_acquired", name=name)
-                yield lock
-            else:
-                raise LockError(f"Failed to acquire lock: {name}")
+            yield lock
         finally:
             try:
                 lock.release()
@@ -236,6 +445,45 @@ class StateManager:
                 # Lock might have timed out
                 logger.warning("lock_release_failed", name=name)
 
+    def _acquire_with_backoff(self, lock: Lock, blocking_timeout: float, max_delay: float) -> bool:
+        """Try to acquire a lock until blocking_timeout elapses.
+
+        Returns:
+            True if the lock was acquired
+        """
+        deadline = time.monotonic() + blocking_timeout
+        delay = self.LOCK_BACKOFF_INITIAL
+        while True:
+            if lock.acquire(blocking=False):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Jitter keeps waiters that failed together from retrying together
+            time.sleep(min(delay + random.uniform(0, delay / 2), remaining))
+            delay = min(delay * 2, max_delay)
+
+    def _get_lock(self, name: str, timeout: float, blocking_timeout: float, sleep: float) -> Lock:
+        """Get a reusable Lock object for the given name and settings.
+
+        Lock tokens are thread-local, so one instance can be shared by all
+        threads of this manager.
+        """
+        cache_key = (name, timeout, blocking_timeout, sleep)
+        lock = self._locks.get(cache_key)
+        if lock is None:
+            if len(self._locks) >= self.LOCK_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._locks[next(iter(self._locks))]
+            lock = self.client.lock(
+                name,
+                timeout=timeout,
+                blocking_timeout=blocking_timeout,
+                sleep=sleep,
+            )
+            self._locks[cache_key] = lock
+        return lock
+
     # State Migration Utilities
 
     def migrate_key(
@@ -246,6 +494,9 @@ class StateManager:
     ) -> bool:
         """Migrate a key to a new name, optionally transforming the value.
 
+        List keys, such as agent history, are passed to ``transform_fn`` as a
+        list of decoded entries and written back as a list.
+
         Args:
             old_key: The current key name
             new_key: The new key name
@@ -255,17 +506,38 @@ class StateManager:
             True if migration was successful
         """
         try:
-            value = self.get(old_key)
-            if value is None:
-                logger.warning("migrate_key_not_found", old_key=old_key)
-                return False
-
-            if transform_fn:
-                value = transform_fn(value)
+            if transform_fn is None:
+                # Server-side rename: atomic and moves no payload over the wire
+                try:
+                    self.client.rename(old_key, new_key)
+                except ResponseError as e:
+                    if "no such key" not in str(e):
+                        raise
+                    logger.warning("migrate_key_not_found", old_key=old_key)
+                    return False
+                logger.info("key_migrated", old_key=old_key, new_key=new_key)
+                return True
 
+            # Read under the lock so a concurrent migration cannot change the
+            # value between the read and the write
             with self.lock(f"migration:{old_key}:{new_key}"):
-                self.set(new_key, value)
-                self.delete(old_key)
+                try:
+                    raw = self.client.get(old_key)
+                except ResponseError as e:
+                    if not _is_wrong_type(e):
+                        raise
+                    return self._migrate_list(old_key, new_key, transform_fn)
+                if raw is None:
+                    logger.warning("migrate_key_not_found", old_key=old_key)
+                    return False
+
+                value = _dumps(transform_fn(_decode(raw)))
+
+                # MULTI/EXEC so the new key never exists alongside the old one
+                pipe = self.client.pipeline(transaction=True)
+                pipe.set(new_key, value)
+                pipe.delete(old_key)
+                pipe.execute()
                 logger.info("key_migrated", old_key=old_key, new_key=new_key)
                 return True
 
@@ -278,6 +550,26 @@ class StateManager:
             )
             raise
 
+    def _migrate_list(self, old_key: str, new_key: str, transform_fn: Callable[[Any], Any]) -> bool:
+        """Migrate a list key such as agent history, transforming it as a whole.
+
+        ``transform_fn`` receives the decoded entries and must return a list.
+        The caller holds the migration lock.
+        """
+        entries = self.client.lrange(old_key, 0, -1)
+        if not entries:
+            logger.warning("migrate_key_not_found", old_key=old_key)
+            return False
+
+        items = [_dumps(item) for item in transform_fn([_decode(entry) for entry in entries])]
+
+        pipe = self.client.pipeline(transaction=True)
+        self._write_list(pipe, new_key, items)
+        pipe.delete(old_key)
+        pipe.execute()
+        logger.info("key_migrated", old_key=old_key, new_key=new_key)
+        return True
+
     def bulk_migrate(
         self,
         pattern: str,
@@ -286,6 +578,10 @@ class StateManager:
     ) -> int:
         """Bulk migrate keys matching a pattern.
 
+        String keys are migrated with MGET/MSET. List keys, such as agent
+        history, are passed to ``transform_fn`` as a list of decoded entries
+        and written back as a list; keys of other types are skipped.
+
         Args:
             pattern: Redis key pattern (e.g., "agent:*")
             transform_fn: Function to transform values
@@ -296,10 +592,47 @@ class StateManager:
         """
         count = 0
         try:
-            for key in self.client.scan_iter(match=pattern):
-                new_key = new_key_fn(key)
-                if self.migrate_key(key, new_key, transform_fn):
-                    count += 1
+            for keys in self._scan_batches(pattern):
+                # One lock per batch instead of one per key
+                with self.lock(f"migration:{pattern}"):
+                    values = self.client.mget(keys)
+                    mapping: dict[str, str | bytes] = {}
+                    lists: dict[str, list[str | bytes]] = {}
+                    old_keys: list[bytes] = []
+                    unread: list[bytes] = []
+                    for key, raw in zip(keys, values, strict=True):
+                        if raw is None:
+                            unread.append(key)
+                            continue
+                        mapping[new_key_fn(_to_str(key))] = _dumps(transform_fn(_decode(raw)))
+                        old_keys.append(key)
+                    if unread:
+                        # MGET returns nil for lists as well as missing keys;
+                        # LRANGE tells them apart, since Redis has no empty lists
+                        pipe = self.client.pipeline(transaction=False)
+                        for key in unread:
+                            pipe.lrange(key, 0, -1)
+                        replies = pipe.execute(raise_on_error=False)
+                        for key, entries in zip(unread, replies, strict=True):
+                            if isinstance(entries, ResponseError) or not entries:
+                                logger.warning("migrate_key_not_found", old_key=key)
+                                continue
+                            decoded = [_decode(entry) for entry in entries]
+                            lists[new_key_fn(_to_str(key))] = [
+                                _dumps(item) for item in transform_fn(decoded)
+                            ]
+                            old_keys.append(key)
+                    if not old_keys:
+                        continue
+                    # One MSET and one DEL per batch, applied atomically by MULTI/EXEC
+                    pipe = self.client.pipeline(transaction=True)
+                    if mapping:
+                        pipe.mset(mapping)
+                    for new_key, items in lists.items():
+                        self._write_list(pipe, new_key, items)
+                    pipe.delete(*old_keys)
+                    pipe.execute()
+                    count += len(old_keys)
             logger.info("bulk_migration_complete", pattern=pattern, count=count)
             return count
         except Exception as e:
@@ -315,6 +648,9 @@ class StateManager:
     ) -> int:
         """Backup keys matching a pattern.
 
+        String values are copied with MGET/MSET; keys of other types, such as
+        the agent history list, are copied with DUMP/RESTORE.
+
         Args:
             pattern: Redis key pattern
             backup_prefix: Prefix for backup keys
@@ -323,16 +659,44 @@ class StateManager:
             Number of keys backed up
         """
         count = 0
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = _utcnow_iso()
+        # Keys are bytes, so compare and build backup keys as bytes too
+        skip_prefix = backup_prefix.encode()
+        target_prefix = f"{backup_prefix}{timestamp}:".encode()
+        sample_key: bytes | None = None
         try:
-            for key in self.client.scan_iter(match=pattern):
-                if key.startswith(backup_prefix):
+            for batch in self._scan_batches(pattern):
+                keys = [key for key in batch if not key.startswith(skip_prefix)]
+                if not keys:
                     continue
-                value = self.get(key)
-                if value is not None:
-                    backup_key = f"{backup_prefix}{timestamp}:{key}"
-                    self.set(backup_key, value)
-                    count += 1
+                # Values are copied verbatim, no need to decode them
+                values = cast(list[bytes | None], self.client.mget(keys))
+                mapping: dict[bytes, bytes] = {}
+                unread: list[bytes] = []
+                for key, value in zip(keys, values, strict=True):
+                    if value is None:
+                        unread.append(key)
+                    else:
+                        mapping[target_prefix + key] = value
+                if mapping:
+                    # One MSET per batch instead of one SET per key
+                    self.client.mset(mapping)
+                    count += len(mapping)
+                    sample_key = sample_key or next(iter(mapping))
+                if unread:
+                    payloads = {
+                        target_prefix + key: payload
+                        for key, payload in zip(unread, self._dump_many(unread), strict=True)
+                        if payload is not None
+                    }
+                    if payloads:
+                        self._restore_many(payloads, replace=True)
+                        count += len(payloads)
+                        sample_key = sample_key or next(iter(payloads))
+            if sample_key is not None:
+                # Lets list_backups() find timestamps without scanning every
+                # backup key, and check one key to confirm the backup still exists
+                self.client.hset(self._backup_index_key(backup_prefix), timestamp, sample_key)
             logger.info("backup_complete", pattern=pattern, count=count)
             return count
         except Exception as e:
@@ -357,19 +721,48 @@ class StateManager:
         """
         count = 0
         pattern = f"{backup_prefix}{backup_timestamp}:*"
+        # Every matched key starts with the backup prefix, so strip it by length
+        prefix_len = len(f"{backup_prefix}{backup_timestamp}:".encode())
         try:
-            for backup_key in self.client.scan_iter(match=pattern):
-                original_key = backup_key.replace(f"{backup_prefix}{backup_timestamp}:", "", 1)
-                if not overwrite and self.exists(original_key):
-                    logger.warning(
-                        "restore_skip_existing",
-                        key=original_key,
-                    )
-                    continue
-                value = self.get(backup_key)
-                if value is not None:
-                    self.set(original_key, value)
-                    count += 1
+            for backup_keys in self._scan_batches(pattern):
+                original_keys = [key[prefix_len:] for key in backup_keys]
+                existing = [False] * len(original_keys)
+                if not overwrite:
+                    pipe = self.client.pipeline(transaction=False)
+                    for original_key in original_keys:
+                        pipe.exists(original_key)
+                    existing = [bool(found) for found in pipe.execute()]
+                values = cast(list[bytes | None], self.client.mget(backup_keys))
+
+                mapping: dict[bytes, bytes] = {}
+                unread: dict[bytes, bytes] = {}
+                for backup_key, original_key, value, exists in zip(
+                    backup_keys, original_keys, values, existing, strict=True
+                ):
+                    if exists:
+                        logger.warning(
+                            "restore_skip_existing",
+                            key=_to_str(original_key),
+                        )
+                        continue
+                    if value is not None:
+                        mapping[original_key] = value
+                    else:
+                        unread[backup_key] = original_key
+                if mapping:
+                    self.client.mset(mapping)
+                    count += len(mapping)
+                if unread:
+                    # Non-string backups, such as history lists, were saved with DUMP
+                    dumped = self._dump_many(list(unread))
+                    payloads = {
+                        original_key: payload
+                        for original_key, payload in zip(unread.values(), dumped, strict=True)
+                        if payload is not None
+                    }
+                    if payloads:
+                        self._restore_many(payloads, replace=overwrite)
+                        count += len(payloads)
             logger.info(
                 "restore_complete",
                 timestamp=backup_timestamp,
@@ -387,25 +780,91 @@ class StateManager:
     def list_backups(self, backup_prefix: str = "backup:") -> list[str]:
         """List available backup timestamps.
 
+        Timestamps are read from the backup index. Backups made before the
+        index existed are added to it by a one-off scan, and entries whose
+        backup keys have all been deleted are dropped.
+
         Args:
             backup_prefix: Prefix used for backup keys
 
         Returns:
             List of backup timestamps
         """
-        timestamps: set[str] = set()
-        pattern = f"{backup_prefix}*"
+        index_key = self._backup_index_key(backup_prefix)
         try:
-            for key in self.client.scan_iter(match=pattern):
-                # Extract timestamp from key
-                parts = key.split(":", 2)
-                if len(parts) >= 2:
-                    timestamps.add(parts[1])
-            return sorted(timestamps, reverse=True)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.exists(f"{index_key}:backfilled")
+            pipe.hgetall(index_key)
+            backfilled, index = pipe.execute()
+            if not backfilled:
+                index = {**self._backfill_backup_index(backup_prefix), **index}
+            if index:
+                index = self._prune_backup_index(backup_prefix, index)
+            return sorted((_to_str(timestamp) for timestamp in index), reverse=True)
         except Exception as e:
             logger.error("list_backups_error", error=str(e))
             raise
 
+    def _backfill_backup_index(self, backup_prefix: str) -> dict[bytes, bytes]:
+        """Scan once for backups missing from the index and add them to it.
+
+        Returns:
+            Mapping of each timestamp found to one of its backup keys
+        """
+        index_key = self._backup_index_key(backup_prefix)
+        index_key_bytes = index_key.encode()
+        prefix_len = len(backup_prefix.encode())
+        found: dict[bytes, bytes] = {}
+        for key in self.client.scan_iter(match=f"{backup_prefix}*", count=self.SCAN_COUNT):
+            if key.startswith(index_key_bytes):
+                continue
+            rest = key[prefix_len:]
+            match = _BACKUP_TIMESTAMP.match(rest)
+            found.setdefault(match.group(1) if match else rest.partition(b":")[0], key)
+
+        pipe = self.client.pipeline(transaction=False)
+        if found:
+            # Mapping is invariant in its key type, so widen it to hset's field type
+            pipe.hset(index_key, mapping=cast(Mapping[FieldT, EncodableT], found))
+        pipe.set(f"{index_key}:backfilled", 1)
+        pipe.execute()
+        return found
+
+    def _prune_backup_index(
+        self, backup_prefix: str, index: dict[bytes, bytes]
+    ) -> dict[bytes, bytes]:
+        """Drop index entries whose backup keys no longer exist.
+
+        Each entry records one key of its backup, so one pipelined EXISTS
+        checks every backup; a backup is only scanned when that key is gone.
+
+        Returns:
+            The entries that are still live
+        """
+        index_key = self._backup_index_key(backup_prefix)
+        pipe = self.client.pipeline(transaction=False)
+        for sample_key in index.values():
+            pipe.exists(sample_key)
+        live: dict[bytes, bytes] = {}
+        for (timestamp, sample_key), exists in zip(index.items(), pipe.execute(), strict=True):
+            if exists:
+                live[timestamp] = sample_key
+                continue
+            pattern = backup_prefix.encode() + timestamp + b":*"
+            other = next(self.client.scan_iter(match=pattern, count=self.SCAN_COUNT), None)
+            if other is None:
+                self.client.hdel(index_key, timestamp)
+                logger.info("backup_index_pruned", timestamp=_to_str(timestamp))
+            else:
+                self.client.hset(index_key, timestamp, other)
+                live[timestamp] = other
+        return live
+
+    @staticmethod
+    def _backup_index_key(backup_prefix: str) -> str:
+        """Get the key of the hash mapping backup timestamps to one of their keys."""
+        return f"{backup_prefix}index"
+
     # Monitoring and Metrics
 
     def get_metrics(self) -> dict[str, Any]:
@@ -434,14 +893,23 @@ class StateManager:
     def health_check(self) -> bool:
         """Check if Redis is healthy and responsive.
 
+        A successful PING is reused for HEALTH_CHECK_TTL seconds, so frequent
+        callers do not add a round trip each time. Failures are never cached.
+
         Returns:
             True if healthy
         """
+        now = time.monotonic()
+        if now - self._last_ping_at < self.HEALTH_CHECK_TTL:
+            return True
         try:
-            return self.client.ping()
+            healthy = bool(self.client.ping())
         except Exception as e:
             logger.error("health_check_failed", error=str(e))
             return False
+        if healthy:
+            self._last_ping_at = now
+        return healthy
 
 
 # Agent-specific state helpers
@@ -450,6 +918,9 @@ class StateManager:
 class AgentState:
     """Helper class for agent-specific state management."""
 
+    # Number of events kept in the capped history list
+    HISTORY_LIMIT = 100
+
     def __init__(self, state_manager: StateManager, agent_id: str):
         """Initialize agent state helper.
 
@@ -460,30 +931,51 @@ class AgentState:
         self.state_manager = state_manager
         self.agent_id = agent_id
         self.prefix = f"agent:{agent_id}"
+        # Byte length of "<prefix>:", for slicing field names off scanned keys
+        self._field_offset = len(f"{self.prefix}:".encode())
+        # Keys of the fields this helper reads and writes, built once
+        self._keys = {
+            name: f"{self.prefix}:{name}" for name in ("status", "current_task", "history")
+        }
+        # Scanned keys are bytes, so get_state compares against this form
+        self._history_key_bytes = self._keys["history"].encode()
+        # Closing part of every status payload; only status and timestamp vary
+        self._status_suffix = f',"agent_id":{json.dumps(agent_id)}}}'
 
     def _key(self, name: str) -> str:
         """Generate a namespaced key for this agent."""
-        return f"{self.prefix}:{name}"
+        key = self._keys.get(name)
+        return key if key is not None else f"{self.prefix}:{name}"
 
     def get_state(self) -> dict[str, Any]:
         """Get all state for this agent."""
         pattern = f"{self.prefix}:*"
-        state = {}
-        for key in self.state_manager.client.scan_iter(match=pattern):
-            name = key.replace(f"{self.prefix}:", "", 1)
-            state[name] = self.state_manager.get(key)
+        history_key = self._history_key_bytes
+        state: dict[str, Any] = {}
+        for batch in self.state_manager._scan_batches(pattern):
+            # History is a Redis list rather than a JSON string
+            if history_key in batch:
+                state["history"] = self.get_history()
+            keys = [key for key in batch if key != history_key]
+            if not keys:
+                continue
+            # One MGET per scanned batch instead of one GET per key
+            values = self.state_manager.client.mget(keys)
+            for key, value in zip(keys, values, strict=True):
+                if value is not None:
+                    state[_to_str(key[self._field_offset :])] = _decode(value)
         return state
 
     def set_status(self, status: str) -> bool:
-        """Set agent status."""
-        return self.state_manager.set(
-            self._key("status"),
-            {
-                "status": status,
-                "timestamp": datetime.utcnow().isoformat(),
-                "agent_id": self.agent_id,
-            },
+        """Set agent status.
+
+        The payload has a fixed shape, so it is assembled directly rather than
+        built as a dict and serialized.
+        """
+        payload = (
+            f'{{"status":{json.dumps(status)},"timestamp":"{_utcnow_iso()}"{self._status_suffix}'
         )
+        return self.state_manager.set_raw(self._key("status"), payload)
 
     def get_status(self) -> dict[str, Any] | None:
         """Get agent status."""
@@ -496,7 +988,7 @@ class AgentState:
             {
                 "task_id": task_id,
                 "task_data": task_data,
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at": _utcnow_iso(),
             },
         )
 
@@ -505,17 +997,70 @@ class AgentState:
         return self.state_manager.delete(self._key("current_task"))
 
     def add_to_history(self, event: dict[str, Any]) -> bool:
-        """Add an event to agent history."""
-        key = self._key("history")
-        history = self.state_manager.get(key) or []
-        history.append(
+        """Add an event to agent history.
+
+        History is a capped Redis list, so appending is O(1) and safe under
+        concurrent writers.
+        """
+        entry = _dumps(
             {
                 **event,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utcnow_iso(),
                 "agent_id": self.agent_id,
             }
         )
-        # Keep only last 100 events
-        if len(history) > 100:
-            history = history[-100:]
-        return self.state_manager.set(key, history)
+        key = self._key("history")
+
+        def append() -> None:
+            # Both commands go in one round trip; no MULTI/EXEC needed since a
+            # list briefly over the cap is harmless
+            pipe = self.state_manager.client.pipeline(transaction=False)
+            pipe.rpush(key, entry)
+            # Keep only the most recent events
+            pipe.ltrim(key, -self.HISTORY_LIMIT, -1)
+            pipe.execute()
+
+        try:
+            append()
+        except ResponseError as e:
+            if not _is_wrong_type(e):
+                raise
+            self._convert_legacy_history()
+            # execute() resets the pipeline, so the commands are queued again
+            append()
+        return True
+
+    def get_history(self) -> list[dict[str, Any]]:
+        """Get agent history, oldest event first."""
+        key = self._key("history")
+        try:
+            entries = self.state_manager.client.lrange(key, 0, -1)
+        except ResponseError as e:
+            if not _is_wrong_type(e):
+                raise
+            self._convert_legacy_history()
+            entries = self.state_manager.client.lrange(key, 0, -1)
+        return [_decode(entry) for entry in entries]
+
+    def _convert_legacy_history(self) -> None:
+        """Convert history stored as a JSON array string into a Redis list.
+
+        Earlier versions kept the whole history in one string value, which
+        list commands reject with WRONGTYPE. The key is watched so a
+        concurrent conversion or write is not overwritten.
+        """
+        key = self._key("history")
+
+        def convert(pipe: Any) -> None:
+            if pipe.type(key) != b"string":
+                return
+            events = _decode(pipe.get(key))
+            if not isinstance(events, list):
+                events = []
+            pipe.multi()
+            self.state_manager._write_list(
+                pipe, key, [_dumps(event) for event in events[-self.HISTORY_LIMIT :]]
+            )
+
+        self.state_manager.client.transaction(convert, key)
+        logger.info("legacy_history_converted", agent_id=self.agent_id)
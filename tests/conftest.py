@@ -1,4 +1,8 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+Tests write files under pytest's ``tmp_path``, which honours ``TMPDIR``;
+pointing it at a tmpfs mount in CI keeps that I/O in memory.
+"""
 
 from pathlib import Path
 
@@ -13,10 +17,13 @@ def project_root():
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
-def temp_config(tmp_path):
-    """Create a temporary configuration file."""
-    config_file = tmp_path / "config.yaml"
+@pytest.fixture(scope="session")
+def temp_config(tmp_path_factory):
+    """Create a temporary configuration file shared by the whole session.
+
+    Tests must treat the file as read-only.
+    """
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
     config_file.write_text(
         """
 github:
@@ -1,6 +1,9 @@
 """Tests for Claude API client."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import json
+from typing import Any
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
@@ -13,9 +16,56 @@ from entropy_playground.ai.claude import (
     ClaudeRequest,
     ClaudeResponse,
     MockClaudeClient,
+    _SharedTransport,
 )
 
 
+class AsyncStub:
+    """Lightweight async callable returning (or raising) queued results.
+
+    The last result is reused once the queue is exhausted.
+    """
+
+    def __init__(self, *results: Any) -> None:
+        self._results = results
+        self.call_count = 0
+        self.call_args: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        result = self._results[min(self.call_count, len(self._results) - 1)]
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+# Shared API response payload; tests must not mutate it
+RESPONSE_DATA = {
+    "id": "msg_123",
+    "type": "message",
+    "role": "assistant",
+    "content": [{"type": "text", "text": "Hello!"}],
+    "model": "claude-3-opus-20240229",
+    "usage": {"input_tokens": 10, "output_tokens": 5},
+}
+
+
+@pytest.fixture(scope="class")
+def valid_messages():
+    """Build a valid request message list once per test class."""
+    return [ClaudeMessage(role="user", content="Hello")]
+
+
+@pytest.fixture(scope="class")
+def shared_client():
+    """Create one client with a mocked transport per test class."""
+    with patch("entropy_playground.ai.claude.httpx.AsyncClient"):
+        client = ClaudeClient(api_key="test-key")
+        client._client.aclose = AsyncStub(None)
+        yield client
+
+
 class TestClaudeMessage:
     """Test ClaudeMessage model."""
 
@@ -44,23 +94,19 @@ class TestClaudeRequest:
         assert request.temperature == 0.7
         assert request.stream is False
 
-    def test_validation_constraints(self):
-        """Test validation constraints."""
-        messages = [ClaudeMessage(role="user", content="Hello")]
-
-        # Test max_tokens constraints
-        with pytest.raises(ValidationError):
-            ClaudeRequest(messages=messages, max_tokens=0)
-
-        with pytest.raises(ValidationError):
-            ClaudeRequest(messages=messages, max_tokens=300000)
-
-        # Test temperature constraints
-        with pytest.raises(ValidationError):
-            ClaudeRequest(messages=messages, temperature=-0.1)
-
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_tokens": 0},
+            {"max_tokens": 300000},
+            {"temperature": -0.1},
+            {"temperature": 1.1},
+        ],
+    )
+    def test_validation_constraints(self, kwargs, valid_messages):
+        """Test max_tokens and temperature constraints."""
         with pytest.raises(ValidationError):
-            ClaudeRequest(messages=messages, temperature=1.1)
+            ClaudeRequest(messages=valid_messages, **kwargs)
 
 
 class TestClaudeResponse:
@@ -68,16 +114,7 @@ class TestClaudeResponse:
 
     def test_valid_response(self):
         """Test creating valid response."""
-        response_data = {
-            "id": "msg_123",
-            "type": "message",
-            "role": "assistant",
-            "content": [{"type": "text", "text": "Hello!"}],
-            "model": "claude-3-opus-20240229",
-            "usage": {"input_tokens": 10, "output_tokens": 5},
-        }
-
-        response = ClaudeResponse(**response_data)
+        response = ClaudeResponse(**RESPONSE_DATA)
         assert response.id == "msg_123"
         assert response.role == "assistant"
         assert response.usage["input_tokens"] == 10
@@ -87,10 +124,12 @@ class TestClaudeClient:
     """Test ClaudeClient."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock HTTP client."""
-        with patch("entropy_playground.ai.claude.httpx.AsyncClient") as mock:
-            yield mock
+    def client(self, shared_client):
+        """Reset the shared client's state for a test."""
+        shared_client.reset_usage()
+        # Retries are exercised without waiting between attempts
+        shared_client.RETRY_DELAY = 0
+        return shared_client
 
     def test_init_with_api_key(self):
         """Test initialization with API key."""
@@ -109,25 +148,13 @@ class TestClaudeClient:
             client = ClaudeClient()
             assert client.api_key == "env-key"
 
-    @pytest.mark.asyncio
-    async def test_successful_request(self, mock_client):
+    async def test_successful_request(self, client):
         """Test successful API request."""
         # Mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": "msg_123",
-            "type": "message",
-            "role": "assistant",
-            "content": [{"type": "text", "text": "Hello!"}],
-            "model": "claude-3-opus-20240229",
-            "usage": {"input_tokens": 10, "output_tokens": 5},
-        }
-
-        mock_client.return_value.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.aclose = AsyncMock()
-
-        client = ClaudeClient(api_key="test-key")
+        mock_response.json.return_value = RESPONSE_DATA
+        client._client.post = AsyncStub(mock_response)
 
         messages = [{"role": "user", "content": "Hello"}]
         response = await client.create_message(messages)
@@ -137,19 +164,35 @@ class TestClaudeClient:
         assert client.get_usage()["requests"] == 1
         assert client.get_usage()["total_tokens"] == 15
 
-        await client.close()
+    async def test_request_payload_is_serialized_json(self, client):
+        """Test the request body is sent as pre-serialized JSON bytes."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = RESPONSE_DATA
+        client._client.post = AsyncStub(mock_response)
+
+        await client.create_message([{"role": "user", "content": "Hello"}])
 
-    @pytest.mark.asyncio
-    async def test_api_error(self, mock_client):
+        _, kwargs = client._client.post.call_args
+        body = json.loads(kwargs["content"])
+        assert body["messages"] == [{"role": "user", "content": "Hello"}]
+        assert "system" not in body
+
+    async def test_invalid_message_dict(self, client):
+        """Test dict messages are validated when building the request."""
+        client._client.post = AsyncStub(None)
+
+        with pytest.raises(ValidationError):
+            await client.create_message([{"role": "invalid", "content": "Hello"}])
+
+        assert client._client.post.call_count == 0
+
+    async def test_api_error(self, client):
         """Test API error handling."""
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad request"
-
-        mock_client.return_value.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.aclose = AsyncMock()
-
-        client = ClaudeClient(api_key="test-key")
+        client._client.post = AsyncStub(mock_response)
 
         messages = [{"role": "user", "content": "Hello"}]
 
@@ -157,10 +200,8 @@ class TestClaudeClient:
             await client.create_message(messages)
 
         assert exc_info.value.status_code == 400
-        await client.close()
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_retry(self, mock_client):
+    async def test_rate_limiting_retry(self, client):
         """Test rate limiting retry logic."""
         # First request: rate limited
         rate_limited_response = Mock()
@@ -171,80 +212,52 @@ class TestClaudeClient:
         # Second request: success
         success_response = Mock()
         success_response.status_code = 200
-        success_response.json.return_value = {
-            "id": "msg_123",
-            "type": "message",
-            "role": "assistant",
-            "content": [{"type": "text", "text": "Hello!"}],
-            "model": "claude-3-opus-20240229",
-            "usage": {"input_tokens": 10, "output_tokens": 5},
-        }
-
-        mock_client.return_value.post = AsyncMock(
-            side_effect=[rate_limited_response, success_response]
-        )
-        mock_client.return_value.aclose = AsyncMock()
+        success_response.json.return_value = RESPONSE_DATA
 
-        client = ClaudeClient(api_key="test-key")
+        client._client.post = AsyncStub(rate_limited_response, success_response)
 
         messages = [{"role": "user", "content": "Hello"}]
         response = await client.create_message(messages)
 
         assert response.id == "msg_123"
-        assert mock_client.return_value.post.call_count == 2
+        assert client._client.post.call_count == 2
 
-        await client.close()
-
-    @pytest.mark.asyncio
-    async def test_timeout_error(self, mock_client):
+    async def test_timeout_error(self, client):
         """Test timeout error handling."""
-        mock_client.return_value.post = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
-        mock_client.return_value.aclose = AsyncMock()
-
-        client = ClaudeClient(api_key="test-key")
+        client._client.post = AsyncStub(httpx.TimeoutException("Timeout"))
 
         messages = [{"role": "user", "content": "Hello"}]
 
         with pytest.raises(ClaudeError, match="Request timeout"):
             await client.create_message(messages)
 
-        await client.close()
+        assert client._client.post.call_count == client.max_retries
 
-    @pytest.mark.asyncio
-    async def test_request_error(self, mock_client):
+    async def test_request_error(self, client):
         """Test request error handling."""
-        mock_client.return_value.post = AsyncMock(
-            side_effect=httpx.RequestError("Connection failed")
-        )
-        mock_client.return_value.aclose = AsyncMock()
-
-        client = ClaudeClient(api_key="test-key")
+        client._client.post = AsyncStub(httpx.RequestError("Connection failed"))
 
         messages = [{"role": "user", "content": "Hello"}]
 
         with pytest.raises(ClaudeError, match="Request failed"):
             await client.create_message(messages)
 
-        await client.close()
-
-    @pytest.mark.asyncio
-    async def test_validation_error(self, mock_client):
+    async def test_validation_error(self, client):
         """Test response validation error."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"invalid": "response"}
-
-        mock_client.return_value.post = AsyncMock(return_value=mock_response)
-        mock_client.return_value.aclose = AsyncMock()
-
-        client = ClaudeClient(api_key="test-key")
+        client._client.post = AsyncStub(mock_response)
 
         messages = [{"role": "user", "content": "Hello"}]
 
         with pytest.raises(ClaudeError, match="Invalid response format"):
             await client.create_message(messages)
 
+    async def test_close(self, client):
+        """Test closing the client closes the HTTP transport."""
         await client.close()
+        assert client._client.aclose.call_count >= 1
 
     def test_usage_tracking(self):
         """Test usage tracking."""
@@ -270,10 +283,64 @@ class TestClaudeClient:
         assert usage["requests"] == 0
 
 
+class TestSharedTransport:
+    """Test the connection pools shared by ClaudeClient instances."""
+
+    @pytest.fixture
+    def transport(self):
+        """Install an empty shared transport whose pools are mocks."""
+        transport = _SharedTransport()
+
+        def make_pool(**kwargs):
+            pool = Mock()
+            pool.handle_async_request = AsyncStub("response")
+            pool.aclose = AsyncStub(None)
+            return pool
+
+        with (
+            patch("entropy_playground.ai.claude._SHARED_TRANSPORT", transport),
+            patch("entropy_playground.ai.claude.httpx.AsyncHTTPTransport", side_effect=make_pool),
+        ):
+            yield transport
+
+    async def test_clients_share_pool(self, transport):
+        """Test clients on one loop share a pool closed by the last client."""
+        first = ClaudeClient(api_key="test-key")
+        second = ClaudeClient(api_key="test-key")
+        assert first._client.headers["x-api-key"] == "test-key"
+        assert first._client.headers["anthropic-version"] == "2023-06-01"
+
+        assert await first._client._transport.handle_async_request(Mock()) == "response"
+        assert await second._client._transport.handle_async_request(Mock()) == "response"
+        assert len(transport._pools) == 1
+        pool, refs = next(iter(transport._pools.values()))
+        assert refs == 2
+
+        # Closing one client leaves the pool open for the other
+        await first.close()
+        assert pool.aclose.call_count == 0
+        assert await second._client._transport.handle_async_request(Mock()) == "response"
+
+        await second.close()
+        assert pool.aclose.call_count == 1
+        assert transport._pools == {}
+
+    def test_pools_released_across_event_loops(self, transport):
+        """Test each asyncio.run() leaves no pool behind once clients close."""
+
+        async def use_client():
+            async with ClaudeClient(api_key="test-key") as client:
+                await client._client._transport.handle_async_request(Mock())
+                assert len(transport._pools) == 1
+
+        for _ in range(3):
+            asyncio.run(use_client())
+        assert transport._pools == {}
+
+
 class TestMockClaudeClient:
     """Test MockClaudeClient."""
 
-    @pytest.mark.asyncio
     async def test_mock_response(self):
         """Test mock response generation."""
         client = MockClaudeClient()
@@ -285,7 +352,6 @@ class TestMockClaudeClient:
         assert response.content[0]["text"] == "Hello, world!"
         assert client.get_usage()["requests"] == 1
 
-    @pytest.mark.asyncio
     async def test_mock_error(self):
         """Test mock error handling."""
         client = MockClaudeClient()
@@ -296,7 +362,6 @@ class TestMockClaudeClient:
         with pytest.raises(ClaudeError, match="Mock error"):
             await client.create_message(messages)
 
-    @pytest.mark.asyncio
     async def test_default_response(self):
         """Test default mock response."""
         client = MockClaudeClient()
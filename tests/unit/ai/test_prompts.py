@@ -12,6 +12,9 @@ from entropy_playground.ai.prompts import (
     create_conversation,
 )
 
+# Shared by tests that do not register their own strategies
+ENGINEER = PromptEngineer()
+
 
 class TestPromptTemplate:
     """Test PromptTemplate model."""
@@ -79,6 +82,47 @@ class TestPromptTemplate:
         assert "- Include tests" in result["task"]
         assert "- Add documentation" in result["task"]
 
+    def test_static_sections_not_substituted(self):
+        """Test output format and constraints are appended without substitution."""
+        template = PromptTemplate(
+            role=AgentRole.CODER,
+            system_prompt="System prompt",
+            task_prompt="Task {name}",
+            output_format="{json}",
+            constraints=["Follow PEP 8"],
+        )
+
+        first = template.format(name="one")
+        second = template.format(name="two")
+
+        assert first["task"] == "Task one\n\nOutput Format:\n{json}\n\nConstraints:\n- Follow PEP 8"
+        assert second["task"].startswith("Task two")
+
+    def test_static_sections_follow_changes(self):
+        """Test copied, reassigned and modified templates render their own sections."""
+        template = PromptTemplate(
+            role=AgentRole.CODER,
+            system_prompt="System prompt",
+            task_prompt="Task",
+            constraints=["Follow PEP 8"],
+        )
+        template.format()
+
+        copy = template.model_copy(update={"constraints": ["Include tests"]})
+        assert copy.format()["task"] == "Task\n\nConstraints:\n- Include tests"
+        assert template.format()["task"] == "Task\n\nConstraints:\n- Follow PEP 8"
+
+        template.output_format = "JSON"
+        template.constraints.append("Add documentation")
+        assert template.format()["task"] == (
+            "Task\n\nOutput Format:\nJSON\n\nConstraints:\n- Follow PEP 8\n- Add documentation"
+        )
+
+        constructed = PromptTemplate.model_construct(
+            role=AgentRole.CODER, system_prompt="", task_prompt="Task", output_format="JSON"
+        )
+        assert constructed.format()["task"] == "Task\n\nOutput Format:\nJSON"
+
 
 class TestIssueReaderPromptStrategy:
     """Test IssueReaderPromptStrategy."""
@@ -103,6 +147,18 @@ class TestIssueReaderPromptStrategy:
         assert "json" in template.output_format.lower()
         assert len(template.constraints) > 0
 
+    def test_template_is_built_once(self):
+        """Test the template is built once and callers get independent copies."""
+        first = IssueReaderPromptStrategy().generate_prompt({})
+        first.constraints.append("Changed by the caller")
+        first.task_prompt = "Changed"
+        second = IssueReaderPromptStrategy().generate_prompt({"issue_number": 1})
+
+        assert second is not first
+        assert IssueReaderPromptStrategy._template.cache_info().currsize == 1
+        assert second.task_prompt.startswith("Analyze the following GitHub issue")
+        assert "Changed by the caller" not in second.constraints
+
     def test_formatted_prompt(self):
         """Test formatted prompt includes context."""
         strategy = IssueReaderPromptStrategy()
@@ -213,7 +269,6 @@ class TestPromptEngineer:
 
     def test_create_prompt_issue_reader(self):
         """Test creating prompt for issue reader."""
-        engineer = PromptEngineer()
         context = {
             "issue_number": 123,
             "issue_title": "Test issue",
@@ -222,7 +277,7 @@ class TestPromptEngineer:
             "issue_body": "Issue description",
         }
 
-        result = engineer.create_prompt(AgentRole.ISSUE_READER, context)
+        result = ENGINEER.create_prompt(AgentRole.ISSUE_READER, context)
 
         assert "system" in result
         assert "task" in result
@@ -231,7 +286,6 @@ class TestPromptEngineer:
 
     def test_create_prompt_coder(self):
         """Test creating prompt for coder."""
-        engineer = PromptEngineer()
         context = {
             "task_description": "Add feature",
             "task_type": "implementation",
@@ -240,7 +294,7 @@ class TestPromptEngineer:
             "requirements": "requirements",
         }
 
-        result = engineer.create_prompt(AgentRole.CODER, context)
+        result = ENGINEER.create_prompt(AgentRole.CODER, context)
 
         assert "system" in result
         assert "task" in result
@@ -249,7 +303,6 @@ class TestPromptEngineer:
 
     def test_create_prompt_reviewer(self):
         """Test creating prompt for reviewer."""
-        engineer = PromptEngineer()
         context = {
             "pr_title": "PR title",
             "pr_author": "author",
@@ -257,7 +310,7 @@ class TestPromptEngineer:
             "code_diff": "diff",
         }
 
-        result = engineer.create_prompt(AgentRole.REVIEWER, context)
+        result = ENGINEER.create_prompt(AgentRole.REVIEWER, context)
 
         assert "system" in result
         assert "task" in result
@@ -266,10 +319,8 @@ class TestPromptEngineer:
 
     def test_unsupported_role(self):
         """Test error for unsupported role."""
-        engineer = PromptEngineer()
-
         with pytest.raises(ValueError, match="Unsupported role"):
-            engineer.create_prompt("invalid_role", {})
+            ENGINEER.create_prompt("invalid_role", {})
 
     def test_add_custom_strategy(self):
         """Test adding custom strategy."""
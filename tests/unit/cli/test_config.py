@@ -1,8 +1,9 @@
 """Tests for configuration management."""
 
-import os
+import io
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -17,26 +18,30 @@ from entropy_playground.infrastructure.config import (
 class TestGitHubConfig:
     """Test GitHub configuration."""
 
-    def test_token_expansion(self):
+    def test_token_expansion(self, monkeypatch):
         """Test environment variable expansion in token."""
-        os.environ["TEST_TOKEN"] = "my-secret-token"
+        monkeypatch.setenv("TEST_TOKEN", "my-secret-token")
 
         config = GitHubConfig(token="${TEST_TOKEN}")
         assert config.token == "my-secret-token"
 
-        # Clean up
-        del os.environ["TEST_TOKEN"]
-
     def test_token_no_expansion(self):
         """Test token without environment variable."""
         config = GitHubConfig(token="plain-token")
         assert config.token == "plain-token"
 
-    def test_token_missing_env(self):
+    def test_token_missing_env(self, monkeypatch):
         """Test token with missing environment variable."""
+        monkeypatch.delenv("MISSING_TOKEN", raising=False)
         config = GitHubConfig(token="${MISSING_TOKEN}")
         assert config.token == "${MISSING_TOKEN}"
 
+    def test_token_embedded_placeholder_not_expanded(self, monkeypatch):
+        """Test only a token that is entirely a placeholder is expanded."""
+        monkeypatch.setenv("TEST_TOKEN", "my-secret-token")
+        config = GitHubConfig(token="prefix-${TEST_TOKEN}")
+        assert config.token == "prefix-${TEST_TOKEN}"
+
 
 class TestAgentConfig:
     """Test agent configuration."""
@@ -70,6 +75,15 @@ class TestConfig:
         assert config.agents.coder.enabled is True
         assert config.agents.reviewer.enabled is True
 
+    def test_defaults_not_shared(self):
+        """Test default sub-configurations are independent per instance."""
+        first = Config()
+        second = Config()
+
+        first.agents.coder.enabled = False
+        assert second.agents.coder.enabled is True
+        assert first.github is not second.github
+
     def test_from_file(self):
         """Test loading configuration from file."""
         config_data = {
@@ -100,27 +114,46 @@ class TestConfig:
         finally:
             config_path.unlink()
 
+    def test_from_file_reuses_parse_until_changed(self, tmp_path):
+        """Test an unchanged file is parsed once and an edit is picked up."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("version: 1.0.0\n")
+
+        with patch("entropy_playground.infrastructure.config.yaml.load", wraps=yaml.load) as load:
+            first = Config.from_file(config_path)
+            second = Config.from_file(config_path)
+            assert load.call_count == 1
+
+            config_path.write_text("version: 1.0.10\n")
+            assert Config.from_file(config_path).version == "1.0.10"
+            assert load.call_count == 2
+
+        assert first is not second
+        assert first.version == second.version == "1.0.0"
+
+    def test_from_stream(self):
+        """Test loading configuration from an in-memory stream."""
+        stream = io.StringIO(yaml.dump({"version": "1.0.0", "github": {"token": "test-token"}}))
+
+        config = Config.from_stream(stream)
+        assert config.version == "1.0.0"
+        assert config.github.token == "test-token"
+
     def test_from_file_not_found(self):
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
             Config.from_file(Path("/non/existent/file.yaml"))
 
-    def test_from_env(self):
+    def test_from_env(self, monkeypatch):
         """Test creating configuration from environment."""
-        os.environ["ENTROPY_WORKSPACE"] = "/env/workspace"
-        os.environ["REDIS_URL"] = "redis://env:6379"
-        os.environ["GITHUB_TOKEN"] = "env-token"
+        monkeypatch.setenv("ENTROPY_WORKSPACE", "/env/workspace")
+        monkeypatch.setenv("REDIS_URL", "redis://env:6379")
+        monkeypatch.setenv("GITHUB_TOKEN", "env-token")
 
-        try:
-            config = Config.from_env()
-            assert config.workspace == Path("/env/workspace")
-            assert config.redis_url == "redis://env:6379"
-            assert config.github.token == "env-token"
-        finally:
-            # Clean up
-            for key in ["ENTROPY_WORKSPACE", "REDIS_URL", "GITHUB_TOKEN"]:
-                if key in os.environ:
-                    del os.environ[key]
+        config = Config.from_env()
+        assert config.workspace == Path("/env/workspace")
+        assert config.redis_url == "redis://env:6379"
+        assert config.github.token == "env-token"
 
     def test_save(self):
         """Test saving configuration to file."""
@@ -144,6 +177,18 @@ class TestConfig:
             assert data["workspace"] == "/save/test"
             assert data["redis_url"] == "redis://save:6379"
 
+    def test_save_to_stream_round_trip(self):
+        """Test saving to and loading from an in-memory stream."""
+        config = Config(version="2.0.0", workspace=Path("/save/test"))
+
+        stream = io.StringIO()
+        config.save_to_stream(stream)
+        stream.seek(0)
+
+        loaded = Config.from_stream(stream)
+        assert loaded.version == "2.0.0"
+        assert loaded.workspace == Path("/save/test")
+
     def test_validate_github_token(self):
         """Test GitHub token validation."""
         # Valid token
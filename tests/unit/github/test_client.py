@@ -2,28 +2,84 @@
 Unit tests for GitHub API client.
 """
 
-import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 from github import GithubException, RateLimitExceededException
+from github.Repository import Repository
 
 from entropy_playground.github.client import GitHubClient, GitHubTokenManager
 
+# A token in the expected GitHub format
+VALID_TOKEN = "ghp_" + "x" * 36
+
+# (client method, repository method, positional args, keyword args); the
+# client is called with "owner/repo" first and passes the rest through
+REPO_CALLS = [
+    pytest.param("get_issue", "get_issue", (123,), {}, id="get_issue"),
+    pytest.param(
+        "list_issues",
+        "get_issues",
+        (),
+        {
+            "state": "open",
+            "labels": ["bug", "enhancement"],
+            "assignee": "user123",
+            "sort": "updated",
+            "direction": "asc",
+        },
+        id="list_issues",
+    ),
+    pytest.param(
+        "create_issue",
+        "create_issue",
+        (),
+        {"title": "Test Issue", "body": "Issue body", "labels": ["bug"], "assignees": ["user123"]},
+        id="create_issue",
+    ),
+    pytest.param(
+        "create_pull_request",
+        "create_pull",
+        (),
+        {
+            "title": "Test PR",
+            "body": "PR body",
+            "head": "feature-branch",
+            "base": "main",
+            "draft": True,
+        },
+        id="create_pull_request",
+    ),
+    pytest.param("get_pull_request", "get_pull", (456,), {}, id="get_pull_request"),
+    pytest.param(
+        "list_pull_requests",
+        "get_pulls",
+        (),
+        {
+            "state": "closed",
+            "sort": "popularity",
+            "direction": "desc",
+            "base": "main",
+            "head": "owner:feature",
+        },
+        id="list_pull_requests",
+    ),
+]
+
 
 class TestGitHubTokenManager:
     """Test cases for GitHubTokenManager."""
 
     def test_init_with_token(self):
         """Test initialization with explicit token."""
-        token = "ghp_" + "x" * 36  # Valid format
+        token = VALID_TOKEN
         manager = GitHubTokenManager(token)
         assert manager.get_token() == token
 
     def test_init_with_env_var(self, monkeypatch):
         """Test initialization from environment variable."""
-        token = "ghp_" + "x" * 36
+        token = VALID_TOKEN
         monkeypatch.setenv("GITHUB_TOKEN", token)
         manager = GitHubTokenManager()
         assert manager.get_token() == token
@@ -44,12 +100,12 @@ class TestGitHubTokenManager:
         with pytest.raises(ValueError, match="Invalid token format"):
             GitHubTokenManager("short_token")
 
-    @pytest.mark.parametrize("prefix", ["ghp_", "ghs_", "gho_", "ghu_", "ghr_"])
-    def test_validate_valid_prefixes(self, prefix):
+    def test_validate_valid_prefixes(self):
         """Test validation accepts valid token prefixes."""
-        token = prefix + "x" * 36
-        manager = GitHubTokenManager(token)
-        assert manager.get_token() == token
+        for prefix in ("ghp_", "ghs_", "gho_", "ghu_", "ghr_"):
+            token = prefix + "x" * 36
+            manager = GitHubTokenManager(token)
+            assert manager.get_token() == token, prefix
 
     def test_validate_invalid_prefix_warns(self, caplog):
         """Test validation warns for invalid prefix."""
@@ -59,30 +115,41 @@ class TestGitHubTokenManager:
 
     def test_revoke(self):
         """Test token revocation."""
-        token = "ghp_" + "x" * 36
+        token = VALID_TOKEN
         manager = GitHubTokenManager(token)
         manager.revoke()
         assert manager.get_token() is None
 
 
+@pytest.fixture(scope="class")
+def mock_github():
+    """Patch the Github class once per test class."""
+    with patch("entropy_playground.github.client.Github") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="class")
+def client(mock_github):
+    """Create one GitHubClient with mocked dependencies per test class."""
+    return GitHubClient(token=VALID_TOKEN)
+
+
 class TestGitHubClient:
     """Test cases for GitHubClient."""
 
-    @pytest.fixture
-    def mock_github(self):
-        """Create a mock Github instance."""
-        with patch("entropy_playground.github.client.Github") as mock:
-            yield mock
+    @pytest.fixture(autouse=True)
+    def _reset_github(self, mock_github):
+        """Clear calls recorded on the shared Github mock by earlier tests."""
+        mock_github.reset_mock()
 
-    @pytest.fixture
-    def client(self, mock_github, monkeypatch):
-        """Create a GitHubClient instance with mocked dependencies."""
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_" + "x" * 36)
-        return GitHubClient()
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        """Never wait between retries or for rate limit resets."""
+        monkeypatch.setattr("entropy_playground.github.client.time.sleep", lambda *_: None)
 
     def test_init_default_params(self, mock_github, monkeypatch):
         """Test client initialization with default parameters."""
-        token = "ghp_" + "x" * 36
+        token = VALID_TOKEN
         monkeypatch.setenv("GITHUB_TOKEN", token)
 
         client = GitHubClient()
@@ -93,7 +160,7 @@ class TestGitHubClient:
 
     def test_init_custom_params(self, mock_github):
         """Test client initialization with custom parameters."""
-        token = "ghp_" + "x" * 36
+        token = VALID_TOKEN
         base_url = "https://github.enterprise.com/api/v3"
 
         client = GitHubClient(token=token, base_url=base_url, retry_count=5, retry_delay=2.0)
@@ -109,12 +176,12 @@ class TestGitHubClient:
             status=403, data={"rate": {"reset": reset_time}}, headers={}
         )
 
-        start_time = time.time()
-        client._handle_rate_limit(exception)
-        elapsed_time = time.time() - start_time
+        with patch("entropy_playground.github.client.time.sleep") as mock_sleep:
+            client._handle_rate_limit(exception)
 
         # Should wait approximately 5 seconds (with 1 second buffer)
-        assert 5 <= elapsed_time <= 7
+        mock_sleep.assert_called_once()
+        assert 4 <= mock_sleep.call_args.args[0] <= 6
         assert client._rate_limit_reset is not None
 
     def test_retry_operation_success(self, client):
@@ -136,8 +203,7 @@ class TestGitHubClient:
             ]
         )
 
-        with patch("time.sleep"):  # Speed up test
-            result = client._retry_operation(mock_operation)
+        result = client._retry_operation(mock_operation)
 
         assert result == "success"
         assert mock_operation.call_count == 3
@@ -147,9 +213,8 @@ class TestGitHubClient:
         exception = GithubException(500, {"message": "Server error"}, {})
         mock_operation = Mock(side_effect=exception)
 
-        with patch("time.sleep"):  # Speed up test
-            with pytest.raises(GithubException) as exc_info:
-                client._retry_operation(mock_operation)
+        with pytest.raises(GithubException) as exc_info:
+            client._retry_operation(mock_operation)
 
         assert exc_info.value == exception
         assert mock_operation.call_count == client._retry_count
@@ -183,7 +248,7 @@ class TestGitHubClient:
 
     def test_get_repository(self, client, mock_github):
         """Test get repository."""
-        mock_repo = Mock()
+        mock_repo = Mock(spec=Repository)
         client._github.get_repo.return_value = mock_repo
 
         result = client.get_repository("owner/repo")
@@ -191,117 +256,20 @@ class TestGitHubClient:
         assert result == mock_repo
         client._github.get_repo.assert_called_once_with("owner/repo")
 
-    def test_get_issue(self, client, mock_github):
-        """Test get issue."""
-        mock_repo = Mock()
-        mock_issue = Mock()
-        mock_repo.get_issue.return_value = mock_issue
+    @pytest.mark.parametrize(("method", "repo_method", "args", "kwargs"), REPO_CALLS)
+    def test_repository_operations(self, client, method, repo_method, args, kwargs):
+        """Test operations look up the repository and delegate to it."""
+        mock_repo = Mock(spec=Repository)
+        # A list works for both single objects and list_* results
+        expected = [Mock(), Mock()]
+        getattr(mock_repo, repo_method).return_value = expected
         client._github.get_repo.return_value = mock_repo
 
-        result = client.get_issue("owner/repo", 123)
+        result = getattr(client, method)("owner/repo", *args, **kwargs)
 
-        assert result == mock_issue
+        assert result == expected
         client._github.get_repo.assert_called_once_with("owner/repo")
-        mock_repo.get_issue.assert_called_once_with(123)
-
-    def test_list_issues(self, client, mock_github):
-        """Test list issues."""
-        mock_repo = Mock()
-        mock_issues = [Mock(), Mock(), Mock()]
-        mock_repo.get_issues.return_value = mock_issues
-        client._github.get_repo.return_value = mock_repo
-
-        result = client.list_issues(
-            "owner/repo",
-            state="open",
-            labels=["bug", "enhancement"],
-            assignee="user123",
-            sort="updated",
-            direction="asc",
-        )
-
-        assert result == mock_issues
-        mock_repo.get_issues.assert_called_once_with(
-            state="open",
-            labels=["bug", "enhancement"],
-            assignee="user123",
-            sort="updated",
-            direction="asc",
-        )
-
-    def test_create_issue(self, client, mock_github):
-        """Test create issue."""
-        mock_repo = Mock()
-        mock_issue = Mock()
-        mock_repo.create_issue.return_value = mock_issue
-        client._github.get_repo.return_value = mock_repo
-
-        result = client.create_issue(
-            "owner/repo",
-            title="Test Issue",
-            body="Issue body",
-            labels=["bug"],
-            assignees=["user123"],
-        )
-
-        assert result == mock_issue
-        mock_repo.create_issue.assert_called_once_with(
-            title="Test Issue", body="Issue body", labels=["bug"], assignees=["user123"]
-        )
-
-    def test_create_pull_request(self, client, mock_github):
-        """Test create pull request."""
-        mock_repo = Mock()
-        mock_pr = Mock()
-        mock_repo.create_pull.return_value = mock_pr
-        client._github.get_repo.return_value = mock_repo
-
-        result = client.create_pull_request(
-            "owner/repo",
-            title="Test PR",
-            body="PR body",
-            head="feature-branch",
-            base="main",
-            draft=True,
-        )
-
-        assert result == mock_pr
-        mock_repo.create_pull.assert_called_once_with(
-            title="Test PR", body="PR body", head="feature-branch", base="main", draft=True
-        )
-
-    def test_get_pull_request(self, client, mock_github):
-        """Test get pull request."""
-        mock_repo = Mock()
-        mock_pr = Mock()
-        mock_repo.get_pull.return_value = mock_pr
-        client._github.get_repo.return_value = mock_repo
-
-        result = client.get_pull_request("owner/repo", 456)
-
-        assert result == mock_pr
-        mock_repo.get_pull.assert_called_once_with(456)
-
-    def test_list_pull_requests(self, client, mock_github):
-        """Test list pull requests."""
-        mock_repo = Mock()
-        mock_prs = [Mock(), Mock()]
-        mock_repo.get_pulls.return_value = mock_prs
-        client._github.get_repo.return_value = mock_repo
-
-        result = client.list_pull_requests(
-            "owner/repo",
-            state="closed",
-            sort="popularity",
-            direction="desc",
-            base="main",
-            head="owner:feature",
-        )
-
-        assert result == mock_prs
-        mock_repo.get_pulls.assert_called_once_with(
-            state="closed", sort="popularity", direction="desc", base="main", head="owner:feature"
-        )
+        getattr(mock_repo, repo_method).assert_called_once_with(*args, **kwargs)
 
     def test_get_rate_limit(self, client, mock_github):
         """Test get rate limit."""
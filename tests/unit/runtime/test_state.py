@@ -1,13 +1,25 @@
 """Unit tests for Redis state management."""
 
 import json
-from unittest.mock import MagicMock, patch
+import socket
+import subprocess
+import sys
+from contextlib import contextmanager
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
-from redis.exceptions import LockError, RedisError
+from redis.exceptions import LockError, RedisError, ResponseError
+from redis.retry import Retry
 
 from entropy_playground.infrastructure.config import Config
-from entropy_playground.runtime.state import AgentState, StateManager
+from entropy_playground.runtime.state import (
+    _KEEPALIVE_OPTIONS,
+    HAS_ORJSON,
+    AgentState,
+    StateManager,
+    _dumps,
+    _iso_from_ns,
+)
 
 
 @pytest.fixture
@@ -69,15 +81,38 @@ class TestStateManager:
                 config.redis_url,
                 max_connections=50,
                 socket_keepalive=True,
-                socket_keepalive_options={},
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
                 health_check_interval=30,
+                retry=ANY,
             )
             assert pool == mock_pool.return_value
 
+        retry = mock_pool.call_args.kwargs["retry"]
+        assert isinstance(retry, Retry)
+        assert retry.get_retries() == 3
+
+    @pytest.mark.skipif(not hasattr(socket, "TCP_KEEPIDLE"), reason="Linux keepalive options")
+    def test_keepalive_options(self):
+        """Test idle connections are probed after a minute."""
+        assert _KEEPALIVE_OPTIONS == {
+            socket.TCP_KEEPIDLE: 60,
+            socket.TCP_KEEPINTVL: 10,
+            socket.TCP_KEEPCNT: 3,
+        }
+
     def test_client_creation(self, state_manager, mock_redis):
         """Test Redis client creation."""
         assert state_manager.client == mock_redis
 
+    def test_client_keeps_bytes_replies(self, config):
+        """Test the client is created without response decoding."""
+        with (
+            patch("entropy_playground.runtime.state.redis.ConnectionPool.from_url") as mock_pool,
+            patch("entropy_playground.runtime.state.Redis") as mock_redis_cls,
+        ):
+            _ = StateManager(config).client
+        mock_redis_cls.assert_called_once_with(connection_pool=mock_pool.return_value)
+
     def test_close(self, state_manager):
         """Test closing connections."""
         mock_pool = MagicMock()
@@ -91,7 +126,7 @@ class TestStateManager:
 
     def test_get_existing_key(self, state_manager, mock_redis):
         """Test getting an existing key."""
-        mock_redis.get.return_value = '{"name": "test", "value": 123}'
+        mock_redis.get.return_value = b'{"name": "test", "value": 123}'
         result = state_manager.get("test_key")
         assert result == {"name": "test", "value": 123}
         mock_redis.get.assert_called_once_with("test_key")
@@ -104,7 +139,7 @@ class TestStateManager:
 
     def test_get_non_json_value(self, state_manager, mock_redis):
         """Test getting a non-JSON value."""
-        mock_redis.get.return_value = "plain_string"
+        mock_redis.get.return_value = b"plain_string"
         result = state_manager.get("string_key")
         assert result == "plain_string"
 
@@ -119,14 +154,20 @@ class TestStateManager:
         mock_redis.set.return_value = True
         result = state_manager.set("test_key", {"data": "value"})
         assert result is True
-        mock_redis.set.assert_called_once_with("test_key", '{"data": "value"}')
+        mock_redis.set.assert_called_once_with("test_key", _dumps({"data": "value"}))
+
+    @pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+    def test_set_value_sends_compact_bytes(self, state_manager, mock_redis):
+        """Test orjson output is passed to Redis as compact bytes."""
+        state_manager.set("test_key", {"data": "value"})
+        mock_redis.set.assert_called_once_with("test_key", b'{"data":"value"}')
 
     def test_set_with_ttl(self, state_manager, mock_redis):
         """Test setting a value with TTL."""
         mock_redis.setex.return_value = True
         result = state_manager.set("temp_key", {"temp": True}, ttl=3600)
         assert result is True
-        mock_redis.setex.assert_called_once_with("temp_key", 3600, '{"temp": true}')
+        mock_redis.setex.assert_called_once_with("temp_key", 3600, _dumps({"temp": True}))
 
     def test_set_non_serializable(self, state_manager):
         """Test setting a non-serializable value."""
@@ -150,9 +191,9 @@ class TestStateManager:
     def test_get_many(self, state_manager, mock_redis):
         """Test getting multiple values."""
         mock_redis.mget.return_value = [
-            '{"value": 1}',
+            b'{"value": 1}',
             None,
-            '{"value": 3}',
+            b'{"value": 3}',
         ]
         result = state_manager.get_many(["key1", "key2", "key3"])
         assert result == {
@@ -162,15 +203,42 @@ class TestStateManager:
 
     def test_set_many(self, state_manager, mock_redis):
         """Test setting multiple values."""
-        mock_redis.mset.return_value = True
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [True]
         mapping = {"key1": {"a": 1}, "key2": {"b": 2}}
         result = state_manager.set_many(mapping)
         assert result is True
         expected_call = {
-            "key1": '{"a": 1}',
-            "key2": '{"b": 2}',
+            "key1": _dumps({"a": 1}),
+            "key2": _dumps({"b": 2}),
         }
-        mock_redis.mset.assert_called_once_with(expected_call)
+        pipe.mset.assert_called_once_with(expected_call)
+
+    def test_set_many_with_ttl(self, state_manager, mock_redis):
+        """Test setting multiple values with a TTL."""
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [True, True]
+        result = state_manager.set_many({"key1": 1, "key2": 2}, ttl=60)
+        assert result is True
+        pipe.set.assert_any_call("key1", _dumps(1), ex=60)
+        pipe.set.assert_any_call("key2", _dumps(2), ex=60)
+        pipe.mset.assert_not_called()
+
+    def test_set_many_raw_chunks_writes(self, state_manager, mock_redis):
+        """Test large mappings are written in chunks."""
+        state_manager.SCAN_BATCH_SIZE = 2
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[True], [False]]
+        result = state_manager.set_many_raw({"a": "1", "b": "2", "c": "3"})
+        assert result is False
+        assert pipe.mset.call_count == 2
+        pipe.mset.assert_called_with({"c": "3"})
+
+    def test_get_many_raw(self, state_manager, mock_redis):
+        """Test getting stored values without decoding."""
+        mock_redis.mget.return_value = [b'{"value": 1}', None]
+        result = state_manager.get_many_raw(["key1", "key2"])
+        assert result == {"key1": b'{"value": 1}'}
 
     # Distributed Locking Tests
 
@@ -189,9 +257,40 @@ class TestStateManager:
             blocking_timeout=5.0,
             sleep=0.1,
         )
-        mock_lock.acquire.assert_called_once()
+        mock_lock.acquire.assert_called_once_with(blocking=False)
         mock_lock.release.assert_called_once()
 
+    def test_lock_backoff_grows(self, state_manager, mock_redis):
+        """Test waits between lock attempts double up to the cap."""
+        mock_lock = MagicMock()
+        mock_lock.acquire.side_effect = [False] * 5 + [True]
+        mock_redis.lock.return_value = mock_lock
+
+        with (
+            patch("entropy_playground.runtime.state.random.uniform", return_value=0),
+            patch("entropy_playground.runtime.state.time.sleep") as mock_sleep,
+        ):
+            with state_manager.lock("test_lock", max_delay=0.03):
+                pass
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.005, 0.01, 0.02, 0.03, 0.03])
+
+    def test_lock_object_reused(self, state_manager, mock_redis):
+        """Test the Lock object is created once per name and settings."""
+        mock_lock = MagicMock()
+        mock_lock.acquire.return_value = True
+        mock_redis.lock.return_value = mock_lock
+
+        for _ in range(3):
+            with state_manager.lock("test_lock"):
+                pass
+        with state_manager.lock("test_lock", timeout=30.0):
+            pass
+
+        assert mock_redis.lock.call_count == 2
+        assert mock_lock.acquire.call_count == 4
+
     def test_lock_not_acquired(self, state_manager, mock_redis):
         """Test failed lock acquisition."""
         mock_lock = MagicMock()
@@ -199,8 +298,24 @@ class TestStateManager:
         mock_redis.lock.return_value = mock_lock
 
         with pytest.raises(LockError):
-            with state_manager.lock("test_lock"):
+            with state_manager.lock("test_lock", blocking_timeout=0):
                 pass
+        mock_lock.acquire.assert_called_once_with(blocking=False)
+        mock_lock.release.assert_not_called()
+
+    def test_nested_lock_failure_keeps_outer_hold(self, state_manager, mock_redis):
+        """Test a failed inner acquire on the shared Lock leaves the outer hold."""
+        mock_lock = MagicMock()
+        mock_lock.acquire.side_effect = [True, False]
+        mock_redis.lock.return_value = mock_lock
+
+        with state_manager.lock("test_lock"):
+            with pytest.raises(LockError):
+                with state_manager.lock("test_lock", blocking_timeout=0):
+                    pass
+            mock_lock.release.assert_not_called()
+
+        mock_lock.release.assert_called_once()
 
     def test_lock_release_fails(self, state_manager, mock_redis):
         """Test lock release failure handling."""
@@ -216,48 +331,73 @@ class TestStateManager:
     # Migration Tests
 
     def test_migrate_key(self, state_manager, mock_redis):
-        """Test key migration."""
-        mock_redis.get.return_value = '{"old": "data"}'
-        mock_redis.set.return_value = True
-        mock_redis.delete.return_value = 1
+        """Test key migration without a transform uses RENAME."""
+        mock_redis.rename.return_value = True
 
-        # Mock the lock
-        with patch.object(state_manager, "lock"):
+        with patch.object(state_manager, "lock") as mock_lock:
             result = state_manager.migrate_key("old_key", "new_key")
             assert result is True
 
-        mock_redis.get.assert_called_with("old_key")
-        mock_redis.set.assert_called_with("new_key", '{"old": "data"}')
-        mock_redis.delete.assert_called_with("old_key")
+        mock_redis.rename.assert_called_once_with("old_key", "new_key")
+        mock_redis.get.assert_not_called()
+        mock_lock.assert_not_called()
 
     def test_migrate_key_with_transform(self, state_manager, mock_redis):
-        """Test key migration with transformation."""
-        mock_redis.get.return_value = '{"value": 10}'
-        mock_redis.set.return_value = True
-        mock_redis.delete.return_value = 1
+        """Test key migration with transformation reads the value under the lock."""
+        calls = []
+
+        @contextmanager
+        def lock(name):
+            calls.append("lock")
+            yield
+            calls.append("unlock")
+
+        def get(key):
+            calls.append("get")
+            return b'{"value": 10}'
+
+        mock_redis.get.side_effect = get
+        pipe = mock_redis.pipeline.return_value
 
         def transform(data):
             data["value"] *= 2
             return data
 
-        with patch.object(state_manager, "lock"):
+        with patch.object(state_manager, "lock", side_effect=lock):
             result = state_manager.migrate_key("old_key", "new_key", transform_fn=transform)
             assert result is True
 
-        mock_redis.set.assert_called_with("new_key", '{"value": 20}')
+        assert calls == ["lock", "get", "unlock"]
+        mock_redis.pipeline.assert_called_with(transaction=True)
+        pipe.set.assert_called_once_with("new_key", _dumps({"value": 20}))
+        pipe.delete.assert_called_once_with("old_key")
+        pipe.execute.assert_called_once()
 
     def test_migrate_nonexistent_key(self, state_manager, mock_redis):
         """Test migrating a nonexistent key."""
-        mock_redis.get.return_value = None
+        mock_redis.rename.side_effect = ResponseError("no such key")
         result = state_manager.migrate_key("missing", "new")
         assert result is False
 
+    def test_migrate_key_rename_error(self, state_manager, mock_redis):
+        """Test RENAME errors other than a missing key are raised."""
+        mock_redis.rename.side_effect = ResponseError(
+            "CROSSSLOT Keys in request don't hash to the same slot"
+        )
+        with pytest.raises(ResponseError):
+            state_manager.migrate_key("old", "new")
+
+    def test_migrate_nonexistent_key_with_transform(self, state_manager, mock_redis):
+        """Test migrating a nonexistent key with a transform."""
+        mock_redis.get.return_value = None
+        result = state_manager.migrate_key("missing", "new", transform_fn=lambda v: v)
+        assert result is False
+
     def test_bulk_migrate(self, state_manager, mock_redis):
         """Test bulk key migration."""
-        mock_redis.scan_iter.return_value = ["agent:1", "agent:2", "agent:3"]
-        mock_redis.get.return_value = '{"data": "value"}'
-        mock_redis.set.return_value = True
-        mock_redis.delete.return_value = 1
+        mock_redis.scan_iter.return_value = [b"agent:1", b"agent:2", b"agent:3"]
+        mock_redis.mget.return_value = [b'{"data": "value"}'] * 3
+        pipe = mock_redis.pipeline.return_value
 
         def transform(data):
             data["migrated"] = True
@@ -270,57 +410,221 @@ class TestStateManager:
             count = state_manager.bulk_migrate("agent:*", transform, new_key_fn)
             assert count == 3
 
+        mock_redis.scan_iter.assert_called_once_with(match="agent:*", count=1000)
+        mock_redis.mget.assert_called_once_with([b"agent:1", b"agent:2", b"agent:3"])
+        migrated = _dumps({"data": "value", "migrated": True})
+        pipe.mset.assert_called_once_with(
+            {"v2:agent:1": migrated, "v2:agent:2": migrated, "v2:agent:3": migrated}
+        )
+        pipe.delete.assert_called_once_with(b"agent:1", b"agent:2", b"agent:3")
+        pipe.execute.assert_called_once()
+
+    def test_bulk_migrate_batches_keys(self, state_manager, mock_redis):
+        """Test bulk migration fetches values one batch at a time."""
+        state_manager.SCAN_BATCH_SIZE = 2
+        mock_redis.scan_iter.return_value = [b"agent:1", b"agent:2", b"agent:3"]
+        mock_redis.mget.side_effect = [[b'{"n": 1}', None], [b'{"n": 3}']]
+        pipe = mock_redis.pipeline.return_value
+        # The key MGET could not read is checked with LRANGE and is missing
+        pipe.execute.side_effect = [[[]], [True, 1], [True, 1]]
+
+        with patch.object(state_manager, "lock") as mock_lock:
+            count = state_manager.bulk_migrate("agent:*", lambda v: v, lambda k: f"v2:{k}")
+
+        assert count == 2
+        mock_lock.assert_called_with("migration:agent:*")
+        assert mock_lock.call_count == 2
+        assert mock_redis.mget.call_count == 2
+        assert pipe.execute.call_count == 3
+        pipe.lrange.assert_called_once_with(b"agent:2", 0, -1)
+
+    def test_migrate_list_key_with_transform(self, state_manager, mock_redis):
+        """Test a list key is transformed as a list and written back as one."""
+        mock_redis.get.side_effect = ResponseError("WRONGTYPE Operation against a key")
+        mock_redis.lrange.return_value = [b'{"n": 1}', b'{"n": 2}']
+        pipe = mock_redis.pipeline.return_value
+
+        with patch.object(state_manager, "lock"):
+            result = state_manager.migrate_key("old", "new", transform_fn=lambda v: v[::-1])
+
+        assert result is True
+        pipe.set.assert_not_called()
+        pipe.rpush.assert_called_once_with("new", _dumps({"n": 2}), _dumps({"n": 1}))
+        assert pipe.delete.call_args_list == [(("new",),), (("old",),)]
+
+    def test_bulk_migrate_list_keys(self, state_manager, mock_redis):
+        """Test bulk migration moves list keys alongside string keys."""
+        mock_redis.scan_iter.return_value = [b"agent:a:status", b"agent:a:history"]
+        mock_redis.mget.return_value = [b'"idle"', None]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[[b'{"e": 1}']], [True, 1, 1, 2]]
+
+        with patch.object(state_manager, "lock"):
+            count = state_manager.bulk_migrate("agent:*", lambda v: v, lambda k: f"v2:{k}")
+
+        assert count == 2
+        pipe.execute.assert_any_call(raise_on_error=False)
+        pipe.mset.assert_called_once_with({"v2:agent:a:status": _dumps("idle")})
+        pipe.rpush.assert_called_once_with("v2:agent:a:history", _dumps({"e": 1}))
+        pipe.delete.assert_called_with(b"agent:a:status", b"agent:a:history")
+
     # Backup and Restore Tests
 
     def test_backup_keys(self, state_manager, mock_redis):
         """Test backing up keys."""
-        mock_redis.scan_iter.return_value = ["key1", "key2", "key3"]
-        mock_redis.get.side_effect = [
-            '{"data": "1"}',
-            '{"data": "2"}',
-            '{"data": "3"}',
+        mock_redis.scan_iter.return_value = [b"key1", b"key2", b"backup:old:key1", b"key3"]
+        mock_redis.mget.return_value = [
+            b'{"data": "1"}',
+            b'{"data": "2"}',
+            b'{"data": "3"}',
         ]
-        mock_redis.set.return_value = True
 
-        with patch("entropy_playground.runtime.state.datetime") as mock_dt:
-            mock_dt.utcnow.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        with patch(
+            "entropy_playground.runtime.state._utcnow_iso", return_value="2024-01-01T00:00:00"
+        ):
             count = state_manager.backup_keys()
 
         assert count == 3
-        assert mock_redis.set.call_count == 3
+        mock_redis.mget.assert_called_once_with([b"key1", b"key2", b"key3"])
+        mock_redis.mset.assert_called_once_with(
+            {
+                b"backup:2024-01-01T00:00:00:key1": b'{"data": "1"}',
+                b"backup:2024-01-01T00:00:00:key2": b'{"data": "2"}',
+                b"backup:2024-01-01T00:00:00:key3": b'{"data": "3"}',
+            }
+        )
+        mock_redis.set.assert_not_called()
+        mock_redis.hset.assert_called_once_with(
+            "backup:index", "2024-01-01T00:00:00", b"backup:2024-01-01T00:00:00:key1"
+        )
+
+    def test_backup_keys_copies_lists(self, state_manager, mock_redis):
+        """Test keys MGET cannot read are copied with DUMP/RESTORE."""
+        mock_redis.scan_iter.return_value = [b"agent:a:status", b"agent:a:history"]
+        mock_redis.mget.return_value = [b'"idle"', None]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[b"payload"], [True]]
+
+        with patch(
+            "entropy_playground.runtime.state._utcnow_iso", return_value="2024-01-01T00:00:00"
+        ):
+            count = state_manager.backup_keys()
+
+        assert count == 2
+        mock_redis.mset.assert_called_once_with(
+            {b"backup:2024-01-01T00:00:00:agent:a:status": b'"idle"'}
+        )
+        pipe.dump.assert_called_once_with(b"agent:a:history")
+        pipe.restore.assert_called_once_with(
+            b"backup:2024-01-01T00:00:00:agent:a:history", 0, b"payload", replace=True
+        )
 
     def test_restore_from_backup(self, state_manager, mock_redis):
         """Test restoring from backup."""
         backup_keys = [
-            "backup:2024-01-01T00:00:00:key1",
-            "backup:2024-01-01T00:00:00:key2",
+            b"backup:2024-01-01T00:00:00:key1",
+            b"backup:2024-01-01T00:00:00:key2",
         ]
         mock_redis.scan_iter.return_value = backup_keys
-        mock_redis.get.side_effect = ['{"data": "1"}', '{"data": "2"}']
-        mock_redis.exists.return_value = 0
-        mock_redis.set.return_value = True
+        mock_redis.mget.return_value = [b'{"data": "1"}', b'{"data": "2"}']
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [0, 0]
 
         count = state_manager.restore_from_backup("2024-01-01T00:00:00")
         assert count == 2
+        pipe.exists.assert_any_call(b"key1")
+        mock_redis.mset.assert_called_once_with(
+            {b"key1": b'{"data": "1"}', b"key2": b'{"data": "2"}'}
+        )
+
+    def test_restore_lists_from_backup(self, state_manager, mock_redis):
+        """Test list backups are restored with RESTORE rather than MSET."""
+        mock_redis.scan_iter.return_value = [b"backup:2024-01-01T00:00:00:agent:a:history"]
+        mock_redis.mget.return_value = [None]
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[0], [b"payload"], [True]]
+
+        count = state_manager.restore_from_backup("2024-01-01T00:00:00")
+
+        assert count == 1
+        mock_redis.mset.assert_not_called()
+        pipe.dump.assert_called_once_with(b"backup:2024-01-01T00:00:00:agent:a:history")
+        pipe.restore.assert_called_once_with(b"agent:a:history", 0, b"payload", replace=False)
 
     def test_restore_skip_existing(self, state_manager, mock_redis):
         """Test restore skips existing keys when overwrite=False."""
-        mock_redis.scan_iter.return_value = ["backup:2024-01-01T00:00:00:key1"]
-        mock_redis.exists.return_value = 1
+        mock_redis.scan_iter.return_value = [b"backup:2024-01-01T00:00:00:key1"]
+        mock_redis.mget.return_value = [b'{"data": "1"}']
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [1]
 
         count = state_manager.restore_from_backup("2024-01-01T00:00:00", overwrite=False)
         assert count == 0
+        mock_redis.mset.assert_not_called()
 
     def test_list_backups(self, state_manager, mock_redis):
-        """Test listing available backups."""
+        """Test listing backups from the timestamp index."""
+        pipe = mock_redis.pipeline.return_value
+        index = {
+            b"2024-01-01T00:00:00": b"backup:2024-01-01T00:00:00:key1",
+            b"2024-01-02T00:00:00": b"backup:2024-01-02T00:00:00:key1",
+        }
+        pipe.execute.side_effect = [[1, index], [1, 1]]
+
+        backups = state_manager.list_backups()
+        assert backups == ["2024-01-02T00:00:00", "2024-01-01T00:00:00"]
+        pipe.hgetall.assert_called_once_with("backup:index")
+        pipe.exists.assert_any_call(b"backup:2024-01-01T00:00:00:key1")
+        mock_redis.scan_iter.assert_not_called()
+
+    def test_list_backups_backfills_legacy(self, state_manager, mock_redis):
+        """Test backups made before the index existed are merged into it once."""
+        pipe = mock_redis.pipeline.return_value
+        indexed = {b"2024-01-03T00:00:00.000001": b"backup:2024-01-03T00:00:00.000001:key1"}
+        pipe.execute.side_effect = [[0, indexed], [1, True], [1, 1, 1]]
         mock_redis.scan_iter.return_value = [
-            "backup:2024-01-01T00:00:00:key1",
-            "backup:2024-01-01T00:00:00:key2",
-            "backup:2024-01-02T00:00:00:key1",
+            b"backup:index",
+            b"backup:2024-01-01T00:00:00:key1",
+            b"backup:2024-01-01T00:00:00:key2",
+            b"backup:2024-01-02T00:00:00.5:key1",
+            b"backup:2024-01-03T00:00:00.000001:key1",
         ]
 
         backups = state_manager.list_backups()
-        assert backups == ["2024-01-02T00", "2024-01-01T00"]
+        assert backups == [
+            "2024-01-03T00:00:00.000001",
+            "2024-01-02T00:00:00.5",
+            "2024-01-01T00:00:00",
+        ]
+        mock_redis.scan_iter.assert_called_once_with(match="backup:*", count=1000)
+        pipe.hset.assert_called_once_with(
+            "backup:index",
+            mapping={
+                b"2024-01-01T00:00:00": b"backup:2024-01-01T00:00:00:key1",
+                b"2024-01-02T00:00:00.5": b"backup:2024-01-02T00:00:00.5:key1",
+                b"2024-01-03T00:00:00.000001": b"backup:2024-01-03T00:00:00.000001:key1",
+            },
+        )
+        pipe.set.assert_called_once_with("backup:index:backfilled", 1)
+
+    def test_list_backups_prunes_deleted(self, state_manager, mock_redis):
+        """Test index entries are dropped once all their backup keys are gone."""
+        pipe = mock_redis.pipeline.return_value
+        index = {
+            b"2024-01-01T00:00:00": b"backup:2024-01-01T00:00:00:key1",
+            b"2024-01-02T00:00:00": b"backup:2024-01-02T00:00:00:key1",
+            b"2024-01-03T00:00:00": b"backup:2024-01-03T00:00:00:key1",
+        }
+        pipe.execute.side_effect = [[1, index], [1, 0, 0]]
+        # The second backup is gone; the third only lost its recorded key
+        mock_redis.scan_iter.side_effect = [iter([]), iter([b"backup:2024-01-03T00:00:00:key2"])]
+
+        backups = state_manager.list_backups()
+        assert backups == ["2024-01-03T00:00:00", "2024-01-01T00:00:00"]
+        mock_redis.hdel.assert_called_once_with("backup:index", b"2024-01-02T00:00:00")
+        mock_redis.hset.assert_called_once_with(
+            "backup:index", b"2024-01-03T00:00:00", b"backup:2024-01-03T00:00:00:key2"
+        )
 
     # Monitoring Tests
 
@@ -343,6 +647,54 @@ class TestStateManager:
         mock_redis.ping.side_effect = Exception("Connection failed")
         assert state_manager.health_check() is False
 
+    def test_health_check_reuses_recent_ping(self, state_manager, mock_redis):
+        """Test a recent successful PING is reused until it expires."""
+        with patch("entropy_playground.runtime.state.time.monotonic", return_value=100.0):
+            assert state_manager.health_check() is True
+            assert state_manager.health_check() is True
+        assert mock_redis.ping.call_count == 1
+
+        with patch("entropy_playground.runtime.state.time.monotonic", return_value=110.0):
+            assert state_manager.health_check() is True
+        assert mock_redis.ping.call_count == 2
+
+    def test_health_check_failure_not_cached(self, state_manager, mock_redis):
+        """Test a failed PING is retried on the next check."""
+        mock_redis.ping.side_effect = [Exception("Connection failed"), True]
+        assert state_manager.health_check() is False
+        assert state_manager.health_check() is True
+        assert mock_redis.ping.call_count == 2
+
+
+class TestImports:
+    """Test import-time behaviour of the runtime package."""
+
+    def test_runtime_package_does_not_import_redis(self):
+        """Test redis is only loaded when the state module is used."""
+        code = (
+            "import sys, entropy_playground.runtime; "
+            "print('redis' in sys.modules, 'entropy_playground.runtime.state' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
+
+class TestTimestamps:
+    """Test timestamp formatting helpers."""
+
+    def test_iso_from_ns_matches_datetime(self):
+        """Test formatting matches datetime.isoformat with microseconds."""
+        from datetime import datetime
+
+        ns = 1704067200_123456789
+        expected = datetime(2024, 1, 1, 0, 0, 0, 123456).isoformat()
+        assert _iso_from_ns(ns) == expected
+        # Cached prefix is reused within the same second
+        assert _iso_from_ns(ns + 1000) == "2024-01-01T00:00:00.123457"
+        assert _iso_from_ns(ns + 1_000_000_000) == "2024-01-01T00:00:01.123456"
+
 
 class TestAgentState:
     """Test AgentState helper class."""
@@ -357,16 +709,18 @@ class TestAgentState:
         """Test key generation."""
         agent_state = AgentState(state_manager, "test-agent")
         assert agent_state._key("status") == "agent:test-agent:status"
+        assert agent_state._key("status") is agent_state._key("status")
+        assert agent_state._key("custom") == "agent:test-agent:custom"
 
     def test_get_state(self, state_manager, mock_redis):
         """Test getting all agent state."""
         mock_redis.scan_iter.return_value = [
-            "agent:test-agent:status",
-            "agent:test-agent:task",
+            b"agent:test-agent:status",
+            b"agent:test-agent:task",
         ]
-        mock_redis.get.side_effect = [
-            '{"status": "running"}',
-            '{"task": "process"}',
+        mock_redis.mget.return_value = [
+            b'{"status": "running"}',
+            b'{"task": "process"}',
         ]
 
         agent_state = AgentState(state_manager, "test-agent")
@@ -376,13 +730,45 @@ class TestAgentState:
             "status": {"status": "running"},
             "task": {"task": "process"},
         }
+        mock_redis.scan_iter.assert_called_once_with(match="agent:test-agent:*", count=1000)
+        mock_redis.mget.assert_called_once_with(
+            [b"agent:test-agent:status", b"agent:test-agent:task"]
+        )
+        mock_redis.get.assert_not_called()
+
+    def test_get_state_includes_history(self, state_manager, mock_redis):
+        """Test that the history list is read with LRANGE, not MGET."""
+        mock_redis.scan_iter.return_value = [
+            b"agent:test-agent:status",
+            b"agent:test-agent:history",
+        ]
+        mock_redis.mget.return_value = [b'{"status": "running"}']
+        mock_redis.lrange.return_value = [b'{"action": "start"}']
+
+        agent_state = AgentState(state_manager, "test-agent")
+        state = agent_state.get_state()
+
+        assert state == {
+            "status": {"status": "running"},
+            "history": [{"action": "start"}],
+        }
+        mock_redis.mget.assert_called_once_with([b"agent:test-agent:status"])
+
+    def test_get_state_non_ascii_agent_id(self, state_manager, mock_redis):
+        """Test field names are sliced by byte length for non-ASCII ids."""
+        mock_redis.scan_iter.return_value = ["agent:tëst:status".encode()]
+        mock_redis.mget.return_value = [b'"running"']
+
+        agent_state = AgentState(state_manager, "tëst")
+        assert agent_state.get_state() == {"status": "running"}
 
     def test_set_status(self, state_manager, mock_redis):
         """Test setting agent status."""
         mock_redis.set.return_value = True
 
-        with patch("entropy_playground.runtime.state.datetime") as mock_dt:
-            mock_dt.utcnow.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        with patch(
+            "entropy_playground.runtime.state._utcnow_iso", return_value="2024-01-01T00:00:00"
+        ):
             agent_state = AgentState(state_manager, "test-agent")
             result = agent_state.set_status("active")
 
@@ -392,10 +778,19 @@ class TestAgentState:
             "timestamp": "2024-01-01T00:00:00",
             "agent_id": "test-agent",
         }
-        mock_redis.set.assert_called_with(
-            "agent:test-agent:status",
-            json.dumps(expected_data),
-        )
+        mock_redis.set.assert_called_once()
+        key, payload = mock_redis.set.call_args.args
+        assert key == "agent:test-agent:status"
+        assert json.loads(payload) == expected_data
+
+    def test_set_status_escapes_values(self, state_manager, mock_redis):
+        """Test quotes and non-ASCII text in the templated payload stay valid JSON."""
+        agent_state = AgentState(state_manager, 'tëst "agent"')
+        agent_state.set_status('waiting on "review"')
+
+        payload = json.loads(mock_redis.set.call_args.args[1])
+        assert payload["status"] == 'waiting on "review"'
+        assert payload["agent_id"] == 'tëst "agent"'
 
     def test_get_status(self, state_manager, mock_redis):
         """Test getting agent status."""
@@ -404,7 +799,7 @@ class TestAgentState:
             "timestamp": "2024-01-01T00:00:00",
             "agent_id": "test-agent",
         }
-        mock_redis.get.return_value = json.dumps(status_data)
+        mock_redis.get.return_value = json.dumps(status_data).encode()
 
         agent_state = AgentState(state_manager, "test-agent")
         status = agent_state.get_status()
@@ -415,8 +810,9 @@ class TestAgentState:
         """Test setting current task."""
         mock_redis.set.return_value = True
 
-        with patch("entropy_playground.runtime.state.datetime") as mock_dt:
-            mock_dt.utcnow.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        with patch(
+            "entropy_playground.runtime.state._utcnow_iso", return_value="2024-01-01T00:00:00"
+        ):
             agent_state = AgentState(state_manager, "test-agent")
             result = agent_state.set_task("task-123", {"description": "Process data"})
 
@@ -434,28 +830,124 @@ class TestAgentState:
 
     def test_add_to_history(self, state_manager, mock_redis):
         """Test adding event to history."""
-        mock_redis.get.return_value = "[]"
-        mock_redis.set.return_value = True
+        pipe = mock_redis.pipeline.return_value
 
-        with patch("entropy_playground.runtime.state.datetime") as mock_dt:
-            mock_dt.utcnow.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+        with patch(
+            "entropy_playground.runtime.state._utcnow_iso", return_value="2024-01-01T00:00:00"
+        ):
             agent_state = AgentState(state_manager, "test-agent")
             result = agent_state.add_to_history({"event": "task_completed"})
 
         assert result is True
+        pipe.rpush.assert_called_once_with(
+            "agent:test-agent:history",
+            _dumps(
+                {
+                    "event": "task_completed",
+                    "timestamp": "2024-01-01T00:00:00",
+                    "agent_id": "test-agent",
+                }
+            ),
+        )
+        pipe.execute.assert_called_once()
+        mock_redis.get.assert_not_called()
 
     def test_history_limit(self, state_manager, mock_redis):
         """Test history is limited to 100 events."""
-        # Create a history with 100 items
-        existing_history = [{"event": f"event_{i}"} for i in range(100)]
-        mock_redis.get.return_value = json.dumps(existing_history)
-        mock_redis.set.return_value = True
+        pipe = mock_redis.pipeline.return_value
 
         agent_state = AgentState(state_manager, "test-agent")
         agent_state.add_to_history({"event": "new_event"})
 
-        # Verify the set call
-        call_args = mock_redis.set.call_args[0]
-        saved_history = json.loads(call_args[1])
-        assert len(saved_history) == 100
-        assert saved_history[-1]["event"] == "new_event"
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.rpush.assert_called_once()
+        pipe.ltrim.assert_called_once_with("agent:test-agent:history", -100, -1)
+
+    def test_get_history(self, state_manager, mock_redis):
+        """Test reading history from the Redis list."""
+        mock_redis.lrange.return_value = [b'{"event": "a"}', b'{"event": "b"}']
+
+        agent_state = AgentState(state_manager, "test-agent")
+        history = agent_state.get_history()
+
+        assert history == [{"event": "a"}, {"event": "b"}]
+        mock_redis.lrange.assert_called_once_with("agent:test-agent:history", 0, -1)
+
+    @pytest.fixture
+    def legacy_history(self, mock_redis):
+        """Serve history stored as a JSON string to the conversion transaction."""
+        txn = MagicMock()
+        txn.type.return_value = b"string"
+        txn.get.return_value = b'[{"event": "old"}]'
+        mock_redis.transaction.side_effect = lambda func, *watches: func(txn)
+        return txn
+
+    def test_add_to_history_converts_legacy_string(self, state_manager, mock_redis):
+        """Test appending to a JSON-string history keeps the old and new events."""
+        key = "agent:test-agent:history"
+        store = {key: b'[{"event": "old"}]'}
+
+        class FakePipeline:
+            """Apply queued commands to ``store``, resetting after execute like redis-py."""
+
+            def __init__(self):
+                self.queued = []
+
+            def type(self, name):
+                return b"string" if isinstance(store.get(name), bytes) else b"list"
+
+            def get(self, name):
+                return store[name]
+
+            def multi(self):
+                pass
+
+            def delete(self, name):
+                self.queued.append(lambda: store.pop(name, None))
+
+            def rpush(self, name, *values):
+                def run():
+                    if isinstance(store.get(name), bytes):
+                        raise ResponseError(
+                            "Command # 1 (RPUSH) of pipeline caused error: WRONGTYPE Operation"
+                        )
+                    store.setdefault(name, []).extend(values)
+
+                self.queued.append(run)
+
+            def ltrim(self, name, start, end):
+                self.queued.append(
+                    lambda: store.update({name: store[name][start : end + 1 or None]})
+                )
+
+            def execute(self):
+                try:
+                    return [run() for run in self.queued]
+                finally:
+                    self.queued = []
+
+        def transaction(func, *watches):
+            pipe = FakePipeline()
+            func(pipe)
+            return pipe.execute()
+
+        mock_redis.pipeline.side_effect = lambda transaction=True: FakePipeline()
+        mock_redis.transaction.side_effect = transaction
+
+        agent_state = AgentState(state_manager, "test-agent")
+        assert agent_state.add_to_history({"event": "new"}) is True
+
+        mock_redis.transaction.assert_called_once_with(ANY, key)
+        assert [json.loads(entry)["event"] for entry in store[key]] == ["old", "new"]
+
+    def test_get_history_converts_legacy_string(self, state_manager, mock_redis, legacy_history):
+        """Test reading a JSON-string history converts it to a list."""
+        mock_redis.lrange.side_effect = [
+            ResponseError("WRONGTYPE Operation against a key"),
+            [b'{"event": "old"}'],
+        ]
+
+        agent_state = AgentState(state_manager, "test-agent")
+
+        assert agent_state.get_history() == [{"event": "old"}]
+        legacy_history.rpush.assert_called_once()
@@ -3,6 +3,7 @@ Unit tests for the base agent class.
 """
 
 import asyncio
+import signal
 from unittest.mock import patch
 
 import pytest
@@ -149,7 +150,6 @@ class TestHealthStatus:
         assert status.is_healthy is False
 
 
-@pytest.mark.asyncio
 class TestBaseAgent:
     """Test BaseAgent functionality."""
 
@@ -240,6 +240,29 @@ class TestBaseAgent:
         ]
         assert states == expected
 
+    async def test_callback_registered_during_dispatch(self, agent):
+        """Test a callback added by a callback only runs from the next change."""
+        calls = []
+
+        def late(old_state: AgentState, new_state: AgentState):
+            calls.append(("late", new_state))
+
+        def first(old_state: AgentState, new_state: AgentState):
+            calls.append(("first", new_state))
+            if new_state == AgentState.READY:
+                agent.on_state_change(late)
+
+        agent.on_state_change(first)
+        await agent.start()
+        await agent.stop()
+
+        assert calls[:3] == [
+            ("first", AgentState.READY),
+            ("first", AgentState.RUNNING),
+            ("late", AgentState.RUNNING),
+        ]
+
+    @pytest.mark.slow
     async def test_health_monitoring(self, agent):
         """Test health monitoring functionality."""
         await agent.start()
@@ -260,6 +283,7 @@ class TestBaseAgent:
 
         await agent.stop()
 
+    @pytest.mark.slow
     async def test_unhealthy_agent(self, config):
         """Test unhealthy agent detection."""
         agent = UnhealthyMockAgent(config)
@@ -357,6 +381,20 @@ class TestBaseAgent:
 
             await agent.stop()
 
+    async def test_signal_stops_agent(self, agent):
+        """Test a shutdown signal stops the running agent."""
+        with patch("signal.signal") as mock_signal:
+            await agent.start()
+
+        handler = mock_signal.call_args.args[1]
+        handler(signal.SIGTERM, None)
+        # The stop is scheduled on the loop rather than run inline
+        assert agent.state == AgentState.RUNNING
+
+        await asyncio.sleep(0)
+        await agent._signal_stop_task
+        assert agent.state == AgentState.STOPPED
+
     async def test_invalid_state_transitions(self, agent):
         """Test invalid state transitions."""
         # Can't pause when not running
@@ -390,6 +428,7 @@ class TestBaseAgent:
 
         assert agent.state == AgentState.ERROR
 
+    @pytest.mark.slow
     async def test_callback_error_handling(self, agent):
         """Test that callback errors don't crash the agent."""
 
@@ -2,11 +2,11 @@
 Unit tests for agent registry and factory.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 
-from entropy_playground.agents import AgentConfig, BaseAgent
+from entropy_playground.agents import AgentConfig, AgentState, BaseAgent
 from entropy_playground.runtime import (
     AgentFactory,
     AgentRegistry,
@@ -19,6 +19,9 @@ from entropy_playground.runtime import (
 class TestAgent(BaseAgent):
     """Test agent implementation."""
 
+    # An agent, not a test class; keeps pytest from trying to collect it
+    __test__ = False
+
     async def initialize(self) -> None:
         pass
 
@@ -47,21 +50,45 @@ class NotAnAgent:
     pass
 
 
+# Configs shared by tests that only read them; agents keep a reference to
+# their config, so tests must not modify these
+CFG_TEST = AgentConfig(name="test-agent", role="test")
+CFG_SINGLETON = AgentConfig(name="singleton", role="test")
+CFG_AGENT1 = AgentConfig(name="agent1", role="test")
+CFG_AGENT2 = AgentConfig(name="agent2", role="another")
+
+# Roles registered in the registry shared by the factory tests
+FACTORY_AGENTS = [("test", TestAgent, None), ("another", AnotherTestAgent, None)]
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Create one empty registry shared by the module."""
+    return AgentRegistry()
+
+
+@pytest.fixture(scope="module")
+def populated_registry():
+    """Create one registry with the factory test agents, shared by the module."""
+    reg = AgentRegistry()
+    reg.register_many(FACTORY_AGENTS)
+    return reg
+
+
 class TestAgentRegistry:
     """Test AgentRegistry functionality."""
 
-    @pytest.fixture
-    def registry(self):
-        """Create a fresh registry for each test."""
-        reg = AgentRegistry()
-        yield reg
-        reg.clear()
+    @pytest.fixture(autouse=True)
+    def _reset_registry(self, registry):
+        """Empty the shared registry after each test."""
+        yield
+        registry.clear()
 
     def test_register_agent(self, registry):
         """Test registering an agent."""
         registry.register("test", TestAgent)
 
-        assert "test" in registry.list_roles()
+        assert "test" in registry
         assert registry.get("test") == TestAgent
 
     def test_register_with_validator(self, registry):
@@ -78,26 +105,23 @@ class TestAgentRegistry:
         registry.validate_config("test", config)
 
         # Invalid config
-        bad_config = AgentConfig(name="test-agent", role="test")
         with pytest.raises(AgentRegistryError) as exc_info:
-            registry.validate_config("test", bad_config)
+            registry.validate_config("test", CFG_TEST)
         assert "validation failed" in str(exc_info.value)
 
-    def test_register_invalid_agent(self, registry):
+    @pytest.mark.parametrize(
+        ("role", "agent_class", "message"),
+        [
+            pytest.param("", TestAgent, "cannot be empty", id="empty_role"),
+            pytest.param("test", "not a class", "subclass of BaseAgent", id="not_a_class"),
+            pytest.param("test", NotAnAgent, "subclass of BaseAgent", id="not_an_agent"),
+        ],
+    )
+    def test_register_invalid_agent(self, registry, role, agent_class, message):
         """Test registering invalid agent classes."""
-        # Empty role
-        with pytest.raises(AgentRegistryError) as exc_info:
-            registry.register("", TestAgent)
-        assert "cannot be empty" in str(exc_info.value)
-
-        # Not a class
-        with pytest.raises(AgentRegistryError):
-            registry.register("test", "not a class")
-
-        # Not an agent subclass
-        with pytest.raises(AgentRegistryError) as exc_info:
-            registry.register("test", NotAnAgent)
-        assert "subclass of BaseAgent" in str(exc_info.value)
+        with pytest.raises(AgentRegistryError, match=message):
+            registry.register(role, agent_class)
+        assert registry.list_roles() == []
 
     def test_overwrite_registration(self, registry):
         """Test overwriting an existing registration."""
@@ -106,28 +130,51 @@ class TestAgentRegistry:
 
         assert registry.get("test") == AnotherTestAgent
 
+    def test_register_many(self, registry):
+        """Test registering several agents at once."""
+
+        def validator(config: AgentConfig):
+            pass
+
+        registry.register_many(
+            [
+                ("test", TestAgent, None),
+                ("another", AnotherTestAgent, validator),
+            ]
+        )
+
+        assert registry.list_roles() == ["test", "another"]
+        assert registry.get_info("another")["has_validator"] is True
+        assert registry.get_info("test")["has_validator"] is False
+
+    def test_register_many_is_all_or_nothing(self, registry):
+        """Test that an invalid entry prevents the whole batch."""
+        with pytest.raises(AgentRegistryError):
+            registry.register_many([("test", TestAgent, None), ("bad", NotAnAgent, None)])
+
+        assert registry.list_roles() == []
+
     def test_unregister_agent(self, registry):
         """Test unregistering an agent."""
         registry.register("test", TestAgent)
         registry.unregister("test")
 
-        assert "test" not in registry.list_roles()
+        assert "test" not in registry
 
         with pytest.raises(AgentRegistryError):
             registry.get("test")
 
-    def test_unregister_nonexistent(self, registry):
-        """Test unregistering a non-existent agent."""
-        with pytest.raises(AgentRegistryError) as exc_info:
-            registry.unregister("nonexistent")
-        assert "not registered" in str(exc_info.value)
-
-    def test_get_nonexistent_agent(self, registry):
-        """Test getting a non-existent agent."""
-        with pytest.raises(AgentRegistryError) as exc_info:
-            registry.get("nonexistent")
-        assert "not registered" in str(exc_info.value)
-        assert "Available roles:" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        ("method", "message"),
+        [
+            ("unregister", "is not registered"),
+            ("get", "is not registered. Available roles:"),
+        ],
+    )
+    def test_unknown_role(self, registry, method, message):
+        """Test looking up or unregistering a role that was never registered."""
+        with pytest.raises(AgentRegistryError, match=message):
+            getattr(registry, method)("nonexistent")
 
     def test_list_roles(self, registry):
         """Test listing registered roles."""
@@ -155,6 +202,23 @@ class TestAgentRegistry:
         assert "run" in info["methods"]
         assert "cleanup" in info["methods"]
 
+    def test_get_info_caches_method_listing(self, registry):
+        """Test that class reflection runs once per agent class."""
+
+        class CachedAgent(TestAgent):
+            pass
+
+        registry.register("cached", CachedAgent)
+
+        with patch(
+            "entropy_playground.runtime.registry.inspect.getmembers", return_value=[]
+        ) as getmembers:
+            first = registry.get_info("cached")
+            second = registry.get_info("cached")
+
+        getmembers.assert_called_once()
+        assert first["methods"] == second["methods"]
+
     def test_get_info_with_validator(self, registry):
         """Test getting info for agent with validator."""
         registry.register("test", TestAgent, lambda c: None)
@@ -179,60 +243,74 @@ class TestAgentRegistry:
         registry.clear()
         assert registry.list_roles() == []
 
+    def test_freeze_registry(self):
+        """Test that a frozen registry is read-only."""
+        registry = AgentRegistry()
+        registry.register("test", TestAgent)
+        registry.freeze()
+
+        assert registry.frozen
+        assert registry.get("test") is TestAgent
+
+        with pytest.raises(AgentRegistryError, match="frozen"):
+            registry.register("another", AnotherTestAgent)
+        with pytest.raises(AgentRegistryError, match="frozen"):
+            registry.register_many([("another", AnotherTestAgent, None)])
+        with pytest.raises(AgentRegistryError, match="frozen"):
+            registry.unregister("test")
+        with pytest.raises(AgentRegistryError, match="frozen"):
+            registry.clear()
+
+        assert registry.list_roles() == ["test"]
+
 
 class TestAgentFactory:
     """Test AgentFactory functionality."""
 
-    @pytest.fixture
-    def registry(self):
-        """Create a registry with test agents."""
-        reg = AgentRegistry()
-        reg.register("test", TestAgent)
-        reg.register("another", AnotherTestAgent)
-        yield reg
-        reg.clear()
+    @pytest.fixture(autouse=True)
+    def _reset_registry(self, populated_registry):
+        """Drop roles added by a test from the shared registry."""
+        yield
+        populated_registry.clear()
+        populated_registry.register_many(FACTORY_AGENTS)
 
     @pytest.fixture
-    def factory(self, registry):
+    def factory(self, populated_registry):
         """Create a factory with the test registry."""
-        return AgentFactory(registry)
+        return AgentFactory(populated_registry)
 
     def test_create_agent(self, factory):
         """Test creating an agent instance."""
-        config = AgentConfig(name="test-agent", role="test")
-        agent = factory.create(config)
+        agent = factory.create(CFG_TEST)
 
         assert isinstance(agent, TestAgent)
-        assert agent.config == config
+        assert agent.config == CFG_TEST
 
     def test_create_with_kwargs(self, factory):
         """Test creating an agent with additional kwargs."""
-        config = AgentConfig(name="test-agent", role="test")
 
-        # Mock the agent class to check kwargs
-        original_class = factory.registry.get("test")
-        mock_instance = MagicMock(spec=TestAgent)
-        mock_class = MagicMock(return_value=mock_instance)
-        mock_class.__name__ = "MockTestAgent"  # Add __name__ attribute
-        factory.registry._agents["test"] = mock_class
+        class KwargsAgent(TestAgent):
+            def __init__(self, config, **kwargs):
+                super().__init__(config)
+                self.kwargs = kwargs
 
-        result = factory.create(config, custom_param="value")
+        factory.registry.register("kwargs", KwargsAgent)
+        config = AgentConfig(name="test-agent", role="kwargs")
 
-        assert result is mock_instance
-        mock_class.assert_called_once_with(config, custom_param="value")
+        result = factory.create(config, custom_param="value")
 
-        # Restore original
-        factory.registry._agents["test"] = original_class
+        assert isinstance(result, KwargsAgent)
+        assert result.config is config
+        assert result.kwargs == {"custom_param": "value"}
 
     def test_create_singleton(self, factory):
         """Test creating singleton agents."""
-        config = AgentConfig(name="singleton", role="test")
 
         # Create first instance
-        agent1 = factory.create(config, singleton=True)
+        agent1 = factory.create(CFG_SINGLETON, singleton=True)
 
         # Create second instance - should return same
-        agent2 = factory.create(config, singleton=True)
+        agent2 = factory.create(CFG_SINGLETON, singleton=True)
 
         assert agent1 is agent2
         assert factory.get_instance("singleton") is agent1
@@ -270,19 +348,16 @@ class TestAgentFactory:
 
     def test_get_instance(self, factory):
         """Test getting singleton instances."""
-        config = AgentConfig(name="singleton", role="test")
-        agent = factory.create(config, singleton=True)
+        agent = factory.create(CFG_SINGLETON, singleton=True)
 
         assert factory.get_instance("singleton") is agent
         assert factory.get_instance("nonexistent") is None
 
     def test_list_instances(self, factory):
         """Test listing all singleton instances."""
-        config1 = AgentConfig(name="agent1", role="test")
-        config2 = AgentConfig(name="agent2", role="another")
 
-        agent1 = factory.create(config1, singleton=True)
-        agent2 = factory.create(config2, singleton=True)
+        agent1 = factory.create(CFG_AGENT1, singleton=True)
+        agent2 = factory.create(CFG_AGENT2, singleton=True)
 
         instances = factory.list_instances()
         assert len(instances) == 2
@@ -291,8 +366,7 @@ class TestAgentFactory:
 
     def test_remove_instance(self, factory):
         """Test removing singleton instances."""
-        config = AgentConfig(name="singleton", role="test")
-        factory.create(config, singleton=True)
+        factory.create(CFG_SINGLETON, singleton=True)
 
         assert factory.remove_instance("singleton") is True
         assert factory.get_instance("singleton") is None
@@ -300,15 +374,62 @@ class TestAgentFactory:
 
     def test_clear_instances(self, factory):
         """Test clearing all instances."""
-        config1 = AgentConfig(name="agent1", role="test")
-        config2 = AgentConfig(name="agent2", role="another")
 
-        factory.create(config1, singleton=True)
-        factory.create(config2, singleton=True)
+        factory.create(CFG_AGENT1, singleton=True)
+        factory.create(CFG_AGENT2, singleton=True)
 
         factory.clear_instances()
         assert len(factory.list_instances()) == 0
 
+    def test_singleton_pool_evicts_least_recently_used(self, populated_registry):
+        """Test that the singleton pool is bounded with LRU eviction."""
+        factory = AgentFactory(populated_registry, max_instances=2)
+        agent1 = factory.create(CFG_AGENT1, singleton=True)
+        factory.create(AgentConfig(name="agent2", role="test"), singleton=True)
+
+        # Touch agent1 so agent2 becomes the least recently used
+        assert factory.get_instance("agent1") is agent1
+        factory.create(AgentConfig(name="agent3", role="test"), singleton=True)
+
+        assert set(factory.list_instances()) == {"agent1", "agent3"}
+        assert factory.get_instance("agent2") is None
+
+    def test_singleton_pool_unbounded_by_default(self, factory):
+        """Test that singleton instances are not evicted without max_instances."""
+        for i in range(200):
+            factory.create(AgentConfig(name=f"agent{i}", role="test"), singleton=True)
+
+        assert len(factory.list_instances()) == 200
+
+    def test_running_instances_not_evicted(self, populated_registry):
+        """Test that eviction and idle pruning skip running agents."""
+        factory = AgentFactory(populated_registry, max_instances=1, max_idle_seconds=60)
+
+        with patch("entropy_playground.runtime.registry.time.monotonic", return_value=1000.0):
+            running = factory.create(CFG_AGENT1, singleton=True)
+            running._set_state(AgentState.RUNNING)
+            factory.create(AgentConfig(name="agent2", role="test"), singleton=True)
+            assert set(factory.list_instances()) == {"agent1", "agent2"}
+
+            factory.create(AgentConfig(name="agent3", role="test"), singleton=True)
+            assert set(factory.list_instances()) == {"agent1", "agent3"}
+
+        with patch("entropy_playground.runtime.registry.time.monotonic", return_value=2000.0):
+            assert factory.prune_idle() == 1
+            assert factory.get_instance("agent1") is running
+
+    def test_prune_idle_instances(self, populated_registry):
+        """Test that idle singleton instances expire."""
+        factory = AgentFactory(populated_registry, max_idle_seconds=60)
+
+        with patch("entropy_playground.runtime.registry.time.monotonic", return_value=1000.0):
+            factory.create(AgentConfig(name="old", role="test"), singleton=True)
+        with patch("entropy_playground.runtime.registry.time.monotonic", return_value=1050.0):
+            factory.create(AgentConfig(name="recent", role="test"), singleton=True)
+        with patch("entropy_playground.runtime.registry.time.monotonic", return_value=1070.0):
+            assert factory.prune_idle() == 1
+            assert set(factory.list_instances()) == {"recent"}
+
     def test_create_with_constructor_error(self, factory):
         """Test handling constructor errors."""
 
@@ -325,6 +446,14 @@ class TestAgentFactory:
         assert "Constructor failed" in str(exc_info.value)
 
 
+@pytest.fixture
+def fresh_global(monkeypatch):
+    """Swap the global registry for an empty one for the duration of a test."""
+    reg = AgentRegistry()
+    monkeypatch.setattr("entropy_playground.runtime.registry._global_registry", reg)
+    return reg
+
+
 class TestGlobalRegistry:
     """Test global registry functionality."""
 
@@ -334,13 +463,8 @@ class TestGlobalRegistry:
         reg2 = get_registry()
         assert reg1 is reg2  # Should be same instance
 
-    def test_register_agent_decorator(self):
+    def test_register_agent_decorator(self, fresh_global):
         """Test the register_agent decorator."""
-        registry = get_registry()
-
-        # Clear any existing registrations
-        if "decorated" in registry.list_roles():
-            registry.unregister("decorated")
 
         @register_agent("decorated")
         class DecoratedAgent(TestAgent):
@@ -348,43 +472,24 @@ class TestGlobalRegistry:
 
             pass
 
-        assert registry.get("decorated") == DecoratedAgent
+        assert get_registry() is fresh_global
+        assert fresh_global.get("decorated") == DecoratedAgent
 
-        # Cleanup
-        registry.unregister("decorated")
-
-    def test_register_agent_decorator_with_validator(self):
+    def test_register_agent_decorator_with_validator(self, fresh_global):
         """Test decorator with validator."""
-        registry = get_registry()
 
         def validator(config: AgentConfig):
             assert config.metadata.get("validated") is True
 
-        # Clear any existing registrations
-        if "validated" in registry.list_roles():
-            registry.unregister("validated")
-
         @register_agent("validated", validator=validator)
         class ValidatedAgent(TestAgent):
             pass
 
         # Test validation
         config = AgentConfig(name="test", role="validated", metadata={"validated": True})
-        registry.validate_config("validated", config)
+        fresh_global.validate_config("validated", config)
 
-        # Cleanup
-        registry.unregister("validated")
-
-    def test_register_agent_direct(self):
+    def test_register_agent_direct(self, fresh_global):
         """Test direct registration using register_agent."""
-        registry = get_registry()
-
-        # Clear any existing registrations
-        if "direct" in registry.list_roles():
-            registry.unregister("direct")
-
         register_agent("direct", TestAgent)
-        assert registry.get("direct") == TestAgent
-
-        # Cleanup
-        registry.unregister("direct")
+        assert fresh_global.get("direct") == TestAgent
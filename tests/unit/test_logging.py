@@ -1,19 +1,28 @@
 """Tests for the logging framework."""
 
+import errno
 import json
-import tempfile
+import logging
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
+from entropy_playground.logging import audit, cloudwatch
 from entropy_playground.logging.aggregator import (
     LogAggregator,
     LogEntry,
     LogQuery,
+    _init_worker,
     get_log_stats,
     search_logs,
 )
 from entropy_playground.logging.audit import (
+    DIRECT_IO_BUFFER_SIZE,
     AuditEvent,
     AuditEventType,
     AuditLogger,
@@ -33,135 +42,153 @@ from entropy_playground.logging.logger import (
 class TestStructuredLogging:
     """Test structured logging functionality."""
 
-    def test_setup_logging_console_only(self, monkeypatch):
+    def test_setup_logging_console_only(self, tmp_path, monkeypatch):
         """Test logging setup without file logging."""
         monkeypatch.setenv("ENTROPY_ENV", "development")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            setup_logging(
-                level="DEBUG",
-                log_dir=temp_dir,
-                enable_file_logging=False,
-            )
+        setup_logging(
+            level="DEBUG",
+            log_dir=str(tmp_path),
+            enable_file_logging=False,
+        )
+
+        logger = get_logger("test")
+        logger.info("test message", key="value")
+
+        # Verify no log files were created
+        log_files = list(tmp_path.glob("*.log"))
+        assert len(log_files) == 0
+
+    def test_setup_logging_filters_level(self, monkeypatch, capsys):
+        """Test calls below the configured level are dropped."""
+        monkeypatch.setenv("ENTROPY_ENV", "development")
+        try:
+            setup_logging(level="WARNING", enable_file_logging=False)
 
             logger = get_logger("test")
-            logger.info("test message", key="value")
+            logger.info("hidden message")
+            logger.warning("shown message")
 
-            # Verify no log files were created
-            log_files = list(Path(temp_dir).glob("*.log"))
-            assert len(log_files) == 0
+            output = capsys.readouterr().out
+            assert "hidden message" not in output
+            assert "shown message" in output
+        finally:
+            cleanup_logging_handlers()
 
-    def test_setup_logging_with_file(self):
+    def test_setup_logging_with_file(self, tmp_path):
         """Test logging setup with file logging."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                setup_logging(
-                    level="INFO",
-                    log_dir=temp_dir,
-                    enable_file_logging=True,
-                )
-
-                logger = get_logger("test")
-                logger.info("test message", key="value")
-
-                # Verify log file was created
-                log_file = Path(temp_dir) / "entropy-playground.log"
-                assert log_file.exists()
-
-                # Verify log content
-                with open(log_file) as f:
-                    content = f.read()
-                    assert "test message" in content
-                    assert "key" in content
-            finally:
-                # Clean up handlers to prevent Windows file locking
-                cleanup_logging_handlers()
-
-    def test_json_formatting_in_production(self, monkeypatch):
+        try:
+            setup_logging(
+                level="INFO",
+                log_dir=str(tmp_path),
+                enable_file_logging=True,
+            )
+
+            file_handler = next(h for h in logging.getLogger().handlers if hasattr(h, "listener"))
+            writer_thread = file_handler.listener._thread
+
+            logger = get_logger("test")
+            logger.info("test message", key="value")
+            # File writes happen on a background thread; flush waits for them
+            for handler in logging.getLogger().handlers:
+                handler.flush()
+            assert file_handler.listener._thread is writer_thread
+
+            # Verify log file was created
+            log_file = tmp_path / "entropy-playground.log"
+            assert log_file.exists()
+
+            # Verify log content
+            with open(log_file) as f:
+                content = f.read()
+                assert "test message" in content
+                assert "key" in content
+        finally:
+            # Clean up handlers to prevent Windows file locking
+            cleanup_logging_handlers()
+
+    def test_json_formatting_in_production(self, tmp_path, monkeypatch):
         """Test JSON formatting in production mode."""
         monkeypatch.setenv("ENTROPY_ENV", "production")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                setup_logging(log_dir=temp_dir)
-
-                logger = get_logger("test")
-                logger.info("test message", number=42, flag=True)
-
-                # Read and parse log file
-                log_file = Path(temp_dir) / "entropy-playground.log"
-                with open(log_file) as f:
-                    line = f.readline()
-                    data = json.loads(line)
-
-                    assert data["event"] == "test message"
-                    assert data["number"] == 42
-                    assert data["flag"] is True
-                    assert "timestamp" in data
-                    assert "logger" in data
-            finally:
-                # Clean up handlers to prevent Windows file locking
-                cleanup_logging_handlers()
-
-    def test_log_rotation(self):
+        try:
+            setup_logging(log_dir=str(tmp_path))
+
+            logger = get_logger("test")
+            logger.info("test message", number=42, flag=True)
+            cleanup_logging_handlers()
+
+            # Read and parse log file
+            log_file = tmp_path / "entropy-playground.log"
+            with open(log_file) as f:
+                line = f.readline()
+                data = json.loads(line)
+
+                assert data["event"] == "test message"
+                assert data["number"] == 42
+                assert data["flag"] is True
+                assert "timestamp" in data
+                assert "logger" in data
+        finally:
+            # Clean up handlers to prevent Windows file locking
+            cleanup_logging_handlers()
+
+    def test_log_rotation(self, tmp_path):
         """Test log file rotation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                # Setup logging with small max bytes to trigger rotation
-                setup_logging(
-                    log_dir=temp_dir,
-                    enable_file_logging=True,
-                )
-
-                # Get the root logger and add our small rotation handler
-                import logging
-
-                from entropy_playground.logging.logger import setup_file_handler
-
-                handler = setup_file_handler(
-                    Path(temp_dir),
-                    max_bytes=100,  # Very small to trigger rotation
-                    backup_count=2,
-                )
-                root_logger = logging.getLogger()
-                root_logger.addHandler(handler)
-
-                # Write enough to trigger rotation
-                logger = get_logger("test")
-                # Write large messages to exceed 100 bytes limit
-                for i in range(5):
-                    # Each message will be much larger than 100 bytes
-                    large_msg = "X" * 200  # 200 characters to ensure we exceed limit
-                    logger.info(f"Message {i}: {large_msg}")
-                    handler.flush()  # Flush after each message
-
-                # Force handler to flush and close before checking files
-                handler.flush()
-                handler.close()
-                root_logger.removeHandler(handler)
-
-                # Check that backup files were created
-                # On Windows, wait a moment for file system to settle
-                import time
-
-                time.sleep(0.1)
-
-                log_files = list(Path(temp_dir).glob("entropy-playground.log*"))
-                # Should have at least the main log file
-                assert len(log_files) >= 1
-
-                # If rotation occurred, we should have backup files
-                # Check if the main log file exists and has been written to
-                main_log = Path(temp_dir) / "entropy-playground.log"
-                if main_log.exists() and main_log.stat().st_size > 0:
-                    # Rotation test passed if we have content
-                    assert True
-                else:
-                    # Otherwise we need backup files
-                    assert len(log_files) > 1
-            finally:
-                # Clean up all handlers to prevent Windows file locking
-                cleanup_logging_handlers()
+        try:
+            # Setup logging with small max bytes to trigger rotation
+            setup_logging(
+                log_dir=str(tmp_path),
+                enable_file_logging=True,
+            )
+
+            # Get the root logger and add our small rotation handler
+            from entropy_playground.logging.logger import setup_file_handler
+
+            handler = setup_file_handler(
+                tmp_path,
+                max_bytes=100,  # Very small to trigger rotation
+                backup_count=2,
+            )
+            root_logger = logging.getLogger()
+            root_logger.addHandler(handler)
+
+            # Write enough to trigger rotation
+            logger = get_logger("test")
+            # Write large messages to exceed 100 bytes limit
+            for i in range(5):
+                # Each message will be much larger than 100 bytes
+                large_msg = "X" * 200  # 200 characters to ensure we exceed limit
+                logger.info(f"Message {i}: {large_msg}")
+                handler.flush()  # Flush after each message
+
+            # Force handler to flush and close before checking files
+            handler.flush()
+            handler.close()
+            root_logger.removeHandler(handler)
+
+            # Check that backup files were created
+            # On Windows, wait a moment for file system to settle
+            import time
+
+            time.sleep(0.1)
+
+            log_files = list(tmp_path.glob("entropy-playground.log*"))
+            # Should have at least the main log file
+            assert len(log_files) >= 1
+
+            # If rotation occurred, we should have backup files
+            # Check if the main log file exists and has been written to
+            main_log = tmp_path / "entropy-playground.log"
+            if main_log.exists() and main_log.stat().st_size > 0:
+                # Rotation test passed if we have content
+                assert True
+            else:
+                # Otherwise we need backup files
+                assert len(log_files) > 1
+        finally:
+            # Clean up all handlers to prevent Windows file locking
+            cleanup_logging_handlers()
 
     def test_logger_with_context(self):
         """Test logger with bound context."""
@@ -176,6 +203,15 @@ class TestStructuredLogging:
             get_logger("test", agent_id="agent-123")
             mock_logger.bind.assert_called_with(agent_id="agent-123")
 
+    def test_get_logger_configures_once(self):
+        """Test get_logger does not reconfigure logging once it is set up."""
+        get_logger("test")
+
+        with patch("entropy_playground.logging.logger.setup_logging") as mock_setup:
+            get_logger("test")
+            get_logger("other", agent_id="agent-123")
+            mock_setup.assert_not_called()
+
     def test_log_context_manager(self):
         """Test LogContext context manager."""
         logger = get_logger("test")
@@ -192,6 +228,13 @@ class TestStructuredLogging:
         assert "timestamp" in result
         assert isinstance(result["timestamp"], str)
 
+        # The cached date prefix is refreshed when the second changes
+        with patch("entropy_playground.logging.logger.time.time") as mock_time:
+            mock_time.return_value = 1705363199.25  # 2024-01-15T23:59:59.25Z
+            assert add_timestamp(None, None, {})["timestamp"] == "2024-01-15T23:59:59.250000"
+            mock_time.return_value = 1705363200.5
+            assert add_timestamp(None, None, {})["timestamp"] == "2024-01-16T00:00:00.500000"
+
         # Test agent metadata processor
         event_dict = {
             "agent_id": "agent-123",
@@ -224,135 +267,268 @@ class TestAuditLogging:
         assert event.outcome == "success"
         assert event.metadata["version"] == "1.0"
 
-    def test_audit_logger_initialization(self):
+    def test_audit_logger_initialization(self, tmp_path):
         """Test audit logger initialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            AuditLogger(
-                log_dir=Path(temp_dir),
-                enable_file_logging=True,
-            )
+        audit_dir = tmp_path / "audit"
+        AuditLogger(
+            log_dir=audit_dir,
+            enable_file_logging=True,
+        )
 
-            # Verify audit directory was created
-            audit_dir = Path(temp_dir)
-            assert audit_dir.exists()
+        # Verify audit directory was created
+        assert audit_dir.exists()
 
-    def test_audit_logger_file_writing(self):
+    def test_audit_logger_file_writing(self, tmp_path):
         """Test writing audit events to file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            audit_logger = AuditLogger(log_dir=Path(temp_dir))
-
-            # Log an event
-            event = AuditEvent(
-                event_type=AuditEventType.GITHUB_PR_CREATED,
-                actor_id="agent-123",
-                actor_type="agent",
-                resource_type="pull_request",
-                resource_id="PR-456",
-                action="Created pull request",
-            )
-            audit_logger.log_event(event)
+        audit_logger = AuditLogger(log_dir=tmp_path)
 
-            # Verify file was created with correct name
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            audit_file = Path(temp_dir) / f"audit-{date_str}.jsonl"
-            assert audit_file.exists()
+        # Log an event
+        event = AuditEvent(
+            event_type=AuditEventType.GITHUB_PR_CREATED,
+            actor_id="agent-123",
+            actor_type="agent",
+            resource_type="pull_request",
+            resource_id="PR-456",
+            action="Created pull request",
+        )
+        audit_logger.log_event(event)
+        audit_logger.flush()
+
+        # Verify file was created with correct name
+        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+        audit_file = tmp_path / f"audit-{date_str}.jsonl"
+        assert audit_file.exists()
+
+        # Verify content
+        with open(audit_file) as f:
+            line = f.readline()
+            data = json.loads(line)
+            assert data["id"] == event.id
+            assert data["event_type"] == "github.pr.created"
+            assert data["actor_id"] == "agent-123"
+
+    def test_audit_logger_convenience_methods(self, tmp_path):
+        """Test audit logger convenience methods."""
+        audit_logger = AuditLogger(log_dir=tmp_path)
 
-            # Verify content
-            with open(audit_file) as f:
-                line = f.readline()
-                data = json.loads(line)
-                assert data["id"] == event.id
-                assert data["event_type"] == "github.pr.created"
-                assert data["actor_id"] == "agent-123"
+        # Test agent start
+        audit_logger.log_agent_start(
+            agent_id="agent-123",
+            agent_type="coder",
+            metadata={"version": "1.0"},
+        )
 
-    def test_audit_logger_convenience_methods(self):
-        """Test audit logger convenience methods."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            audit_logger = AuditLogger(log_dir=Path(temp_dir))
+        # Test GitHub operation
+        audit_logger.log_github_operation(
+            event_type=AuditEventType.GITHUB_ISSUE_READ,
+            actor_id="agent-123",
+            resource_type="issue",
+            resource_id="123",
+            action="Read issue #123",
+            metadata={"labels": ["bug", "urgent"]},
+        )
+
+        # Test task event
+        audit_logger.log_task_event(
+            event_type=AuditEventType.TASK_COMPLETED,
+            actor_id="agent-123",
+            task_id="task-456",
+            action="Completed code review task",
+            metadata={"duration": 300},
+        )
+        audit_logger.close()
+
+        # Verify all events were logged
+        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+        audit_file = tmp_path / f"audit-{date_str}.jsonl"
+        with open(audit_file) as f:
+            lines = f.readlines()
+            assert len(lines) == 3
 
-            # Test agent start
+    def test_audit_event_search(self, tmp_path):
+        """Test searching audit events."""
+        audit_logger = AuditLogger(log_dir=tmp_path)
+
+        # Log various events
+        for i in range(5):
             audit_logger.log_agent_start(
-                agent_id="agent-123",
+                agent_id=f"agent-{i}",
                 agent_type="coder",
-                metadata={"version": "1.0"},
             )
 
-            # Test GitHub operation
-            audit_logger.log_github_operation(
-                event_type=AuditEventType.GITHUB_ISSUE_READ,
-                actor_id="agent-123",
-                resource_type="issue",
-                resource_id="123",
-                action="Read issue #123",
-                metadata={"labels": ["bug", "urgent"]},
-            )
+        audit_logger.log_github_operation(
+            event_type=AuditEventType.GITHUB_PR_CREATED,
+            actor_id="agent-0",
+            resource_type="pull_request",
+            resource_id="PR-123",
+            action="Created PR",
+            outcome="failure",
+            error_details="Permission denied",
+        )
 
-            # Test task event
-            audit_logger.log_task_event(
-                event_type=AuditEventType.TASK_COMPLETED,
-                actor_id="agent-123",
-                task_id="task-456",
-                action="Completed code review task",
-                metadata={"duration": 300},
-            )
+        # Search by event type
+        events = audit_logger.search_events(event_type=AuditEventType.AGENT_STARTED)
+        assert len(events) == 5
+
+        # Search by actor
+        events = audit_logger.search_events(actor_id="agent-0")
+        assert len(events) == 2
+
+        # Search by outcome
+        events = audit_logger.search_events(outcome="failure")
+        assert len(events) == 1
+        assert events[0].error_details == "Permission denied"
+        # Stored events are read back with their declared field types
+        assert events[0].event_type is AuditEventType.GITHUB_PR_CREATED
+        assert isinstance(events[0].timestamp, datetime)
+
+        # Later searches only index events appended since the last one
+        audit_logger.log_agent_stop(agent_id="agent-0", agent_type="coder")
+        events = audit_logger.search_events(actor_id="agent-0", outcome="success")
+        assert [e.event_type for e in events] == ["agent.started", "agent.stopped"]
+        index = audit_logger._indexes[audit_logger.current_log_file]
+        assert len(index.events) == 7
+
+    def test_audit_event_search_returns_copies(self, tmp_path):
+        """Test modifying a search result does not affect later searches."""
+        audit_logger = AuditLogger(log_dir=tmp_path)
+        audit_logger.log_agent_start("agent-1", "coder", metadata={"version": "1.0"})
 
-            # Verify all events were logged
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            audit_file = Path(temp_dir) / f"audit-{date_str}.jsonl"
-            with open(audit_file) as f:
-                lines = f.readlines()
-                assert len(lines) == 3
+        first = audit_logger.search_events(actor_id="agent-1")[0]
+        first.outcome = "failure"
+        first.metadata["version"] = "2.0"
 
-    def test_audit_event_search(self):
-        """Test searching audit events."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            audit_logger = AuditLogger(log_dir=Path(temp_dir))
+        second = audit_logger.search_events(actor_id="agent-1")[0]
+        assert second is not first
+        assert second.outcome == "success"
+        assert second.metadata == {"version": "1.0"}
+        assert audit_logger.search_events(outcome="failure") == []
+        audit_logger.close()
+
+    def test_audit_event_serialization_fallback(self, tmp_path):
+        """Test metadata orjson cannot encode is serialized by pydantic."""
+        audit_logger = AuditLogger(log_dir=tmp_path)
+
+        audit_logger.log_agent_start("agent-1", "coder", metadata={"paths": {Path("a")}})
+        events = audit_logger.search_events()
+
+        assert events[0].event_type == "agent.started"
+        assert events[0].metadata == {"paths": ["a"]}
+        audit_logger.close()
+
+    def test_audit_logger_batches_writes(self, tmp_path):
+        """Test events are held in memory until the buffer is flushed."""
+        audit_logger = AuditLogger(log_dir=tmp_path, flush_interval=60)
+
+        for i in range(3):
+            audit_logger.log_agent_start(agent_id=f"agent-{i}", agent_type="coder")
+        assert not audit_logger.current_log_file.exists()
+
+        audit_logger.flush()
+        assert len(audit_logger.current_log_file.read_bytes().splitlines()) == 3
+
+        # Without a buffer every event is written straight away
+        audit_logger.buffer_size = 0
+        audit_logger.log_agent_start(agent_id="agent-3", agent_type="coder")
+        assert len(audit_logger.current_log_file.read_bytes().splitlines()) == 4
+
+        audit_logger.close()
+
+    def test_audit_logger_flushes_on_timer(self, tmp_path):
+        """Test buffered events are written once flush_interval passes."""
+        audit_logger = AuditLogger(log_dir=tmp_path, flush_interval=0.05)
+
+        audit_logger.log_agent_start(agent_id="agent-1", agent_type="coder")
+        deadline = time.monotonic() + 5
+        while not audit_logger.current_log_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(audit_logger.current_log_file.read_bytes().splitlines()) == 1
+        audit_logger.close()
+
+    def test_audit_loggers_flushed_at_exit(self, tmp_path):
+        """Test the exit hook writes events still in the buffer."""
+        audit_logger = AuditLogger(log_dir=tmp_path, flush_interval=60)
+        audit_logger.log_agent_start(agent_id="agent-1", agent_type="coder")
+
+        audit._flush_open_loggers()
+
+        assert len(audit_logger.current_log_file.read_bytes().splitlines()) == 1
+        audit_logger.close()
+
+    def test_audit_log_file_path_rotates_daily(self, tmp_path):
+        """Test the cached log file path changes at UTC midnight."""
+        audit_logger = AuditLogger(log_dir=tmp_path)
+
+        with patch("entropy_playground.logging.audit.time.time") as mock_time:
+            mock_time.return_value = 1705363199.0  # 2024-01-15T23:59:59Z
+            assert audit_logger._get_log_file_path().name == "audit-2024-01-15.jsonl"
+
+            mock_time.return_value = 1705363200.0  # 2024-01-16T00:00:00Z
+            assert audit_logger._get_log_file_path().name == "audit-2024-01-16.jsonl"
+
+    def test_audit_logger_direct_io(self, tmp_path):
+        """Test O_DIRECT audit writes remain readable as JSONL."""
+        audit_logger = AuditLogger(log_dir=tmp_path, direct_io=True)
+
+        for i in range(50):
+            audit_logger.log_agent_start(agent_id=f"agent-{i}", agent_type="coder")
+        audit_logger.flush()
+
+        # Either O_DIRECT padded the file to whole blocks or we fell back
+        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+        audit_file = tmp_path / f"audit-{date_str}.jsonl"
+        if audit_logger.direct_io:
+            assert audit_file.stat().st_size % 4096 == 0
 
-            # Log various events
-            for i in range(5):
-                audit_logger.log_agent_start(
-                    agent_id=f"agent-{i}",
-                    agent_type="coder",
-                )
-
-            audit_logger.log_github_operation(
-                event_type=AuditEventType.GITHUB_PR_CREATED,
-                actor_id="agent-0",
-                resource_type="pull_request",
-                resource_id="PR-123",
-                action="Created PR",
-                outcome="failure",
-                error_details="Permission denied",
-            )
+        events = audit_logger.search_events(event_type=AuditEventType.AGENT_STARTED)
+        assert [e.actor_id for e in events] == [f"agent-{i}" for i in range(50)]
+
+        audit_logger.close()
 
-            # Search by event type
-            events = audit_logger.search_events(event_type=AuditEventType.AGENT_STARTED)
-            assert len(events) == 5
+    def test_audit_logger_direct_io_rejected_mid_event(self, tmp_path):
+        """Test an event larger than the O_DIRECT buffer survives a failed write."""
+        audit_logger = AuditLogger(log_dir=tmp_path, direct_io=True, buffer_size=0)
+        if not audit_logger.direct_io:
+            pytest.skip("O_DIRECT is not available on this platform")
 
-            # Search by actor
-            events = audit_logger.search_events(actor_id="agent-0")
-            assert len(events) == 2
+        real_open = os.open
 
-            # Search by outcome
-            events = audit_logger.search_events(outcome="failure")
-            assert len(events) == 1
-            assert events[0].error_details == "Permission denied"
+        def open_without_direct(path, flags, mode=0o777):
+            return real_open(path, flags & ~os.O_DIRECT, mode)
 
-    def test_global_audit_logger(self):
+        payload = "x" * (DIRECT_IO_BUFFER_SIZE + 1000)
+        with (
+            patch("entropy_playground.logging.audit.os.open", side_effect=open_without_direct),
+            patch(
+                "entropy_playground.logging.audit.os.write",
+                side_effect=OSError(errno.EINVAL, "Invalid argument"),
+            ),
+        ):
+            audit_logger.log_agent_start("agent-big", "coder", metadata={"payload": payload})
+
+        assert audit_logger.direct_io is False
+        events = audit_logger.search_events(actor_id="agent-big")
+        assert len(events) == 1
+        assert events[0].metadata["payload"] == payload
+
+        audit_logger.close()
+
+    def test_global_audit_logger(self, tmp_path):
         """Test global audit logger functions."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            configure_audit_logger(log_dir=Path(temp_dir))
+        configure_audit_logger(log_dir=tmp_path)
 
-            logger = get_audit_logger()
-            assert logger is not None
+        logger = get_audit_logger()
+        assert logger is not None
 
-            # Log an event
-            logger.log_agent_start("agent-123", "coder")
+        # Log an event
+        logger.log_agent_start("agent-123", "coder")
+        logger.flush()
 
-            # Verify it was logged
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
-            audit_file = Path(temp_dir) / f"audit-{date_str}.jsonl"
-            assert audit_file.exists()
+        # Verify it was logged
+        date_str = datetime.utcnow().strftime("%Y-%m-%d")
+        audit_file = tmp_path / f"audit-{date_str}.jsonl"
+        assert audit_file.exists()
 
 
 class TestLogAggregation:
@@ -381,141 +557,346 @@ class TestLogAggregation:
         assert entry.agent_id == "agent-123"
         assert entry.agent_type == "coder"
         assert entry.metadata["custom_field"] == "value"
-
-    def test_log_aggregator_search(self):
+        assert json.loads(entry.raw) == json_data
+
+    def test_query_prefilter(self):
+        """Test the raw-line prefilter only rejects lines that cannot match."""
+        line = json.dumps(
+            {"level": "ERROR", "logger_name": "agent.coder", "event": "Review Failed"}
+        ).encode()
+
+        assert LogQuery().prefilter() is None
+        # Missing levels and components default to values these would match
+        assert LogQuery(level="info", component="unknown").prefilter() is None
+        # Quotes may be escaped in the JSON, so they are not prefiltered
+        assert LogQuery(message_contains='say "hi"').prefilter() is None
+
+        assert LogQuery(level="error", message_contains="review failed").prefilter().match(line)
+        assert LogQuery(component="coder").prefilter().match(line)
+        assert not LogQuery(component="CODER").prefilter().match(line)
+        assert not LogQuery(level="ERROR", agent_id="agent-1").prefilter().match(line)
+
+    def test_log_aggregator_search(self, tmp_path):
         """Test searching logs with aggregator."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            log_file = log_dir / "test.log"
+        log_dir = tmp_path
+        log_file = log_dir / "test.log"
 
-            # Write test logs
-            logs = [
-                {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "level": "INFO",
-                    "logger_name": "agent.coder",
-                    "event": "Starting task",
-                    "agent": {"id": "agent-1"},
-                },
-                {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "level": "ERROR",
-                    "logger_name": "agent.reviewer",
-                    "event": "Review failed",
-                    "agent": {"id": "agent-2"},
-                },
-                {
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "level": "INFO",
-                    "logger_name": "agent.coder",
-                    "event": "Task completed",
-                    "agent": {"id": "agent-1"},
-                },
-            ]
-
-            with open(log_file, "w") as f:
-                for log in logs:
-                    f.write(json.dumps(log) + "\n")
+        # Write test logs
+        logs = [
+            {
+                "timestamp": datetime.utcnow().isoformat(),
+                "level": "INFO",
+                "logger_name": "agent.coder",
+                "event": "Starting task",
+                "agent": {"id": "agent-1"},
+            },
+            {
+                "timestamp": datetime.utcnow().isoformat(),
+                "level": "ERROR",
+                "logger_name": "agent.reviewer",
+                "event": "Review failed",
+                "agent": {"id": "agent-2"},
+            },
+            {
+                "timestamp": datetime.utcnow().isoformat(),
+                "level": "INFO",
+                "logger_name": "agent.coder",
+                "event": "Task completed",
+                "agent": {"id": "agent-1"},
+            },
+        ]
+
+        with open(log_file, "w") as f:
+            for log in logs:
+                f.write(json.dumps(log) + "\n")
+
+        aggregator = LogAggregator([log_dir])
 
-            aggregator = LogAggregator([log_dir])
+        # Search by level
+        query = LogQuery(level="ERROR")
+        results = aggregator.search(query)
+        assert len(results) == 1
+        assert results[0].message == "Review failed"
 
-            # Search by level
-            query = LogQuery(level="ERROR")
-            results = aggregator.search(query)
-            assert len(results) == 1
-            assert results[0].message == "Review failed"
+        # Search by component
+        query = LogQuery(component="coder")
+        results = aggregator.search(query)
+        assert len(results) == 2
 
-            # Search by component
-            query = LogQuery(component="coder")
-            results = aggregator.search(query)
-            assert len(results) == 2
+        # Search by message content
+        query = LogQuery(message_contains="task")
+        results = aggregator.search(query)
+        assert len(results) == 2
 
-            # Search by message content
-            query = LogQuery(message_contains="task")
-            results = aggregator.search(query)
-            assert len(results) == 2
+    def test_log_file_discovery(self, tmp_path):
+        """Test only visible regular files matching *.log* are read."""
+        log_dir = tmp_path
+        for name in ("b.log", "a.log.1", ".hidden.log", "notes.txt"):
+            (log_dir / name).touch()
+        (log_dir / "archive.log.d").mkdir()
 
-    def test_log_aggregation_by_level(self):
+        aggregator = LogAggregator([log_dir, log_dir / "missing"])
+        (log_dir / "missing").rmdir()
+
+        files = list(aggregator._log_files(datetime(2000, 1, 1)))
+        assert [f.name for f in files] == ["a.log.1", "b.log"]
+
+    def test_log_aggregation_by_level(self, tmp_path):
         """Test aggregating logs by level."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            log_file = log_dir / "test.log"
-
-            # Write logs with different levels
-            levels = ["INFO", "INFO", "WARNING", "ERROR", "INFO", "ERROR"]
-            with open(log_file, "w") as f:
-                for level in levels:
+        log_dir = tmp_path
+        log_file = log_dir / "test.log"
+
+        # Write logs with different levels
+        levels = ["INFO", "INFO", "WARNING", "ERROR", "INFO", "ERROR"]
+        with open(log_file, "w") as f:
+            for level in levels:
+                log = {
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "level": level,
+                    "logger_name": "test",
+                    "event": f"{level} message",
+                }
+                f.write(json.dumps(log) + "\n")
+
+        aggregator = LogAggregator([log_dir])
+        stats = aggregator.aggregate_by_level()
+
+        assert stats["INFO"] == 3
+        assert stats["WARNING"] == 1
+        assert stats["ERROR"] == 2
+        assert aggregator.aggregate_by_level_fast() == stats
+
+        # Matches split across read chunks are still counted
+        with patch("entropy_playground.logging.aggregator._SCAN_CHUNK_SIZE", 7):
+            assert aggregator.aggregate_by_level_fast() == stats
+
+    def test_log_aggregation_by_agent(self, tmp_path):
+        """Test aggregating logs by agent."""
+        log_dir = tmp_path
+        log_file = log_dir / "test.log"
+
+        # Write logs from different agents
+        with open(log_file, "w") as f:
+            for i in range(3):
+                for level in ["INFO", "ERROR"]:
                     log = {
                         "timestamp": datetime.utcnow().isoformat(),
                         "level": level,
                         "logger_name": "test",
-                        "event": f"{level} message",
+                        "event": f"Message from agent-{i}",
+                        "agent": {"id": f"agent-{i}"},
                     }
                     f.write(json.dumps(log) + "\n")
 
-            aggregator = LogAggregator([log_dir])
-            stats = aggregator.aggregate_by_level()
+        aggregator = LogAggregator([log_dir])
+        stats = aggregator.aggregate_by_agent()
 
-            assert stats["INFO"] == 3
-            assert stats["WARNING"] == 1
-            assert stats["ERROR"] == 2
+        assert len(stats) == 3
+        assert stats["agent-0"]["INFO"] == 1
+        assert stats["agent-0"]["ERROR"] == 1
 
-    def test_log_aggregation_by_agent(self):
-        """Test aggregating logs by agent."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            log_file = log_dir / "test.log"
-
-            # Write logs from different agents
-            with open(log_file, "w") as f:
-                for i in range(3):
-                    for level in ["INFO", "ERROR"]:
-                        log = {
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "level": level,
-                            "logger_name": "test",
-                            "event": f"Message from agent-{i}",
-                            "agent": {"id": f"agent-{i}"},
-                        }
-                        f.write(json.dumps(log) + "\n")
-
-            aggregator = LogAggregator([log_dir])
-            stats = aggregator.aggregate_by_agent()
-
-            assert len(stats) == 3
-            assert stats["agent-0"]["INFO"] == 1
-            assert stats["agent-0"]["ERROR"] == 1
-
-    def test_convenience_functions(self):
-        """Test convenience search functions."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_dir = Path(temp_dir)
-            log_file = log_dir / "test.log"
+    def test_parallel_aggregation(self, tmp_path):
+        """Test worker processes produce the same counts as a serial scan."""
+        for i in range(3):
+            with open(tmp_path / f"agent-{i}.log", "w") as f:
+                for level in ["INFO", "ERROR", "ERROR"]:
+                    log = {
+                        "timestamp": datetime.utcnow().isoformat(),
+                        "level": level,
+                        "logger_name": f"agent.{i}",
+                        "event": "message",
+                        "agent": {"id": f"agent-{i}"},
+                    }
+                    f.write(json.dumps(log) + "\n")
 
-            # Write a test log
-            log = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "level": "ERROR",
-                "logger_name": "test.component",
-                "event": "Test error message",
+        serial = LogAggregator([tmp_path])
+        parallel = LogAggregator([tmp_path], max_workers=2)
+
+        assert (
+            parallel.aggregate_by_level()
+            == serial.aggregate_by_level()
+            == {
+                "INFO": 3,
+                "ERROR": 6,
             }
-            with open(log_file, "w") as f:
-                f.write(json.dumps(log) + "\n")
+        )
+        assert parallel.aggregate_by_component() == serial.aggregate_by_component()
+        assert parallel.aggregate_by_agent() == serial.aggregate_by_agent()
+
+    def test_worker_logging_reset(self, tmp_path):
+        """Test worker processes log to the console, not the parent's file handler."""
+        setup_logging(level="DEBUG", log_dir=str(tmp_path))
+        inherited = logging.getLogger().handlers[:]
+
+        _init_worker()
 
-            # Patch the default log directory
-            with patch("entropy_playground.logging.aggregator.LogAggregator") as mock_agg:
-                mock_instance = LogAggregator([log_dir])
-                mock_agg.return_value = mock_instance
-
-                # Test search_logs
-                results = search_logs(
-                    message_contains="error",
-                    level="ERROR",
-                )
-                assert len(results) > 0
-
-                # Test get_log_stats
-                stats = get_log_stats(hours=1)
-                assert "by_level" in stats
-                assert "by_component" in stats
-                assert "recent_errors" in stats
+        handlers = logging.getLogger().handlers
+        assert not set(handlers) & set(inherited)
+        assert [type(handler) for handler in handlers] == [logging.StreamHandler]
+        assert logging.getLogger().level == logging.DEBUG
+        for handler in inherited:
+            handler.close()
+
+    def test_convenience_functions(self, tmp_path):
+        """Test convenience search functions."""
+        log_dir = tmp_path
+        log_file = log_dir / "test.log"
+
+        # Write a test log
+        log = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "level": "ERROR",
+            "logger_name": "test.component",
+            "event": "Test error message",
+        }
+        with open(log_file, "w") as f:
+            f.write(json.dumps(log) + "\n")
+
+        # Patch the default log directory
+        with patch("entropy_playground.logging.aggregator.LogAggregator") as mock_agg:
+            mock_instance = LogAggregator([log_dir])
+            mock_agg.return_value = mock_instance
+
+            # Test search_logs
+            results = search_logs(
+                message_contains="error",
+                level="ERROR",
+            )
+            assert len(results) > 0
+
+            # Test get_log_stats
+            stats = get_log_stats(hours=1)
+            assert "by_level" in stats
+            assert "by_component" in stats
+            assert "recent_errors" in stats
+
+
+class StubLogsClient:
+    """In-memory stand-in for the boto3 CloudWatch Logs client."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.errors: list[Exception] = []
+
+    def create_log_group(self, **kwargs):
+        pass
+
+    def create_log_stream(self, **kwargs):
+        pass
+
+    def put_log_events(self, **kwargs):
+        time.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.calls.append(kwargs)
+        return {"nextSequenceToken": f"token-{len(self.calls)}"}
+
+    def sent_messages(self) -> list[str]:
+        return [json.loads(e["message"])["message"] for c in self.calls for e in c["logEvents"]]
+
+
+class FakeClientError(Exception):
+    """botocore ClientError stand-in carrying an error response."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+@pytest.fixture
+def logs_client(monkeypatch):
+    """Route CloudWatchHandler to a stub client instead of boto3."""
+    client = StubLogsClient()
+    monkeypatch.setattr(cloudwatch, "HAS_BOTO3", True)
+    monkeypatch.setattr(cloudwatch, "boto3", Mock(client=Mock(return_value=client)))
+    monkeypatch.setattr(cloudwatch, "ClientError", FakeClientError)
+    return client
+
+
+class TestCloudWatchHandler:
+    """Test the CloudWatch handler's background sender."""
+
+    def test_concurrent_flushes_wait_for_own_records(self, logs_client):
+        """Test each flush returns only after its caller's records are sent."""
+        logs_client.delay = 0.01
+        handler = cloudwatch.CloudWatchHandler("group", "stream", flush_interval=60, buffer_size=10)
+        missing: list[str] = []
+
+        def emit_and_flush(worker: int) -> None:
+            messages = [f"worker-{worker}-{i}" for i in range(25)]
+            for message in messages:
+                handler.emit({"message": message})
+            if not handler.flush(timeout=10):
+                missing.append(f"worker-{worker} flush timed out")
+            sent = set(logs_client.sent_messages())
+            missing.extend(m for m in messages if m not in sent)
+
+        threads = [threading.Thread(target=emit_and_flush, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        handler.close()
+
+        assert missing == []
+
+    def test_flush_after_emit(self, logs_client):
+        """Test flush delivers a record emitted just before it."""
+        handler = cloudwatch.CloudWatchHandler("group", "stream", flush_interval=60)
+
+        handler.emit({"message": "hello"})
+        assert handler.flush()
+        assert logs_client.sent_messages() == ["hello"]
+        assert logs_client.calls[0]["logGroupName"] == "group"
+        assert logs_client.calls[0]["logStreamName"] == "stream"
+        handler.close()
+
+    def test_batches_sent_in_order(self, logs_client):
+        """Test records are split into buffer-sized batches in emit order."""
+        handler = cloudwatch.CloudWatchHandler("group", "stream", flush_interval=60, buffer_size=10)
+
+        messages = [f"message-{i}" for i in range(35)]
+        for message in messages:
+            handler.emit({"message": message})
+        assert handler.flush()
+        handler.close()
+
+        assert logs_client.sent_messages() == messages
+        assert all(len(call["logEvents"]) <= 10 for call in logs_client.calls)
+        for call in logs_client.calls:
+            timestamps = [event["timestamp"] for event in call["logEvents"]]
+            assert timestamps == sorted(timestamps)
+
+    def test_sequence_tokens(self, logs_client):
+        """Test each put carries the token returned by the previous one."""
+        handler = cloudwatch.CloudWatchHandler("group", "stream", flush_interval=60)
+
+        handler.emit({"message": "first"})
+        assert handler.flush()
+        # A stale token is corrected from the error message and retried
+        logs_client.errors.append(
+            FakeClientError("InvalidSequenceTokenException", "expected token is: token-9")
+        )
+        handler.emit({"message": "second"})
+        assert handler.flush()
+        handler.close()
+
+        assert "sequenceToken" not in logs_client.calls[0]
+        assert logs_client.calls[1]["sequenceToken"] == "token-9"
+        assert handler.sequence_token == "token-2"
+        assert logs_client.sent_messages() == ["first", "second"]
+
+    def test_close_drains_queue(self, logs_client):
+        """Test closing sends every queued record without waiting for a timer."""
+        handler = cloudwatch.CloudWatchHandler("group", "stream", flush_interval=60, buffer_size=10)
+
+        messages = [f"message-{i}" for i in range(25)]
+        for message in messages:
+            handler.emit({"message": message})
+        started = time.monotonic()
+        handler.close()
+
+        assert time.monotonic() - started < 2
+        assert not handler.worker_thread.is_alive()
+        assert logs_client.sent_messages() == messages